@@ -4,16 +4,27 @@ Loads settings from environment variables using python-dotenv.
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Mapping
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
+
+
+@lru_cache(maxsize=1)
+def _env() -> Mapping[str, str]:
+    """Parse .env once (only if it exists) and return the process environment."""
+    if env_path.exists():
+        load_dotenv(dotenv_path=env_path)
+    return os.environ
+
 
 # Binance Testnet API Configuration
-BINANCE_TESTNET_API_KEY = os.getenv('BINANCE_TESTNET_API_KEY', '')
-BINANCE_TESTNET_API_SECRET = os.getenv('BINANCE_TESTNET_API_SECRET', '')
+BINANCE_TESTNET_API_KEY = _env().get('BINANCE_TESTNET_API_KEY', '')
+BINANCE_TESTNET_API_SECRET = _env().get('BINANCE_TESTNET_API_SECRET', '')
 BINANCE_TESTNET_BASE_URL = 'https://testnet.binance.vision'
 BINANCE_TESTNET_FUTURES_URL = 'https://testnet.binancefuture.com'
 
@@ -24,26 +35,29 @@ BINANCE_PUBLIC_API_URL = 'https://api.binance.com'
 BINANCE_API_BASE_URL = BINANCE_PUBLIC_API_URL  # For klines/market data
 BINANCE_TRADING_URL = BINANCE_TESTNET_BASE_URL  # For order execution
 
+# Public market data stream (closed klines are pushed instead of polled)
+BINANCE_WS_URL = 'wss://stream.binance.com:9443'
+
 # Trading Configuration
-SYMBOL = os.getenv('SYMBOL', 'BTCUSDT')
-TRADE_QUANTITY = float(os.getenv('TRADE_QUANTITY', '0.001'))
+SYMBOL = _env().get('SYMBOL', 'BTCUSDT')
+TRADE_QUANTITY = float(_env().get('TRADE_QUANTITY', '0.001'))
 
 # Timeframe Configuration
-TIMEFRAME_ENTRY = os.getenv('TIMEFRAME_ENTRY', '5m')
-TIMEFRAME_CONFIRMATION = os.getenv('TIMEFRAME_CONFIRMATION', '15m')
+TIMEFRAME_ENTRY = _env().get('TIMEFRAME_ENTRY', '5m')
+TIMEFRAME_CONFIRMATION = _env().get('TIMEFRAME_CONFIRMATION', '15m')
 
 # Strategy Parameters - Entry timeframe (e.g., 5m)
-EMA_FAST_ENTRY = int(os.getenv('EMA_FAST_ENTRY', '8'))
-EMA_SLOW_ENTRY = int(os.getenv('EMA_SLOW_ENTRY', '21'))
+EMA_FAST_ENTRY = int(_env().get('EMA_FAST_ENTRY', '8'))
+EMA_SLOW_ENTRY = int(_env().get('EMA_SLOW_ENTRY', '21'))
 
 # Strategy Parameters - Confirmation timeframe (e.g., 15m)
-EMA_FAST_CONFIRMATION = int(os.getenv('EMA_FAST_CONFIRMATION', '50'))
-EMA_SLOW_CONFIRMATION = int(os.getenv('EMA_SLOW_CONFIRMATION', '200'))
+EMA_FAST_CONFIRMATION = int(_env().get('EMA_FAST_CONFIRMATION', '50'))
+EMA_SLOW_CONFIRMATION = int(_env().get('EMA_SLOW_CONFIRMATION', '200'))
 
 # Position Management
-POSITION_TIMEOUT_BARS = int(os.getenv('POSITION_TIMEOUT_BARS', '96'))
-STOP_LOSS_PCT = float(os.getenv('STOP_LOSS_PCT', '0.02'))  # 2%
-TAKE_PROFIT_PCT = float(os.getenv('TAKE_PROFIT_PCT', '0.04'))  # 4%
+POSITION_TIMEOUT_BARS = int(_env().get('POSITION_TIMEOUT_BARS', '96'))
+STOP_LOSS_PCT = float(_env().get('STOP_LOSS_PCT', '0.02'))  # 2%
+TAKE_PROFIT_PCT = float(_env().get('TAKE_PROFIT_PCT', '0.04'))  # 4%
 
 # Data paths
 DATA_DIR = Path(__file__).parent.parent / 'data'
@@ -62,4 +76,67 @@ BACKTEST_COMMISSION = 0.001  # 0.1%
 
 # Live Trading Configuration
 LIVE_POLL_INTERVAL_SECONDS = 60  # Poll every minute
-LIVE_WARMUP_BARS = int(os.getenv('LIVE_WARMUP_BARS', '250'))  # Bars for each timeframe
+LIVE_USE_WEBSOCKET = _env().get('LIVE_USE_WEBSOCKET', 'true').lower() == 'true'  # REST polling if false
+LIVE_WARMUP_BARS = int(_env().get('LIVE_WARMUP_BARS', '250'))  # Bars for each timeframe
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Immutable snapshot of the settings above.
+    
+    Frozen + slotted for cheap attribute reads; picklable, so a parameter sweep can
+    hand dataclasses.replace(CFG, ...) variants to worker processes.
+    """
+    BINANCE_API_BASE_URL: str
+    BINANCE_TRADING_URL: str
+    BINANCE_WS_URL: str
+    SYMBOL: str
+    TRADE_QUANTITY: float
+    TIMEFRAME_ENTRY: str
+    TIMEFRAME_CONFIRMATION: str
+    EMA_FAST_ENTRY: int
+    EMA_SLOW_ENTRY: int
+    EMA_FAST_CONFIRMATION: int
+    EMA_SLOW_CONFIRMATION: int
+    POSITION_TIMEOUT_BARS: int
+    STOP_LOSS_PCT: float
+    TAKE_PROFIT_PCT: float
+    DATA_DIR: Path
+    BACKTEST_TRADES_PATH: Path
+    LIVE_TRADES_PATH: Path
+    BACKTEST_START_DATE: str
+    BACKTEST_END_DATE: str
+    BACKTEST_INITIAL_CASH: float
+    BACKTEST_COMMISSION: float
+    LIVE_POLL_INTERVAL_SECONDS: int
+    LIVE_USE_WEBSOCKET: bool
+    LIVE_WARMUP_BARS: int
+
+
+CFG = Config(
+    BINANCE_API_BASE_URL=BINANCE_API_BASE_URL,
+    BINANCE_TRADING_URL=BINANCE_TRADING_URL,
+    BINANCE_WS_URL=BINANCE_WS_URL,
+    SYMBOL=SYMBOL,
+    TRADE_QUANTITY=TRADE_QUANTITY,
+    TIMEFRAME_ENTRY=TIMEFRAME_ENTRY,
+    TIMEFRAME_CONFIRMATION=TIMEFRAME_CONFIRMATION,
+    EMA_FAST_ENTRY=EMA_FAST_ENTRY,
+    EMA_SLOW_ENTRY=EMA_SLOW_ENTRY,
+    EMA_FAST_CONFIRMATION=EMA_FAST_CONFIRMATION,
+    EMA_SLOW_CONFIRMATION=EMA_SLOW_CONFIRMATION,
+    POSITION_TIMEOUT_BARS=POSITION_TIMEOUT_BARS,
+    STOP_LOSS_PCT=STOP_LOSS_PCT,
+    TAKE_PROFIT_PCT=TAKE_PROFIT_PCT,
+    DATA_DIR=DATA_DIR,
+    BACKTEST_TRADES_PATH=BACKTEST_TRADES_PATH,
+    LIVE_TRADES_PATH=LIVE_TRADES_PATH,
+    BACKTEST_START_DATE=BACKTEST_START_DATE,
+    BACKTEST_END_DATE=BACKTEST_END_DATE,
+    BACKTEST_INITIAL_CASH=BACKTEST_INITIAL_CASH,
+    BACKTEST_COMMISSION=BACKTEST_COMMISSION,
+    LIVE_POLL_INTERVAL_SECONDS=LIVE_POLL_INTERVAL_SECONDS,
+    LIVE_USE_WEBSOCKET=LIVE_USE_WEBSOCKET,
+    LIVE_WARMUP_BARS=LIVE_WARMUP_BARS,
+)
@@ -8,34 +8,101 @@ CRITICAL: Deterministic execution guaranteed via seed setting.
 import sys
 import os
 import random
-from datetime import datetime, timedelta
-from typing import Optional
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Tuple
 
 import numpy as np
+import orjson
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Set seeds FIRST for deterministic behavior
 RANDOM_SEED = 42
 random.seed(RANDOM_SEED)
 np.random.seed(RANDOM_SEED)
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Project root on sys.path only when run as a script (python src/...); imports as a module are untouched
+if not __package__:
+    _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if _PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, _PROJECT_ROOT)
 
 from backtesting import Backtest
 
-from src.execution.executor_backtest import BacktestStrategyWrapper
+from src.execution.executor_backtest import BacktestStrategyWrapper, conf_index_for_entry
 from src.utils.logger import get_logger
-from src.utils.csv_writer import CSVWriter
-from config.config import (
-    SYMBOL, BACKTEST_TRADES_PATH, BACKTEST_INITIAL_CASH,
-    BACKTEST_COMMISSION, BINANCE_API_BASE_URL,
-    BACKTEST_START_DATE, BACKTEST_END_DATE,
-    TIMEFRAME_ENTRY, TIMEFRAME_CONFIRMATION
-)
+from config.config import CFG
 
 logger = get_logger(__name__)
 
+# Shared HTTP session - keeps TLS connections to Binance alive across kline pages
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+# Compressed responses (urllib3 decodes br when the brotli package is installed)
+_SESSION.headers.update({'Accept-Encoding': 'gzip, br', 'User-Agent': 'numatix-quant/1.0'})
+
+# Kline interval lengths in milliseconds (used to split a date range into pages up front)
+_INTERVAL_MS = {
+    '1m': 60_000,
+    '3m': 180_000,
+    '5m': 300_000,
+    '15m': 900_000,
+    '30m': 1_800_000,
+    '1h': 3_600_000,
+    '2h': 7_200_000,
+    '4h': 14_400_000,
+    '6h': 21_600_000,
+    '8h': 28_800_000,
+    '12h': 43_200_000,
+    '1d': 86_400_000,
+}
+
+# Concurrent page requests (kept below the session pool size)
+_FETCH_WORKERS = 8
+
+# Progress and request weight are checked every N pages rather than on every page
+_PROGRESS_EVERY_PAGES = 10
+
+# Warn when the 1-minute request weight approaches Binance's limit (6000)
+_WEIGHT_WARN_1M = 5000
+
+
+def bars_expected(interval: str, start_ms: int, end_ms: int) -> int:
+    """
+    Upper bound on the number of klines whose open time falls in [start_ms, end_ms].
+    
+    Args:
+        interval: Kline interval (e.g., '15m', '1h')
+        start_ms: Range start (epoch ms)
+        end_ms: Range end (epoch ms, inclusive)
+    
+    Returns:
+        Maximum bar count for the range
+    """
+    return (end_ms - start_ms) // _INTERVAL_MS[interval] + 1
+
+
+def _fetch_klines_page(url: str, params: dict) -> Tuple[requests.Response, Optional[list]]:
+    """
+    Fetch a single page of klines.
+    
+    Returns the response and its parsed klines (None when the status is not 200).
+    Raises requests.RequestException or orjson.JSONDecodeError on failure.
+    """
+    response = _SESSION.get(url, params=params, timeout=30)
+    if response.status_code != 200:
+        return response, None
+    return response, orjson.loads(response.content)
+
 
 def fetch_binance_klines(
     symbol: str,
@@ -57,71 +124,129 @@ def fetch_binance_klines(
     Returns:
         DataFrame with OHLCV data
     """
-    url = f"{BINANCE_API_BASE_URL}/api/v3/klines"
+    url = f"{CFG.BINANCE_API_BASE_URL}/api/v3/klines"
     
-    all_klines = []
-    current_start = int(start_time.timestamp() * 1000)
+    interval_ms = _INTERVAL_MS.get(interval)
+    if interval_ms is None:
+        logger.error(f"Unsupported kline interval: {interval}")
+        return pd.DataFrame()
+    
+    start_ms = int(start_time.timestamp() * 1000)
     end_ms = int(end_time.timestamp() * 1000)
     
-    while current_start < end_ms:
-        params = {
+    # Bar count is bounded by the range, so pages are decoded straight into typed buffers
+    n_max = bars_expected(interval, start_ms, end_ms)
+    ts_buf = np.empty(n_max, dtype=np.int64)
+    ohlcv_buf = np.empty((n_max, 5), dtype=np.float64)
+    n_bars = 0
+    
+    # Every page window is known up front, so all pages are requested concurrently
+    page_ms = limit * interval_ms
+    pages = [
+        {
             'symbol': symbol,
             'interval': interval,
-            'startTime': current_start,
-            'endTime': end_ms,
+            'startTime': page_start,
+            'endTime': min(page_start + page_ms - 1, end_ms),
             'limit': limit
         }
+        for page_start in range(start_ms, end_ms, page_ms)
+    ]
+    
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as pool:
+        futures = [pool.submit(_fetch_klines_page, url, params) for params in pages]
         
-        try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            klines = response.json()
-            
-            if not klines:
+        # Consume in page order; stop at the first failure so the result has no gaps
+        for page_no, future in enumerate(futures, start=1):
+            try:
+                response, klines = future.result()
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
+                logger.error(f"Error fetching klines: {e}")
+                for pending in futures:
+                    pending.cancel()
                 break
             
-            all_klines.extend(klines)
+            if klines is None:
+                logger.error(f"Error fetching klines: HTTP {response.status_code} {response.text[:200]}")
+                for pending in futures:
+                    pending.cancel()
+                break
             
-            # Move start to after the last kline
-            current_start = klines[-1][0] + 1
+            if not klines:
+                continue
             
-            # Progress indicator
-            logger.info(f"Fetched {len(all_klines)} {interval} bars...")
-            print(f"  Downloading {interval} data: {len(all_klines)} bars fetched...", end='\r')
+            # Transpose to columns and keep only open time + OHLCV (indices 0-5);
+            # numpy parses the price strings column-wise with no object array
+            columns = tuple(zip(*klines))
+            page_end = n_bars + len(klines)
+            ts_buf[n_bars:page_end] = columns[0]
+            ohlcv_buf[n_bars:page_end] = np.array(columns[1:6], dtype=np.float64).T
+            n_bars = page_end
             
-        except requests.RequestException as e:
-            logger.error(f"Error fetching klines: {e}")
-            break
+            if page_no % _PROGRESS_EVERY_PAGES == 0:
+                logger.info(f"Fetched {n_bars} {interval} bars ({page_no}/{len(futures)} pages)...")
+                used_weight = int(response.headers.get('X-MBX-USED-WEIGHT-1M', 0))
+                if used_weight > _WEIGHT_WARN_1M:
+                    logger.warning(f"Binance request weight high: {used_weight}/min")
     
-    print()  # New line after progress
+    logger.info(f"Fetched {n_bars} {interval} bars")
     
-    if not all_klines:
+    if n_bars == 0:
         return pd.DataFrame()
     
-    # Convert to DataFrame
-    df = pd.DataFrame(all_klines, columns=[
-        'timestamp', 'open', 'high', 'low', 'close', 'volume',
-        'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-        'taker_buy_quote', 'ignore'
-    ])
+    # Column names match backtesting.py expectations
+    return pd.DataFrame(
+        ohlcv_buf[:n_bars],
+        columns=['Open', 'High', 'Low', 'Close', 'Volume'],
+        index=pd.DatetimeIndex(pd.to_datetime(ts_buf[:n_bars], unit='ms'), name='timestamp')
+    )
+
+
+def _klines_cache_path(symbol: str, interval: str, start_time: datetime, end_time: datetime) -> Path:
+    """Parquet cache file for a (symbol, interval, start, end) kline request."""
+    key = hashlib.sha1(f"{symbol}|{interval}|{start_time.isoformat()}|{end_time.isoformat()}".encode()).hexdigest()
+    return CFG.DATA_DIR / f"klines_{key}.parquet"
+
+
+def fetch_binance_klines_cached(
+    symbol: str,
+    interval: str,
+    start_time: datetime,
+    end_time: datetime
+) -> pd.DataFrame:
+    """
+    Fetch historical klines, reusing an on-disk parquet copy when available.
     
-    # Process columns
-    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-    df = df.set_index('timestamp')
+    Only complete downloads (last bar within one interval of end_time) are cached,
+    so a fetch that stopped early on a network error is retried next run.
     
-    for col in ['open', 'high', 'low', 'close', 'volume']:
-        df[col] = df[col].astype(float)
+    Args:
+        symbol: Trading pair (e.g., 'BTCUSDT')
+        interval: Kline interval (e.g., '15m', '1h')
+        start_time: Start datetime
+        end_time: End datetime
+    
+    Returns:
+        DataFrame with OHLCV data
+    """
+    cache_path = _klines_cache_path(symbol, interval, start_time, end_time)
+    
+    if cache_path.exists():
+        logger.info(f"Loading cached {interval} klines from {cache_path.name}")
+        return pd.read_parquet(cache_path)
     
-    # Rename for backtesting.py compatibility
-    df = df.rename(columns={
-        'open': 'Open',
-        'high': 'High',
-        'low': 'Low',
-        'close': 'Close',
-        'volume': 'Volume'
-    })
+    df = fetch_binance_klines(symbol, interval, start_time, end_time)
     
-    return df[['Open', 'High', 'Low', 'Close', 'Volume']]
+    if not df.empty:
+        last_bar_ms = df.index[-1].value // 1_000_000
+        end_ms = int(end_time.timestamp() * 1000)
+        if last_bar_ms + _INTERVAL_MS[interval] > end_ms:
+            df.to_parquet(cache_path, compression='zstd')
+            logger.info(f"Cached {len(df)} {interval} klines to {cache_path.name}")
+        else:
+            logger.warning(f"Incomplete {interval} download, not caching")
+    
+    return df
 
 
 def run_backtest():
@@ -131,7 +256,7 @@ def run_backtest():
     This function:
     1. Fetches historical data for both timeframes
     2. Runs backtesting.py with our strategy wrapper
-    3. Saves trades to CSV
+    3. Saves trades to parquet and CSV
     4. Prints results summary
     """
     logger.info("=" * 60)
@@ -139,42 +264,49 @@ def run_backtest():
     logger.info("=" * 60)
     
     # Parse dates
-    start_date = datetime.strptime(BACKTEST_START_DATE, '%Y-%m-%d')
-    end_date = datetime.strptime(BACKTEST_END_DATE, '%Y-%m-%d')
+    start_date = datetime.strptime(CFG.BACKTEST_START_DATE, '%Y-%m-%d')
+    end_date = datetime.strptime(CFG.BACKTEST_END_DATE, '%Y-%m-%d')
     
-    logger.info(f"Symbol: {SYMBOL}")
+    logger.info(f"Symbol: {CFG.SYMBOL}")
     logger.info(f"Period: {start_date.date()} to {end_date.date()}")
     
     # Fetch entry timeframe data
-    logger.info(f"Fetching {TIMEFRAME_ENTRY} historical data...")
-    data_entry = fetch_binance_klines(SYMBOL, TIMEFRAME_ENTRY, start_date, end_date)
+    logger.info(f"Fetching {CFG.TIMEFRAME_ENTRY} historical data...")
+    data_entry = fetch_binance_klines_cached(CFG.SYMBOL, CFG.TIMEFRAME_ENTRY, start_date, end_date)
     
     if data_entry.empty:
-        logger.error(f"Failed to fetch {TIMEFRAME_ENTRY} data")
+        logger.error(f"Failed to fetch {CFG.TIMEFRAME_ENTRY} data")
         return
     
-    logger.info(f"Loaded {len(data_entry)} {TIMEFRAME_ENTRY} bars")
+    logger.info(f"Loaded {len(data_entry)} {CFG.TIMEFRAME_ENTRY} bars")
     
     # Fetch confirmation timeframe data
-    logger.info(f"Fetching {TIMEFRAME_CONFIRMATION} historical data...")
-    data_conf = fetch_binance_klines(SYMBOL, TIMEFRAME_CONFIRMATION, start_date, end_date)
+    logger.info(f"Fetching {CFG.TIMEFRAME_CONFIRMATION} historical data...")
+    data_conf = fetch_binance_klines_cached(CFG.SYMBOL, CFG.TIMEFRAME_CONFIRMATION, start_date, end_date)
     
     if data_conf.empty:
-        logger.error(f"Failed to fetch {TIMEFRAME_CONFIRMATION} data")
+        logger.error(f"Failed to fetch {CFG.TIMEFRAME_CONFIRMATION} data")
         return
     
-    logger.info(f"Loaded {len(data_conf)} {TIMEFRAME_CONFIRMATION} bars")
+    logger.info(f"Loaded {len(data_conf)} {CFG.TIMEFRAME_CONFIRMATION} bars")
+    
+    # Align every entry bar to its confirmation bar once (latest conf bar opened at or before its period)
+    conf_idx = conf_index_for_entry(
+        data_entry.index.as_unit('ns').asi8,
+        data_conf.index.as_unit('ns').asi8,
+        _INTERVAL_MS[CFG.TIMEFRAME_CONFIRMATION] * 1_000_000
+    )
     
     # Set confirmation data for strategy
-    BacktestStrategyWrapper.set_conf_data(data_conf)
+    BacktestStrategyWrapper.set_conf_data(data_conf, conf_idx)
     
     # Create and run backtest
     logger.info("Running backtest...")
     bt = Backtest(
         data_entry,
         BacktestStrategyWrapper,
-        cash=BACKTEST_INITIAL_CASH,
-        commission=BACKTEST_COMMISSION,
+        cash=CFG.BACKTEST_INITIAL_CASH,
+        commission=CFG.BACKTEST_COMMISSION,
         exclusive_orders=True,
         trade_on_close=True  # Execute on bar close for determinism
     )
@@ -192,7 +324,7 @@ def run_backtest():
     print(f"Start Date:           {start_date.date()}")
     print(f"End Date:             {end_date.date()}")
     print(f"Duration:             {(end_date - start_date).days} days")
-    print(f"Starting Equity:      ${BACKTEST_INITIAL_CASH:,.2f}")
+    print(f"Starting Equity:      ${CFG.BACKTEST_INITIAL_CASH:,.2f}")
     print(f"Ending Equity:        ${stats['Equity Final [$]']:,.2f}")
     print(f"Return:               {stats['Return [%]']:.2f}%")
     print(f"Max Drawdown:         {stats['Max. Drawdown [%]']:.2f}%")
@@ -201,15 +333,17 @@ def run_backtest():
     print(f"Profit Factor:        {stats.get('Profit Factor', 'N/A')}")
     print("=" * 60)
     
-    # Save trades to CSV
-    trades = BacktestStrategyWrapper.get_trade_log()
+    # Save trades
+    trades_df = BacktestStrategyWrapper.get_trade_frame()
     
-    if trades:
-        csv_writer = CSVWriter(BACKTEST_TRADES_PATH)
-        csv_writer.clear()
-        csv_writer.write_trades(trades)
-        logger.info(f"Saved {len(trades)} trades to {BACKTEST_TRADES_PATH}")
-        print(f"\nTrades saved to: {BACKTEST_TRADES_PATH}")
+    if len(trades_df):
+        # One vectorized dump: parquet for analysis, CSV for the trade matcher
+        trades_parquet_path = CFG.BACKTEST_TRADES_PATH.with_suffix('.parquet')
+        CFG.BACKTEST_TRADES_PATH.parent.mkdir(parents=True, exist_ok=True)
+        trades_df.to_parquet(trades_parquet_path, compression='zstd', index=False)
+        trades_df.to_csv(CFG.BACKTEST_TRADES_PATH, index=False)
+        logger.info(f"Saved {len(trades_df)} trades to {CFG.BACKTEST_TRADES_PATH} and {trades_parquet_path.name}")
+        print(f"\nTrades saved to: {CFG.BACKTEST_TRADES_PATH}")
     else:
         logger.warning("No trades generated during backtest")
         print("\nNo trades were generated during the backtest.")
@@ -0,0 +1,188 @@
+"""
+Vectorized Backtest - whole-history evaluation of the StrategyMultiTF rules.
+
+Indicators and crossover signals are computed in one array pass, and only the
+position state machine (one position at a time, SL/TP/timeout exits) runs as a
+compiled sequential loop. Intended for parameter sweeps; the event-driven
+backtest_runner (backtesting.py + StrategyMultiTF) remains the reference path
+and should be used to validate any result found here.
+
+Semantics follow StrategyMultiTF bar for bar:
+- Entry EMAs are SMA-seeded once the slow period is filled
+- Confirmation EMAs update on every entry bar with the forward-filled close of
+  the current confirmation bar
+- Exits need at least one bar held and are checked in order SL, TP, timeout,
+  opposite crossover; an exit bar never re-enters
+- Long entry is checked before short entry
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+from src.core.indicators import ema_sma_seeded
+from src.core.trade_intent import TradeSide, TradeReason
+from config.config import (
+    TRADE_QUANTITY, BACKTEST_INITIAL_CASH,
+    EMA_FAST_ENTRY, EMA_SLOW_ENTRY, EMA_FAST_CONFIRMATION, EMA_SLOW_CONFIRMATION,
+    STOP_LOSS_PCT, TAKE_PROFIT_PCT, POSITION_TIMEOUT_BARS
+)
+
+# Defaults mirror BacktestStrategyWrapper's class-level parameters
+DEFAULT_PARAMS = {
+    'ema_fast_entry': EMA_FAST_ENTRY,
+    'ema_slow_entry': EMA_SLOW_ENTRY,
+    'ema_fast_conf': EMA_FAST_CONFIRMATION,
+    'ema_slow_conf': EMA_SLOW_CONFIRMATION,
+    'stop_loss_pct': STOP_LOSS_PCT,
+    'take_profit_pct': TAKE_PROFIT_PCT,
+    'position_timeout': POSITION_TIMEOUT_BARS,
+    'quantity': TRADE_QUANTITY,
+    'initial_cash': BACKTEST_INITIAL_CASH,
+}
+
+# Exit reason codes used by the compiled loop
+_EXIT_REASONS = (
+    None,
+    TradeReason.EXIT_STOP_LOSS.value,
+    TradeReason.EXIT_TAKE_PROFIT.value,
+    TradeReason.EXIT_TIMEOUT.value,
+    TradeReason.EXIT_SIGNAL.value,
+)
+
+
+@njit(cache=True)
+def _simulate_positions(
+    close, ready, enter_long, enter_short, exit_long, exit_short,
+    stop_loss_pct, take_profit_pct, position_timeout
+):
+    """
+    Walk the precomputed signals and return closed trades as parallel arrays.
+
+    Returns:
+        (n_trades, entry_idx, exit_idx, direction, exit_reason)
+    """
+    n = close.shape[0]
+    entry_idx = np.empty(n, dtype=np.int64)
+    exit_idx = np.empty(n, dtype=np.int64)
+    direction = np.empty(n, dtype=np.int64)
+    exit_reason = np.empty(n, dtype=np.int64)
+    n_trades = 0
+
+    pos = 0
+    pos_entry = 0
+    entry_price = 0.0
+    for i in range(n):
+        if not ready[i]:
+            continue
+
+        if pos != 0:
+            held = i - pos_entry
+            if held < 1:
+                continue
+
+            pnl_pct = pos * (close[i] - entry_price) / entry_price
+            reason = 0
+            if pnl_pct <= -stop_loss_pct:
+                reason = 1
+            elif pnl_pct >= take_profit_pct:
+                reason = 2
+            elif held >= position_timeout:
+                reason = 3
+            elif (pos == 1 and exit_long[i]) or (pos == -1 and exit_short[i]):
+                reason = 4
+
+            if reason != 0:
+                entry_idx[n_trades] = pos_entry
+                exit_idx[n_trades] = i
+                direction[n_trades] = pos
+                exit_reason[n_trades] = reason
+                n_trades += 1
+                pos = 0
+            continue
+
+        if enter_long[i]:
+            pos = 1
+        elif enter_short[i]:
+            pos = -1
+        else:
+            continue
+        pos_entry = i
+        entry_price = close[i]
+
+    return n_trades, entry_idx, exit_idx, direction, exit_reason
+
+
+def vectorized_backtest(
+    df_entry: pd.DataFrame,
+    df_conf: pd.DataFrame,
+    params: Optional[Dict] = None
+) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Run the StrategyMultiTF rules over a full history without per-bar Python.
+
+    Args:
+        df_entry: Entry timeframe OHLCV (backtesting.py column names)
+        df_conf: Confirmation timeframe OHLCV
+        params: Overrides for DEFAULT_PARAMS
+
+    Returns:
+        (trades, equity) - one row per closed trade, and starting cash plus
+        realized strategy PnL (at the configured quantity) per entry bar
+    """
+    p = {**DEFAULT_PARAMS, **(params or {})}
+    close = df_entry['Close'].to_numpy(dtype=np.float64)
+
+    # Entry EMAs and crossover masks (NaN before seeding compares False)
+    fast = ema_sma_seeded(close, p['ema_fast_entry'], p['ema_slow_entry'])
+    slow = ema_sma_seeded(close, p['ema_slow_entry'], p['ema_slow_entry'])
+    prev_fast = np.concatenate(([np.nan], fast[:-1]))
+    prev_slow = np.concatenate(([np.nan], slow[:-1]))
+
+    # Confirmation close as seen by each entry bar; EMAs run over entry bars
+    conf_close = df_conf['Close'].reindex(df_entry.index, method='ffill').to_numpy(dtype=np.float64)
+    has_conf = ~np.isnan(conf_close)
+    conf_fast = np.full(len(close), np.nan)
+    conf_slow = np.full(len(close), np.nan)
+    conf_fast[has_conf] = ema_sma_seeded(conf_close[has_conf], p['ema_fast_conf'], p['ema_slow_conf'])
+    conf_slow[has_conf] = ema_sma_seeded(conf_close[has_conf], p['ema_slow_conf'], p['ema_slow_conf'])
+
+    ready = ~np.isnan(slow) & ~np.isnan(conf_slow)
+    enter_long = has_conf & (prev_fast <= prev_slow) & (fast > slow) & (conf_fast > conf_slow)
+    enter_short = has_conf & (prev_fast >= prev_slow) & (fast < slow) & (conf_fast < conf_slow)
+    exit_long = (prev_fast > prev_slow) & (fast <= slow)
+    exit_short = (prev_fast < prev_slow) & (fast >= slow)
+
+    n_trades, entry_idx, exit_idx, direction, exit_reason = _simulate_positions(
+        close, ready, enter_long, enter_short, exit_long, exit_short,
+        float(p['stop_loss_pct']), float(p['take_profit_pct']), int(p['position_timeout'])
+    )
+    entry_idx = entry_idx[:n_trades]
+    exit_idx = exit_idx[:n_trades]
+    direction = direction[:n_trades]
+
+    # Trade PnL, same formula as StrategyMultiTF
+    entry_price = close[entry_idx]
+    exit_price = close[exit_idx]
+    pnl_pct = direction * (exit_price - entry_price) / entry_price
+    pnl = pnl_pct * entry_price * p['quantity']
+
+    trades = pd.DataFrame({
+        'entry_time': df_entry.index[entry_idx],
+        'exit_time': df_entry.index[exit_idx],
+        'side': np.where(direction == 1, TradeSide.BUY.value, TradeSide.SELL.value),
+        'entry_price': entry_price,
+        'exit_price': exit_price,
+        'reason': [_EXIT_REASONS[r] for r in exit_reason[:n_trades]],
+        'pnl': pnl,
+        'pnl_pct': pnl_pct,
+        'duration_bars': exit_idx - entry_idx,
+    })
+
+    realized = np.zeros(len(close))
+    np.add.at(realized, exit_idx, pnl)
+    equity = pd.Series(p['initial_cash'] + np.cumsum(realized), index=df_entry.index, name='Equity')
+
+    return trades, equity
@@ -0,0 +1,128 @@
+"""
+Numba-compiled indicator kernels.
+
+Whole-array versions of the EMA math used by StrategyMultiTF, for callers that
+have the full price history up front (precomputed backtests, parameter sweeps).
+The strategy itself stays incremental so the live runner can feed it bar by bar.
+
+Arithmetic follows StrategyMultiTF operation for operation. fastmath is left off
+on purpose: it allows reassociation/FMA contraction, which would let the kernels
+drift from the incremental path and flip marginal crossovers.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def ema(arr: np.ndarray, period: int) -> np.ndarray:
+    """
+    Exponential moving average seeded with the first value.
+
+    Args:
+        arr: Price series (float64)
+        period: EMA period
+
+    Returns:
+        EMA series, same length as arr
+    """
+    n = arr.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+
+    multiplier = 2 / (period + 1)
+    out[0] = arr[0]
+    for i in range(1, n):
+        out[i] = (arr[i] - out[i - 1]) * multiplier + out[i - 1]
+    return out
+
+
+def sma_seed(prices: np.ndarray, count: int, period: int) -> float:
+    """
+    SMA of the last `period` of the first `count` prices, as StrategyMultiTF seeds its EMAs.
+
+    Kept in NumPy (not compiled) so the summation order, and therefore the seed,
+    is bit-identical to the strategy's.
+    """
+    if count < period or prices.shape[0] < count:
+        return np.nan
+    return float(prices[count - period:count].sum()) / period
+
+
+@njit(cache=True)
+def _ema_from_seed(arr: np.ndarray, period: int, seed: float, seed_idx: int) -> np.ndarray:
+    n = arr.shape[0]
+    out = np.full(n, np.nan)
+    if seed_idx >= n:
+        return out
+
+    out[seed_idx] = seed
+    multiplier = 2 / (period + 1)
+    for i in range(seed_idx + 1, n):
+        out[i] = (arr[i] - out[i - 1]) * multiplier + out[i - 1]
+    return out
+
+
+def ema_sma_seeded(arr: np.ndarray, period: int, seed_len: int) -> np.ndarray:
+    """
+    EMA seeded with an SMA, as StrategyMultiTF warms up its EMAs.
+
+    The seed is the SMA of the last `period` prices at index seed_len - 1
+    (the strategy seeds both EMAs once it has the slow period's worth of bars);
+    earlier values are NaN.
+
+    Args:
+        arr: Price series (float64)
+        period: EMA period
+        seed_len: Number of bars before the EMA is seeded (>= period)
+
+    Returns:
+        EMA series, same length as arr
+    """
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
+    return _ema_from_seed(arr, period, sma_seed(arr, seed_len, period), seed_len - 1)
+
+
+def precompute_emas(
+    entry_close: np.ndarray,
+    conf_idx: np.ndarray,
+    conf_close: np.ndarray,
+    fast_entry: int,
+    slow_entry: int,
+    fast_conf: int,
+    slow_conf: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    All four StrategyMultiTF EMA streams, one value per entry bar.
+
+    Confirmation EMAs advance on every entry bar that has a confirmation bar,
+    using that bar's close, exactly as on_bar() updates them. Values are NaN
+    until the respective EMAs are seeded.
+
+    Args:
+        entry_close: Entry timeframe closes, one per bar the strategy sees
+        conf_idx: Confirmation row for each entry bar (-1 = none yet)
+        conf_close: Confirmation timeframe closes
+        fast_entry, slow_entry, fast_conf, slow_conf: EMA periods
+
+    Returns:
+        (fast_entry, slow_entry, fast_conf, slow_conf) EMA arrays
+    """
+    entry_close = np.ascontiguousarray(entry_close, dtype=np.float64)
+    has_conf = np.asarray(conf_idx) >= 0
+    conf_seen = np.ascontiguousarray(np.asarray(conf_close, dtype=np.float64)[conf_idx[has_conf]])
+
+    ema_fast_conf = np.full(entry_close.shape[0], np.nan)
+    ema_slow_conf = np.full(entry_close.shape[0], np.nan)
+    ema_fast_conf[has_conf] = ema_sma_seeded(conf_seen, fast_conf, slow_conf)
+    ema_slow_conf[has_conf] = ema_sma_seeded(conf_seen, slow_conf, slow_conf)
+
+    return (
+        ema_sma_seeded(entry_close, fast_entry, slow_entry),
+        ema_sma_seeded(entry_close, slow_entry, slow_entry),
+        ema_fast_conf,
+        ema_slow_conf,
+    )
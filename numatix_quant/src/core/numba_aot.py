@@ -0,0 +1,72 @@
+"""
+Ahead-of-time build of the backtest kernel.
+
+Compiles numba_core._run_backtest into a C extension (src/core/numatix_core*.so)
+with numba.pycc, so backtests skip the JIT compile on first call. numba_core
+imports the extension when it has been built and falls back to the JIT kernel
+otherwise; both are generated from the same function.
+
+The extension also exports source_hash(), the kernel_source_hash() of the
+_run_backtest it was compiled from; numba_core ignores (with a warning) a
+build whose hash no longer matches, so edit the kernel and rebuild.
+
+Importing numba.pycc emits NumbaPendingDeprecationWarning (pycc is slated for
+replacement upstream); the build still works, and only this module imports it.
+
+Usage (from the project root):
+    python -m src.core.numba_aot
+"""
+
+import os
+
+from numba import types
+from numba.pycc import CC
+
+from src.core.numba_core import _run_backtest, kernel_source_hash
+
+MODULE_NAME = 'numatix_core'
+
+_I8 = types.int64[:]
+_F8 = types.float64[:]
+
+# Same argument order as numba_core._run_backtest
+RUN_BACKTEST_SIGNATURE = types.Tuple((_I8, _I8, _F8, _F8, _I8))(
+    _F8, _I8, _F8,
+    types.float64, types.float64, types.float64, types.float64,
+    types.float64, types.float64, types.float64, types.float64,
+    types.int64, types.int64,
+    types.float64, types.float64, types.float64, types.int64
+)
+
+# Compiled into the extension as a constant
+SOURCE_HASH = kernel_source_hash()
+
+cc = CC(MODULE_NAME)
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('source_hash', 'int64()')
+def source_hash():
+    return SOURCE_HASH
+
+
+@cc.export('run_backtest', RUN_BACKTEST_SIGNATURE)
+def run_backtest(
+    entry_close, conf_idx, conf_close,
+    alpha_fe, alpha_se, alpha_fc, alpha_sc,
+    seed_fe, seed_se, seed_fc, seed_sc,
+    warmup_entry, warmup_conf,
+    quantity, stop_loss_pct, take_profit_pct, timeout
+):
+    return _run_backtest(
+        entry_close, conf_idx, conf_close,
+        alpha_fe, alpha_se, alpha_fc, alpha_sc,
+        seed_fe, seed_se, seed_fc, seed_sc,
+        warmup_entry, warmup_conf,
+        quantity, stop_loss_pct, take_profit_pct, timeout
+    )
+
+
+if __name__ == '__main__':
+    cc.compile()
+    print(f"Built {MODULE_NAME} in {cc.output_dir}")
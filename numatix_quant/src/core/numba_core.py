@@ -0,0 +1,347 @@
+"""
+Numba-compiled backtest kernel.
+
+A single compiled pass over the entry closes that replays StrategyMultiTF's
+per-bar logic (EMA updates, crossover detection, SL/TP/timeout/signal exits) and
+returns the trade events it would emit. BacktestStrategyWrapper can use it
+(use_kernel=True) to replace the interpreted per-bar strategy call with a lookup.
+
+StrategyMultiTF stays the single source of truth: the kernel must follow it
+step for step, and tests/test_numba_core.py checks the two produce identical
+trade logs.
+
+`python -m src.core.numba_aot` builds the kernel ahead of time (numatix_core
+extension); when present and built from the current _run_backtest source it is
+used instead of the JIT, avoiding the compile on first call. A stale build is
+ignored with a warning.
+
+run_batch() evaluates many runs (parameter sets and/or price series) in
+parallel over the same kernel, returning per-run summaries for sweeps.
+"""
+
+import hashlib
+import inspect
+from typing import NamedTuple, Union
+
+import numpy as np
+from numba import njit, prange
+
+from src.core.indicators import sma_seed
+from src.core.trade_intent import TradeReason
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Event codes emitted by the kernel, in TradeReason terms
+EVENT_REASONS = (
+    None,
+    TradeReason.ENTRY_LONG,
+    TradeReason.ENTRY_SHORT,
+    TradeReason.EXIT_STOP_LOSS,
+    TradeReason.EXIT_TAKE_PROFIT,
+    TradeReason.EXIT_TIMEOUT,
+    TradeReason.EXIT_SIGNAL,
+)
+
+
+class TradeEvents(NamedTuple):
+    """Trade events from the kernel as parallel arrays (bar = position in the input)."""
+    bar: np.ndarray
+    code: np.ndarray
+    pnl: np.ndarray
+    pnl_pct: np.ndarray
+    duration_bars: np.ndarray
+
+
+class BatchResult(NamedTuple):
+    """Per-run summary from run_batch (one entry per run)."""
+    n_trades: np.ndarray
+    n_wins: np.ndarray
+    total_pnl: np.ndarray
+
+
+@njit(cache=True)
+def _run_backtest(
+    entry_close, conf_idx, conf_close,
+    alpha_fe, alpha_se, alpha_fc, alpha_sc,
+    seed_fe, seed_se, seed_fc, seed_sc,
+    warmup_entry, warmup_conf,
+    quantity, stop_loss_pct, take_profit_pct, timeout
+):
+    n = entry_close.shape[0]
+    ev_bar = np.empty(n, dtype=np.int64)
+    ev_code = np.empty(n, dtype=np.int64)
+    ev_pnl = np.empty(n, dtype=np.float64)
+    ev_pnl_pct = np.empty(n, dtype=np.float64)
+    ev_duration = np.empty(n, dtype=np.int64)
+    n_events = 0
+
+    fe = se = fc = sc = np.nan
+    n_entry = 0
+    n_conf = 0
+    warm_entry = False
+    warm_conf = False
+
+    pos = 0
+    pos_bar = 0
+    entry_price = 0.0
+
+    for i in range(n):
+        close = entry_close[i]
+
+        # Previous values BEFORE update (NaN until seeded, so crossovers read False)
+        prev_fe = fe
+        prev_se = se
+
+        # Entry EMAs
+        if not warm_entry:
+            n_entry += 1
+            if n_entry >= warmup_entry:
+                fe = seed_fe
+                se = seed_se
+                warm_entry = True
+        else:
+            fe += alpha_fe * (close - fe)
+            se += alpha_se * (close - se)
+
+        # Confirmation EMAs, updated with the current confirmation bar's close
+        j = conf_idx[i]
+        has_conf = j >= 0
+        if has_conf:
+            conf = conf_close[j]
+            if not warm_conf:
+                n_conf += 1
+                if n_conf >= warmup_conf:
+                    fc = seed_fc
+                    sc = seed_sc
+                    warm_conf = True
+            else:
+                fc += alpha_fc * (conf - fc)
+                sc += alpha_sc * (conf - sc)
+
+        if not (warm_entry and warm_conf):
+            continue
+
+        # Exits (at least one bar held), same order as StrategyMultiTF.should_exit
+        if pos != 0:
+            held = i - pos_bar
+            if held < 1:
+                continue
+
+            pnl_pct = pos * (close - entry_price) / entry_price
+            code = 0
+            if pnl_pct <= -stop_loss_pct:
+                code = 3
+            elif pnl_pct >= take_profit_pct:
+                code = 4
+            elif held >= timeout:
+                code = 5
+            elif pos == 1:
+                if prev_fe > prev_se and fe <= se:
+                    code = 6
+            elif prev_fe < prev_se and fe >= se:
+                code = 6
+
+            if code != 0:
+                ev_bar[n_events] = i
+                ev_code[n_events] = code
+                ev_pnl_pct[n_events] = pnl_pct
+                ev_pnl[n_events] = pnl_pct * entry_price * quantity
+                ev_duration[n_events] = held
+                n_events += 1
+                pos = 0
+            continue
+
+        # Entries need a confirmation bar; long is checked first
+        if not has_conf:
+            continue
+        if prev_fe <= prev_se and fe > se and fc > sc:
+            pos = 1
+            code = 1
+        elif prev_fe >= prev_se and fe < se and fc < sc:
+            pos = -1
+            code = 2
+        else:
+            continue
+
+        pos_bar = i
+        entry_price = close
+        ev_bar[n_events] = i
+        ev_code[n_events] = code
+        ev_pnl[n_events] = np.nan
+        ev_pnl_pct[n_events] = np.nan
+        ev_duration[n_events] = 0
+        n_events += 1
+
+    return (
+        ev_bar[:n_events], ev_code[:n_events], ev_pnl[:n_events],
+        ev_pnl_pct[:n_events], ev_duration[:n_events]
+    )
+
+
+def run_backtest(
+    entry_close: np.ndarray,
+    conf_idx: np.ndarray,
+    conf_close: np.ndarray,
+    fast_entry: int,
+    slow_entry: int,
+    fast_conf: int,
+    slow_conf: int,
+    quantity: float,
+    stop_loss_pct: float,
+    take_profit_pct: float,
+    timeout: int
+) -> TradeEvents:
+    """
+    Replay StrategyMultiTF over a full series of entry bars.
+
+    Args:
+        entry_close: Entry timeframe closes, one per bar the strategy sees
+        conf_idx: Confirmation row for each entry bar (-1 = none yet)
+        conf_close: Confirmation timeframe closes
+        fast_entry, slow_entry, fast_conf, slow_conf: EMA periods
+        quantity: Position size used for PnL
+        stop_loss_pct, take_profit_pct, timeout: Exit parameters
+
+    Returns:
+        TradeEvents for every entry and exit
+    """
+    entry_close = np.ascontiguousarray(entry_close, dtype=np.float64)
+    conf_idx = np.ascontiguousarray(conf_idx, dtype=np.int64)
+    conf_close = np.ascontiguousarray(conf_close, dtype=np.float64)
+
+    # Confirmation closes in the order the strategy receives them (seeded like the strategy)
+    conf_seen = conf_close[conf_idx[conf_idx >= 0]]
+
+    events = _KERNEL(
+        entry_close, conf_idx, conf_close,
+        2.0 / (fast_entry + 1), 2.0 / (slow_entry + 1),
+        2.0 / (fast_conf + 1), 2.0 / (slow_conf + 1),
+        sma_seed(entry_close, slow_entry, fast_entry), sma_seed(entry_close, slow_entry, slow_entry),
+        sma_seed(conf_seen, slow_conf, fast_conf), sma_seed(conf_seen, slow_conf, slow_conf),
+        slow_entry, slow_conf,
+        float(quantity), float(stop_loss_pct), float(take_profit_pct), int(timeout)
+    )
+    return TradeEvents(*events)
+
+
+@njit(parallel=True, cache=True)
+def _run_batch(
+    entry_close, conf_idx, conf_close, alphas, seeds, warmups,
+    quantity, stop_loss_pct, take_profit_pct, timeout
+):
+    n_runs = entry_close.shape[0]
+    n_trades = np.zeros(n_runs, dtype=np.int64)
+    n_wins = np.zeros(n_runs, dtype=np.int64)
+    total_pnl = np.zeros(n_runs, dtype=np.float64)
+
+    for k in prange(n_runs):
+        _, code, pnl, _, _ = _run_backtest(
+            entry_close[k], conf_idx, conf_close[k],
+            alphas[k, 0], alphas[k, 1], alphas[k, 2], alphas[k, 3],
+            seeds[k, 0], seeds[k, 1], seeds[k, 2], seeds[k, 3],
+            warmups[k, 0], warmups[k, 1],
+            quantity[k], stop_loss_pct[k], take_profit_pct[k], timeout[k]
+        )
+        for e in range(code.shape[0]):
+            if code[e] >= 3:
+                n_trades[k] += 1
+                total_pnl[k] += pnl[e]
+                if pnl[e] > 0:
+                    n_wins[k] += 1
+
+    return n_trades, n_wins, total_pnl
+
+
+def run_batch(
+    entry_close: np.ndarray,
+    conf_idx: np.ndarray,
+    conf_close: np.ndarray,
+    fast_entry: Union[int, np.ndarray],
+    slow_entry: Union[int, np.ndarray],
+    fast_conf: Union[int, np.ndarray],
+    slow_conf: Union[int, np.ndarray],
+    quantity: Union[float, np.ndarray],
+    stop_loss_pct: Union[float, np.ndarray],
+    take_profit_pct: Union[float, np.ndarray],
+    timeout: Union[int, np.ndarray]
+) -> BatchResult:
+    """
+    Run the kernel for many parameter sets / series at once, in parallel.
+    
+    Every parameter may be a scalar or a per-run array. Price inputs may be 1-D
+    (one series shared by all runs, a parameter sweep) or 2-D (n_runs, n_bars),
+    e.g. several symbols on a common bar grid; conf_idx is shared.
+    
+    Args:
+        entry_close: Entry closes, (n_bars,) or (n_runs, n_bars)
+        conf_idx: Confirmation row for each entry bar (-1 = none yet)
+        conf_close: Confirmation closes, (n_conf,) or (n_runs, n_conf)
+        fast_entry, slow_entry, fast_conf, slow_conf: EMA periods
+        quantity: Position size used for PnL
+        stop_loss_pct, take_profit_pct, timeout: Exit parameters
+    
+    Returns:
+        BatchResult with closed trades, winning trades and summed PnL per run
+    """
+    entry_close = np.atleast_2d(np.asarray(entry_close, dtype=np.float64))
+    conf_close = np.atleast_2d(np.asarray(conf_close, dtype=np.float64))
+    conf_idx = np.ascontiguousarray(conf_idx, dtype=np.int64)
+    
+    params = [np.atleast_1d(p) for p in (
+        fast_entry, slow_entry, fast_conf, slow_conf,
+        quantity, stop_loss_pct, take_profit_pct, timeout
+    )]
+    n_runs = max(entry_close.shape[0], conf_close.shape[0], *(len(p) for p in params))
+    fe, se, fc, sc, qty, sl, tp, to = (np.ascontiguousarray(np.broadcast_to(p, (n_runs,))) for p in params)
+    entry_close = np.ascontiguousarray(np.broadcast_to(entry_close, (n_runs, entry_close.shape[1])))
+    conf_close = np.ascontiguousarray(np.broadcast_to(conf_close, (n_runs, conf_close.shape[1])))
+    
+    # Alphas and SMA seeds per run, computed in NumPy exactly as run_backtest does
+    fe, se, fc, sc = (np.asarray(p, dtype=np.int64) for p in (fe, se, fc, sc))
+    alphas = np.column_stack([2.0 / (fe + 1), 2.0 / (se + 1), 2.0 / (fc + 1), 2.0 / (sc + 1)])
+    has_conf = conf_idx >= 0
+    seeds = np.empty((n_runs, 4))
+    for k in range(n_runs):
+        conf_seen = conf_close[k][conf_idx[has_conf]]
+        seeds[k] = (
+            sma_seed(entry_close[k], se[k], fe[k]), sma_seed(entry_close[k], se[k], se[k]),
+            sma_seed(conf_seen, sc[k], fc[k]), sma_seed(conf_seen, sc[k], sc[k]),
+        )
+    warmups = np.column_stack([se, sc])
+    
+    return BatchResult(*_run_batch(
+        entry_close, conf_idx, conf_close, alphas, seeds, warmups,
+        np.asarray(qty, dtype=np.float64), np.asarray(sl, dtype=np.float64),
+        np.asarray(tp, dtype=np.float64), np.asarray(to, dtype=np.int64)
+    ))
+
+
+def kernel_source_hash() -> int:
+    """Signed 64-bit digest of _run_backtest's source, stamped into the AOT build by numba_aot."""
+    digest = hashlib.sha256(inspect.getsource(_run_backtest.py_func).encode()).digest()
+    return int.from_bytes(digest[:8], 'little', signed=True)
+
+
+def _load_kernel():
+    """The AOT-built kernel if it matches the current _run_backtest, else the JIT one."""
+    try:
+        from src.core import numatix_core
+    except ImportError:
+        logger.info("Backtest kernel: JIT (numatix_core not built)")
+        return _run_backtest
+    
+    built_from = numatix_core.source_hash() if hasattr(numatix_core, 'source_hash') else None
+    if built_from != kernel_source_hash():
+        logger.warning(
+            "numatix_core was built from a different _run_backtest; using the JIT kernel "
+            "(rebuild with: python -m src.core.numba_aot)"
+        )
+        return _run_backtest
+    
+    logger.info(f"Backtest kernel: AOT ({numatix_core.__file__})")
+    return numatix_core.run_backtest
+
+
+# Prefer the AOT-built kernel (same code, no JIT warmup); fall back to compiling on first use
+_KERNEL = _load_kernel()
@@ -3,24 +3,29 @@ Position State Management.
 Tracks current position status and entry details.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 from typing import Optional
 
 
-class PositionStatus(Enum):
-    """Current position status."""
-    FLAT = "FLAT"
-    LONG = "LONG"
-    SHORT = "SHORT"
+class PositionStatus(IntEnum):
+    """
+    Current position status.
+    The value doubles as the PnL direction: +1 long, -1 short, 0 flat.
+    """
+    FLAT = 0
+    LONG = 1
+    SHORT = -1
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionState:
     """
     Tracks the current position status and entry details.
     Used by strategy to determine exit conditions and prevent duplicate entries.
+    
+    Slotted: read on every bar by the strategy, so no per-instance __dict__.
     """
     status: PositionStatus = PositionStatus.FLAT
     entry_price: Optional[float] = None
@@ -30,15 +35,15 @@ class PositionState:
     
     def is_flat(self) -> bool:
         """Check if position is flat (no open position)."""
-        return self.status == PositionStatus.FLAT
+        return self.status == 0
     
     def is_long(self) -> bool:
         """Check if in a long position."""
-        return self.status == PositionStatus.LONG
+        return self.status == 1
     
     def is_short(self) -> bool:
         """Check if in a short position."""
-        return self.status == PositionStatus.SHORT
+        return self.status == -1
     
     def open_long(self, price: float, time: datetime, bar_index: int, quantity: float) -> None:
         """Open a long position."""
@@ -72,19 +77,15 @@ class PositionState:
     
     def unrealized_pnl_pct(self, current_price: float) -> float:
         """Calculate unrealized PnL percentage."""
-        if self.entry_price is None or self.entry_price == 0:
+        entry_price = self.entry_price
+        if not entry_price:
             return 0.0
-        
-        if self.is_long():
-            return (current_price - self.entry_price) / self.entry_price
-        elif self.is_short():
-            return (self.entry_price - current_price) / self.entry_price
-        return 0.0
+        return self.status * (current_price - entry_price) / entry_price
     
     def to_dict(self) -> dict:
         """Convert to dictionary for logging."""
         return {
-            'status': self.status.value,
+            'status': self.status.name,
             'entry_price': self.entry_price,
             'entry_time': self.entry_time.isoformat() if self.entry_time else None,
             'entry_bar_index': self.entry_bar_index,
@@ -1,23 +1,26 @@
 """
-Abstract Strategy Base Class.
+Strategy Base Class and Interface.
 Defines the interface that all strategy implementations must follow.
 """
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional, Tuple
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional, Protocol, Tuple
 
 import pandas as pd
 
 from src.core.position_state import PositionState
 from src.core.trade_intent import TradeIntent, TradeReason
 
+# Naive UTC epoch - matches the timezone-naive UTC index of the kline DataFrames
+_EPOCH = datetime(1970, 1, 1)
 
-@dataclass
-class BarData:
+
+class BarData(NamedTuple):
     """
     Represents a single OHLCV bar.
+    
+    A NamedTuple rather than a dataclass: one is built for every bar of every
+    timeframe, and tuple construction and field access are both C-level.
     """
     timestamp: datetime
     open: float
@@ -29,68 +32,112 @@ class BarData:
     @classmethod
     def from_dict(cls, data: dict) -> 'BarData':
         """Create BarData from dictionary."""
+        ts = data['timestamp']
         return cls(
-            timestamp=data['timestamp'] if isinstance(data['timestamp'], datetime) else pd.to_datetime(data['timestamp']),
+            timestamp=_TIMESTAMP_CONVERTERS.get(type(ts), pd.to_datetime)(ts),
             open=float(data['open']),
             high=float(data['high']),
             low=float(data['low']),
             close=float(data['close']),
             volume=float(data['volume'])
         )
-
-
-class StrategyBase(ABC):
-    """
-    Abstract base class for trading strategies.
-    All strategy implementations must inherit from this class.
-    """
     
-    def __init__(self, symbol: str, quantity: float):
+    @classmethod
+    def from_row(cls, ts_ns: int, open: float, high: float, low: float, close: float, volume: float) -> 'BarData':
         """
-        Initialize strategy.
+        Create BarData from already-typed row values.
         
-        Args:
-            symbol: Trading symbol (e.g., 'BTCUSDT')
-            quantity: Position size for trades
+        Skips the type checks and float() casts of from_dict; callers pass values
+        straight out of float64 arrays and an epoch-nanosecond timestamp.
         """
-        self.symbol = symbol
-        self.quantity = quantity
-        self.position = PositionState()
-        self.bar_index = 0
+        return cls(pd.Timestamp(ts_ns), open, high, low, close, volume)
+    
+    @classmethod
+    def from_timestamp_ms(cls, ts_ms: int, open: float, high: float, low: float, close: float, volume: float) -> 'BarData':
+        """
+        Create BarData from an epoch-millisecond open time.
+        
+        The timestamp is a naive UTC datetime built with plain timedelta arithmetic,
+        avoiding both pd.to_datetime and the local-time conversion of fromtimestamp.
+        """
+        return cls(_EPOCH + timedelta(milliseconds=ts_ms), open, high, low, close, volume)
+    
+    @classmethod
+    def from_datetime(cls, timestamp: datetime, open: float, high: float, low: float, close: float, volume: float) -> 'BarData':
+        """Create BarData from a datetime and already-typed float values."""
+        return cls(timestamp, open, high, low, close, volume)
+
+
+# from_dict timestamp conversion by exact type; anything else goes through pd.to_datetime
+_TIMESTAMP_CONVERTERS = {
+    datetime: lambda ts: ts,
+    pd.Timestamp: lambda ts: ts,
+}
+
+
+class StrategyProtocol(Protocol):
+    """
+    Interface contract for trading strategies.
+    
+    Structural (typing-only): implementations are checked by type checkers
+    and carry no ABC dispatch cost at runtime.
+    """
     
-    @abstractmethod
     def on_bar(self, bar_entry: BarData, bar_conf: Optional[BarData] = None) -> Optional[TradeIntent]:
         """
         Called on each new bar. Main entry point for strategy logic.
         """
-        pass
+        ...
     
-    @abstractmethod
     def _evaluate_signals(self, bar_entry: BarData, bar_conf: Optional[BarData]) -> Optional[TradeIntent]:
         """
         Evaluate trading signals and return TradeIntent.
         """
-        pass
+        ...
 
-    @abstractmethod
     def should_enter_long(self, bar_entry: BarData, bar_conf: Optional[BarData]) -> bool:
         """Check for long entry signal."""
-        pass
+        ...
 
-    @abstractmethod
     def should_enter_short(self, bar_entry: BarData, bar_conf: Optional[BarData]) -> bool:
         """Check for short entry signal."""
-        pass
+        ...
 
-    @abstractmethod
-    def should_exit(self, bar_entry: BarData, position: PositionState) -> Optional[TradeReason]:
-        """Check for exit signal."""
-        pass
+    def should_exit(self, bar_entry: BarData, position: PositionState) -> Tuple[Optional[TradeReason], float]:
+        """Check for exit signal; returns (reason or None, unrealized PnL %)."""
+        ...
 
-    @abstractmethod
     def reset(self) -> None:
         """Reset strategy state for new backtest/session."""
-        pass
+        ...
+    
+    def get_position_state(self) -> PositionState:
+        """Get current position state."""
+        ...
+
+
+class StrategyBase:
+    """
+    Base class for trading strategies.
+    
+    Holds the state shared by every strategy; the signal methods are defined by
+    the concrete subclass and described by StrategyProtocol.
+    """
+    
+    __slots__ = ('symbol', 'quantity', 'position', 'bar_index')
+    
+    def __init__(self, symbol: str, quantity: float):
+        """
+        Initialize strategy.
+        
+        Args:
+            symbol: Trading symbol (e.g., 'BTCUSDT')
+            quantity: Position size for trades
+        """
+        self.symbol = symbol
+        self.quantity = quantity
+        self.position = PositionState()
+        self.bar_index = 0
     
     def get_position_state(self) -> PositionState:
         """Get current position state."""
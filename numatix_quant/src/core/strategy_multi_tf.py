@@ -5,12 +5,9 @@ Used by both backtesting and live trading modules.
 """
 
 from datetime import datetime
-from typing import Optional, Dict, List
-import sys
-import os
+from typing import Optional, Dict, NamedTuple, Tuple, final
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import numpy as np
 
 from src.core.strategy_base import StrategyBase, BarData
 from src.core.position_state import PositionState, PositionStatus
@@ -24,7 +21,35 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Enum members bound once; on_bar() paths read plain module globals
+_BUY, _SELL = TradeSide.BUY, TradeSide.SELL
+_LONG, _SHORT = TradeReason.ENTRY_LONG, TradeReason.ENTRY_SHORT
+_SL, _TP, _TO, _EXIT = (
+    TradeReason.EXIT_STOP_LOSS, TradeReason.EXIT_TAKE_PROFIT,
+    TradeReason.EXIT_TIMEOUT, TradeReason.EXIT_SIGNAL
+)
+
+
+class _SignalMasks(NamedTuple):
+    """Per-bar crossover/trend flags for a precomputed run (Python lists of bools)."""
+    bullish_crossover: list
+    bearish_crossover: list
+    exit_long: list
+    exit_short: list
+    trend_bullish: list
+    trend_bearish: list
+
+
+class StrategySnapshot(NamedTuple):
+    """Position status and current EMAs, read together once per live iteration."""
+    position_status: PositionStatus
+    ema_fast_entry: Optional[float]
+    ema_slow_entry: Optional[float]
+    ema_fast_conf: Optional[float]
+    ema_slow_conf: Optional[float]
 
+
+@final
 class StrategyMultiTF(StrategyBase):
     """
     Multi-Timeframe EMA Crossover Strategy.
@@ -55,6 +80,18 @@ class StrategyMultiTF(StrategyBase):
     5. Update EMA state for next bar
     """
     
+    # Slotted like StrategyBase, so on_bar's attribute reads/writes skip the instance __dict__
+    __slots__ = (
+        'ema_fast_entry_period', 'ema_slow_entry_period', 'ema_fast_conf_period', 'ema_slow_conf_period',
+        '_alpha_fast_entry', '_alpha_slow_entry', '_alpha_fast_conf', '_alpha_slow_conf',
+        'position_timeout_bars', 'stop_loss_pct', 'take_profit_pct',
+        '_ema_fast_entry', '_ema_slow_entry', '_ema_fast_conf', '_ema_slow_conf',
+        '_prev_ema_fast_entry', '_prev_ema_slow_entry', '_prev_ema_fast_conf', '_prev_ema_slow_conf',
+        '_prices_entry', '_prices_conf', '_n_prices_entry', '_n_prices_conf',
+        '_warmup_complete_entry', '_warmup_complete_conf',
+        '_precomputed_emas', '_precomputed_signals', '_precomputed_pos',
+    )
+    
     def __init__(self, symbol: str, quantity: float):
         """
         Initialize strategy with parameters.
@@ -71,6 +108,12 @@ class StrategyMultiTF(StrategyBase):
         self.ema_fast_conf_period = EMA_FAST_CONFIRMATION
         self.ema_slow_conf_period = EMA_SLOW_CONFIRMATION
         
+        # EMA smoothing factors, 2 / (period + 1)
+        self._alpha_fast_entry = 2.0 / (self.ema_fast_entry_period + 1)
+        self._alpha_slow_entry = 2.0 / (self.ema_slow_entry_period + 1)
+        self._alpha_fast_conf = 2.0 / (self.ema_fast_conf_period + 1)
+        self._alpha_slow_conf = 2.0 / (self.ema_slow_conf_period + 1)
+        
         # Position management parameters
         self.position_timeout_bars = POSITION_TIMEOUT_BARS
         self.stop_loss_pct = STOP_LOSS_PCT
@@ -88,14 +131,21 @@ class StrategyMultiTF(StrategyBase):
         self._prev_ema_fast_conf: Optional[float] = None
         self._prev_ema_slow_conf: Optional[float] = None
         
-        # Price history for initial EMA calculation
-        self._prices_entry: List[float] = []
-        self._prices_conf: List[float] = []
+        # Price history for initial EMA calculation (only the warmup window; freed once seeded)
+        self._prices_entry: Optional[np.ndarray] = np.empty(self.ema_slow_entry_period, dtype=np.float64)
+        self._prices_conf: Optional[np.ndarray] = np.empty(self.ema_slow_conf_period, dtype=np.float64)
+        self._n_prices_entry = 0
+        self._n_prices_conf = 0
         
         # Tracking
         self._warmup_complete_entry = False
         self._warmup_complete_conf = False
         
+        # Optional precomputed EMA streams and signal masks, one value per bar (see load_precomputed_emas)
+        self._precomputed_emas: Optional[tuple] = None
+        self._precomputed_signals: Optional[_SignalMasks] = None
+        self._precomputed_pos = 0
+        
         logger.info(f"StrategyMultiTF initialized: symbol={symbol}, quantity={quantity}")
         logger.info(f"EMA params: {TIMEFRAME_ENTRY}({self.ema_fast_entry_period}/{self.ema_slow_entry_period}), "
                    f"{TIMEFRAME_CONFIRMATION}({self.ema_fast_conf_period}/{self.ema_slow_conf_period})")
@@ -105,55 +155,44 @@ class StrategyMultiTF(StrategyBase):
         self.position = PositionState()
         self.bar_index = 0
         
-        self._ema_fast_15m = None
-        self._ema_slow_15m = None
-        self._ema_fast_1h = None
-        self._ema_slow_1h = None
+        self._ema_fast_entry = None
+        self._ema_slow_entry = None
+        self._ema_fast_conf = None
+        self._ema_slow_conf = None
         
         self._prev_ema_fast_entry = None
         self._prev_ema_slow_entry = None
         self._prev_ema_fast_conf = None
         self._prev_ema_slow_conf = None
         
-        self._prices_entry = []
-        self._prices_conf = []
+        self._prices_entry = np.empty(self.ema_slow_entry_period, dtype=np.float64)
+        self._prices_conf = np.empty(self.ema_slow_conf_period, dtype=np.float64)
+        self._n_prices_entry = 0
+        self._n_prices_conf = 0
         
         self._warmup_complete_entry = False
         self._warmup_complete_conf = False
+        self._precomputed_emas = None
+        self._precomputed_signals = None
+        self._precomputed_pos = 0
         
         logger.info("Strategy state reset")
     
-    def _calculate_ema(self, price: float, prev_ema: Optional[float], period: int) -> float:
-        """
-        Calculate EMA using standard formula.
-        
-        Args:
-            price: Current price
-            prev_ema: Previous EMA value (None for first calculation)
-            period: EMA period
-        
-        Returns:
-            New EMA value
-        """
-        multiplier = 2 / (period + 1)
-        if prev_ema is None:
-            return price
-        return (price - prev_ema) * multiplier + prev_ema
-    
-    def _calculate_initial_sma(self, prices: List[float], period: int) -> Optional[float]:
+    def _calculate_initial_sma(self, prices: np.ndarray, count: int, period: int) -> Optional[float]:
         """
         Calculate initial SMA for EMA seeding.
         
         Args:
-            prices: List of closing prices
+            prices: Warmup price buffer
+            count: Number of prices written to the buffer
             period: SMA period
         
         Returns:
             SMA value or None if insufficient data
         """
-        if len(prices) < period:
+        if count < period:
             return None
-        return sum(prices[-period:]) / period
+        return float(prices[count - period:count].sum()) / period
     
     def _update_emas_entry(self, close_price: float) -> None:
         """
@@ -161,29 +200,27 @@ class StrategyMultiTF(StrategyBase):
         
         CRITICAL: Previous values must be captured BEFORE this call.
         """
-        self._prices_entry.append(close_price)
-        
         # Check if we have enough data for initial SMA
         if not self._warmup_complete_entry:
-            if len(self._prices_entry) >= self.ema_slow_entry_period:
+            self._prices_entry[self._n_prices_entry] = close_price
+            self._n_prices_entry += 1
+            if self._n_prices_entry >= self.ema_slow_entry_period:
                 # Initialize with SMA
                 self._ema_fast_entry = self._calculate_initial_sma(
-                    self._prices_entry, self.ema_fast_entry_period
+                    self._prices_entry, self._n_prices_entry, self.ema_fast_entry_period
                 )
                 self._ema_slow_entry = self._calculate_initial_sma(
-                    self._prices_entry, self.ema_slow_entry_period
+                    self._prices_entry, self._n_prices_entry, self.ema_slow_entry_period
                 )
                 self._warmup_complete_entry = True
-                logger.debug(f"Entry EMA warmup complete: fast={self._ema_fast_entry:.2f}, slow={self._ema_slow_entry:.2f}")
+                # Prices are only needed for the seed
+                self._prices_entry = None
+                logger.debug("Entry EMA warmup complete: fast=%.2f, slow=%.2f", self._ema_fast_entry, self._ema_slow_entry)
             return
         
         # Update EMAs incrementally
-        self._ema_fast_entry = self._calculate_ema(
-            close_price, self._ema_fast_entry, self.ema_fast_entry_period
-        )
-        self._ema_slow_entry = self._calculate_ema(
-            close_price, self._ema_slow_entry, self.ema_slow_entry_period
-        )
+        self._ema_fast_entry += self._alpha_fast_entry * (close_price - self._ema_fast_entry)
+        self._ema_slow_entry += self._alpha_slow_entry * (close_price - self._ema_slow_entry)
     
     def _update_emas_conf(self, close_price: float) -> None:
         """
@@ -191,30 +228,82 @@ class StrategyMultiTF(StrategyBase):
         
         CRITICAL: Previous values must be captured BEFORE this call.
         """
-        self._prices_conf.append(close_price)
-        
         # Check if we have enough data for initial SMA
         if not self._warmup_complete_conf:
-            if len(self._prices_conf) >= self.ema_slow_conf_period:
+            self._prices_conf[self._n_prices_conf] = close_price
+            self._n_prices_conf += 1
+            if self._n_prices_conf >= self.ema_slow_conf_period:
                 # Initialize with SMA
                 self._ema_fast_conf = self._calculate_initial_sma(
-                    self._prices_conf, self.ema_fast_conf_period
+                    self._prices_conf, self._n_prices_conf, self.ema_fast_conf_period
                 )
                 self._ema_slow_conf = self._calculate_initial_sma(
-                    self._prices_conf, self.ema_slow_conf_period
+                    self._prices_conf, self._n_prices_conf, self.ema_slow_conf_period
                 )
                 self._warmup_complete_conf = True
-                logger.debug(f"Confirmation EMA warmup complete: fast={self._ema_fast_conf:.2f}, slow={self._ema_slow_conf:.2f}")
+                # Prices are only needed for the seed
+                self._prices_conf = None
+                logger.debug("Confirmation EMA warmup complete: fast=%.2f, slow=%.2f", self._ema_fast_conf, self._ema_slow_conf)
             return
         
         # Update EMAs incrementally
-        self._ema_fast_conf = self._calculate_ema(
-            close_price, self._ema_fast_conf, self.ema_fast_conf_period
+        self._ema_fast_conf += self._alpha_fast_conf * (close_price - self._ema_fast_conf)
+        self._ema_slow_conf += self._alpha_slow_conf * (close_price - self._ema_slow_conf)
+    
+    def load_precomputed_emas(
+        self,
+        ema_fast_entry: np.ndarray,
+        ema_slow_entry: np.ndarray,
+        ema_fast_conf: np.ndarray,
+        ema_slow_conf: np.ndarray
+    ) -> None:
+        """
+        Take EMAs from precomputed series instead of updating them bar by bar.
+        
+        For backtests, where the whole history is known: the arrays come from
+        indicators.precompute_emas, hold one value per bar from the current
+        bar_index on, and are NaN until the EMAs are seeded. The crossover and
+        trend conditions are derived from them once as whole-run masks.
+        """
+        # Python lists: per-bar indexing then returns plain floats/bools
+        self._precomputed_emas = (
+            self.bar_index,
+            ema_fast_entry.tolist(),
+            ema_slow_entry.tolist(),
+            ema_fast_conf.tolist(),
+            ema_slow_conf.tolist(),
         )
-        self._ema_slow_conf = self._calculate_ema(
-            close_price, self._ema_slow_conf, self.ema_slow_conf_period
+        
+        # Crossover and trend masks for the whole run (NaN compares False, like the None checks)
+        diff = ema_fast_entry - ema_slow_entry
+        prev_diff = np.concatenate(([np.nan], diff[:-1]))
+        self._precomputed_signals = _SignalMasks(
+            bullish_crossover=((prev_diff <= 0) & (diff > 0)).tolist(),
+            bearish_crossover=((prev_diff >= 0) & (diff < 0)).tolist(),
+            exit_long=((prev_diff > 0) & (diff <= 0)).tolist(),
+            exit_short=((prev_diff < 0) & (diff >= 0)).tolist(),
+            trend_bullish=(ema_fast_conf > ema_slow_conf).tolist(),
+            trend_bearish=(ema_fast_conf < ema_slow_conf).tolist(),
         )
     
+    def _read_precomputed_emas(self) -> None:
+        """Set the current EMAs from the precomputed streams (NaN = not seeded yet)."""
+        start, fast_entry, slow_entry, fast_conf, slow_conf = self._precomputed_emas
+        i = self.bar_index - start
+        self._precomputed_pos = i
+        
+        fast = fast_entry[i]
+        if fast == fast:
+            self._ema_fast_entry = fast
+            self._ema_slow_entry = slow_entry[i]
+            self._warmup_complete_entry = True
+        
+        fast = fast_conf[i]
+        if fast == fast:
+            self._ema_fast_conf = fast
+            self._ema_slow_conf = slow_conf[i]
+            self._warmup_complete_conf = True
+    
     def on_bar(self, bar_entry: BarData, bar_conf: Optional[BarData] = None) -> Optional[TradeIntent]:
         """
         Process new bar data and generate trade signals.
@@ -228,7 +317,7 @@ class StrategyMultiTF(StrategyBase):
         Returns:
             TradeIntent if a trade should be executed
         """
-        logger.debug(f"on_bar: bar_index={self.bar_index}, close={bar_entry.close:.2f}")
+        logger.debug("on_bar: bar_index=%d, close=%.2f", self.bar_index, bar_entry.close)
         
         # STEP 1: Capture previous EMA values BEFORE any updates
         self._prev_ema_fast_entry = self._ema_fast_entry
@@ -236,12 +325,16 @@ class StrategyMultiTF(StrategyBase):
         self._prev_ema_fast_conf = self._ema_fast_conf
         self._prev_ema_slow_conf = self._ema_slow_conf
         
-        # STEP 2: Update entry EMAs
-        self._update_emas_entry(bar_entry.close)
-        
-        # STEP 3: Update confirmation EMAs if new bar provided
-        if bar_conf is not None:
-            self._update_emas_conf(bar_conf.close)
+        if self._precomputed_emas is not None:
+            # STEP 2-3: Read this bar's EMAs from the precomputed streams
+            self._read_precomputed_emas()
+        else:
+            # STEP 2: Update entry EMAs
+            self._update_emas_entry(bar_entry.close)
+            
+            # STEP 3: Update confirmation EMAs if new bar provided
+            if bar_conf is not None:
+                self._update_emas_conf(bar_conf.close)
         
         # STEP 4: Evaluate signals using _evaluate_signals (SINGLE SOURCE OF TRUTH)
         trade_intent = self._evaluate_signals(bar_entry, bar_conf)
@@ -255,29 +348,31 @@ class StrategyMultiTF(StrategyBase):
         """
         Evaluate trading signals and return TradeIntent.
         """
+        position = self.position
+        bar_index = self.bar_index
+        
         # 1. Warmup check
         if not self.is_warmup_complete():
             return None
 
         # 2. EXIT check
-        if not self.position.is_flat():
+        if not position.is_flat():
             # SAME-BAR EXIT PROTECTION: Must hold for at least 1 bar
             # This prevents exiting on the same bar as entry, ensuring:
             # - Deterministic, bar-close-based exit decisions
             # - Live/backtest parity
             # - No zero-PnL trades with identical timestamps
-            if self.position.bars_held(self.bar_index) < 1:
-                logger.debug(f"Exit blocked: position opened this bar (bar_index={self.bar_index})")
+            if position.bars_held(bar_index) < 1:
+                logger.debug("Exit blocked: position opened this bar (bar_index=%d)", bar_index)
                 return None
             
-            exit_reason = self.should_exit(bar_entry, self.position)
+            exit_reason, pnl_pct = self.should_exit(bar_entry, position)
             if exit_reason:
-                # Calculate metrics BEFORE closing position
-                pnl_pct = self.position.unrealized_pnl_pct(bar_entry.close)
-                pnl = pnl_pct * self.position.entry_price * self.position.quantity
-                duration = self.position.bars_held(self.bar_index)
+                # Calculate metrics BEFORE closing position (pnl_pct comes from should_exit)
+                pnl = pnl_pct * position.entry_price * position.quantity
+                duration = position.bars_held(bar_index)
                 
-                side = TradeSide.SELL if self.position.is_long() else TradeSide.BUY
+                side = _SELL if position.is_long() else _BUY
                 intent = TradeIntent(
                     symbol=self.symbol,
                     side=side,
@@ -289,29 +384,29 @@ class StrategyMultiTF(StrategyBase):
                     pnl_pct=pnl_pct,
                     duration_bars=duration
                 )
-                self.position.close()
+                position.close()
                 return intent
 
         # 3. ENTRY check
-        if self.position.is_flat():
+        if position.is_flat():
             if self.should_enter_long(bar_entry, bar_conf):
-                self.position.open_long(bar_entry.close, bar_entry.timestamp, self.bar_index, self.quantity)
+                position.open_long(bar_entry.close, bar_entry.timestamp, bar_index, self.quantity)
                 return TradeIntent(
                     symbol=self.symbol,
-                    side=TradeSide.BUY,
+                    side=_BUY,
                     quantity=self.quantity,
-                    reason=TradeReason.ENTRY_LONG,
+                    reason=_LONG,
                     timestamp=bar_entry.timestamp,
                     price=bar_entry.close
                 )
             
             if self.should_enter_short(bar_entry, bar_conf):
-                self.position.open_short(bar_entry.close, bar_entry.timestamp, self.bar_index, self.quantity)
+                position.open_short(bar_entry.close, bar_entry.timestamp, bar_index, self.quantity)
                 return TradeIntent(
                     symbol=self.symbol,
-                    side=TradeSide.SELL,
+                    side=_SELL,
                     quantity=self.quantity,
-                    reason=TradeReason.ENTRY_SHORT,
+                    reason=_SHORT,
                     timestamp=bar_entry.timestamp,
                     price=bar_entry.close
                 )
@@ -324,16 +419,24 @@ class StrategyMultiTF(StrategyBase):
         """
         if bar_conf is None: return False
         
-        trend_bullish = self._ema_fast_conf > self._ema_slow_conf
-        bullish_crossover = (
-            self._prev_ema_fast_entry is not None and
-            self._prev_ema_slow_entry is not None and
-            self._prev_ema_fast_entry <= self._prev_ema_slow_entry and
-            self._ema_fast_entry > self._ema_slow_entry
-        )
+        masks = self._precomputed_signals
+        if masks is not None:
+            i = self._precomputed_pos
+            bullish_crossover = masks.bullish_crossover[i]
+            trend_bullish = masks.trend_bullish[i]
+        else:
+            pfe, pse = self._prev_ema_fast_entry, self._prev_ema_slow_entry
+            fe, se = self._ema_fast_entry, self._ema_slow_entry
+            trend_bullish = self._ema_fast_conf > self._ema_slow_conf
+            bullish_crossover = (
+                pfe is not None and
+                pse is not None and
+                pfe <= pse and
+                fe > se
+            )
         
         if bullish_crossover and trend_bullish:
-            logger.info(f"SIGNAL LONG: Crossover + Bullish Trend ({TIMEFRAME_CONFIRMATION})")
+            logger.info("SIGNAL LONG: Crossover + Bullish Trend (%s)", TIMEFRAME_CONFIRMATION)
             return True
         return False
 
@@ -343,22 +446,34 @@ class StrategyMultiTF(StrategyBase):
         """
         if bar_conf is None: return False
 
-        trend_bearish = self._ema_fast_conf < self._ema_slow_conf
-        bearish_crossover = (
-            self._prev_ema_fast_entry is not None and
-            self._prev_ema_slow_entry is not None and
-            self._prev_ema_fast_entry >= self._prev_ema_slow_entry and
-            self._ema_fast_entry < self._ema_slow_entry
-        )
+        masks = self._precomputed_signals
+        if masks is not None:
+            i = self._precomputed_pos
+            bearish_crossover = masks.bearish_crossover[i]
+            trend_bearish = masks.trend_bearish[i]
+        else:
+            pfe, pse = self._prev_ema_fast_entry, self._prev_ema_slow_entry
+            fe, se = self._ema_fast_entry, self._ema_slow_entry
+            trend_bearish = self._ema_fast_conf < self._ema_slow_conf
+            bearish_crossover = (
+                pfe is not None and
+                pse is not None and
+                pfe >= pse and
+                fe < se
+            )
 
         if bearish_crossover and trend_bearish:
-            logger.info(f"SIGNAL SHORT: Crossover + Bearish Trend ({TIMEFRAME_CONFIRMATION})")
+            logger.info("SIGNAL SHORT: Crossover + Bearish Trend (%s)", TIMEFRAME_CONFIRMATION)
             return True
         return False
 
-    def should_exit(self, bar_entry: BarData, position: PositionState) -> Optional[TradeReason]:
+    def should_exit(self, bar_entry: BarData, position: PositionState) -> Tuple[Optional[TradeReason], float]:
         """
         Check for exit signals.
+        
+        Returns:
+            (exit reason or None, unrealized PnL % at the bar close), so the
+            caller can fill the exit intent without recomputing it
         """
         current_price = bar_entry.close
         pnl_pct = position.unrealized_pnl_pct(current_price)
@@ -366,31 +481,35 @@ class StrategyMultiTF(StrategyBase):
 
         # 1. Stop Loss
         if pnl_pct <= -self.stop_loss_pct:
-            return TradeReason.EXIT_STOP_LOSS
+            return _SL, pnl_pct
 
         # 2. Take Profit
         if pnl_pct >= self.take_profit_pct:
-            return TradeReason.EXIT_TAKE_PROFIT
+            return _TP, pnl_pct
 
         # 3. Timeout
         if bars_held >= self.position_timeout_bars:
-            return TradeReason.EXIT_TIMEOUT
+            return _TO, pnl_pct
 
         # 4. Signal Exit (Opposite Crossover)
-        if position.is_long():
+        is_long = position.is_long()
+        masks = self._precomputed_signals
+        if masks is not None:
+            exit_mask = masks.exit_long if is_long else masks.exit_short
+            return (_EXIT if exit_mask[self._precomputed_pos] else None), pnl_pct
+        
+        pfe, pse = self._prev_ema_fast_entry, self._prev_ema_slow_entry
+        fe, se = self._ema_fast_entry, self._ema_slow_entry
+        if is_long:
             # Exit long if bearish crossover
-            if (self._prev_ema_fast_entry > self._prev_ema_slow_entry and 
-                self._ema_fast_entry <= self._ema_slow_entry):
-                return TradeReason.EXIT_SIGNAL
+            if pfe > pse and fe <= se:
+                return _EXIT, pnl_pct
         else: # Short
             # Exit short if bullish crossover
-            if (self._prev_ema_fast_entry < self._prev_ema_slow_entry and 
-                self._ema_fast_entry >= self._ema_slow_entry):
-                return TradeReason.EXIT_SIGNAL
+            if pfe < pse and fe >= se:
+                return _EXIT, pnl_pct
 
-        return None
-        
-        return None
+        return None, pnl_pct
     
     def get_ema_state(self) -> Dict:
         """Get current EMA state for debugging/logging."""
@@ -401,10 +520,18 @@ class StrategyMultiTF(StrategyBase):
             'ema_slow_conf': self._ema_slow_conf,
             'warmup_complete_entry': self._warmup_complete_entry,
             'warmup_complete_conf': self._warmup_complete_conf,
-            'prices_entry_count': len(self._prices_entry),
-            'prices_conf_count': len(self._prices_conf)
+            'prices_entry_count': self._n_prices_entry,
+            'prices_conf_count': self._n_prices_conf
         }
     
+    def snapshot(self) -> StrategySnapshot:
+        """Position status and EMAs in one tuple (cheaper than get_ema_state's dict)."""
+        return StrategySnapshot(
+            self.position.status,
+            self._ema_fast_entry, self._ema_slow_entry,
+            self._ema_fast_conf, self._ema_slow_conf
+        )
+    
     def is_warmup_complete(self) -> bool:
         """Check if both timeframes have completed warmup."""
         return self._warmup_complete_entry and self._warmup_complete_conf
@@ -27,10 +27,12 @@ class TradeReason(Enum):
     CLOSE_SHORT = "CLOSE_SHORT"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeIntent:
     """
     Represents intention to execute a trade.
+    
+    Immutable and slotted: no per-instance __dict__, and safe to share once built.
     """
     symbol: str
     side: TradeSide
@@ -56,10 +58,12 @@ class TradeIntent:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeResult:
     """
     Result of an executed trade.
+    
+    Immutable and slotted, like TradeIntent.
     """
     timestamp: datetime
     symbol: str
@@ -83,5 +87,5 @@ class TradeResult:
             'reason': self.reason,
             'pnl': self.pnl if self.pnl is not None else '',
             'pnl_pct': self.pnl_pct if self.pnl_pct is not None else '',
-            'duration_bars': self.duration_bars if duration_bars is not None else ''
+            'duration_bars': self.duration_bars if self.duration_bars is not None else ''
         }
@@ -6,23 +6,23 @@ CRITICAL: This wrapper does NOT duplicate strategy logic.
 It delegates ALL signal generation to StrategyMultiTF._evaluate_signals().
 """
 
-import sys
-import os
+import logging
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 
 import pandas as pd
 import numpy as np
 from backtesting import Strategy
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from src.core.strategy_base import BarData
 from src.core.strategy_multi_tf import StrategyMultiTF
 from src.core.trade_intent import TradeIntent, TradeSide, TradeReason
+from src.core import numba_core
+from src.core.indicators import precompute_emas
 from src.core.position_state import PositionStatus
 from src.utils.logger import get_logger, log_signal, log_order, log_fill
-from src.utils.csv_writer import format_trade_for_csv
+from src.utils.csv_writer import TRADE_CSV_HEADERS, format_trades_bulk
 from config.config import (
     SYMBOL, TRADE_QUANTITY, TIMEFRAME_ENTRY, TIMEFRAME_CONFIRMATION,
     EMA_FAST_ENTRY, EMA_SLOW_ENTRY, EMA_FAST_CONFIRMATION, EMA_SLOW_CONFIRMATION,
@@ -31,6 +31,64 @@ from config.config import (
 
 logger = get_logger(__name__)
 
+# Enum members bound once for the per-trade paths
+_BUY, _SELL = TradeSide.BUY, TradeSide.SELL
+_LONG, _SHORT = TradeReason.ENTRY_LONG, TradeReason.ENTRY_SHORT
+
+
+def _interval_ns(interval: str) -> int:
+    """Length of a Binance interval ('15m', '1h', ...) in ns; 1 (no flooring) if not minutes/hours."""
+    if interval.endswith('m'):
+        return int(interval[:-1]) * 60 * 1_000_000_000
+    if interval.endswith('h'):
+        return int(interval[:-1]) * 3600 * 1_000_000_000
+    return 1
+
+
+_CONF_PERIOD_NS = _interval_ns(TIMEFRAME_CONFIRMATION)
+
+
+def conf_index_for_entry(
+    entry_ts_ns: np.ndarray,
+    conf_ts_ns: np.ndarray,
+    period_ns: int = _CONF_PERIOD_NS
+) -> np.ndarray:
+    """
+    Map every entry bar to its confirmation bar in one vectorized pass.
+    
+    Each entry open time is floored to the confirmation period, and the latest
+    confirmation bar opening at or before it is picked.
+    
+    Args:
+        entry_ts_ns: Entry bar open times (epoch ns)
+        conf_ts_ns: Confirmation bar open times (epoch ns, sorted)
+        period_ns: Confirmation interval length in ns
+    
+    Returns:
+        int32 confirmation row per entry bar (-1 where none exists yet)
+    """
+    floor_ns = (np.asarray(entry_ts_ns, dtype=np.int64) // period_ns) * period_ns
+    return (np.searchsorted(conf_ts_ns, floor_ns, side='right') - 1).astype(np.int32)
+
+
+@dataclass(slots=True)
+class _SignalSlot:
+    """
+    Mutable, reused stand-in for TradeIntent on the kernel replay path.
+    
+    Same field names as TradeIntent so _execute_trade reads either; refilled per
+    event instead of allocating a new (frozen) intent each time.
+    """
+    symbol: str = ''
+    side: TradeSide = TradeSide.BUY
+    quantity: float = 0.0
+    reason: TradeReason = TradeReason.ENTRY_LONG
+    timestamp: Optional[datetime] = None
+    price: Optional[float] = None
+    pnl: Optional[float] = None
+    pnl_pct: Optional[float] = None
+    duration_bars: Optional[int] = None
+
 
 class BacktestStrategyWrapper(Strategy):
     """
@@ -51,13 +109,30 @@ class BacktestStrategyWrapper(Strategy):
     take_profit_pct = TAKE_PROFIT_PCT
     position_timeout = POSITION_TIMEOUT_BARS
     
+    # Replay the strategy with the compiled kernel (src/core/numba_core.py) instead
+    # of calling on_bar() each bar. Off by default; needs precomputed conf alignment.
+    # The StrategyMultiTF instance is not stepped in this mode.
+    use_kernel = False
+    
+    # Compute the four EMA streams for the whole run up front and have on_bar()
+    # read them instead of updating incrementally. Needs precomputed conf alignment.
+    precompute_emas = False
+    
     # Shared state (class-level for access after backtest)
     _strategy_instance: Optional[StrategyMultiTF] = None
-    _trade_log: List[Dict] = []
+    # Raw trade rows in TRADE_CSV_HEADERS order; formatted in one pass by get_trade_frame()
+    _trade_log: List[Tuple] = []
     _conf_data: Optional[pd.DataFrame] = None
-    _last_conf_bar_time: Optional[datetime] = None
     _current_conf_bar: Optional[BarData] = None
     
+    # Confirmation bars as epoch-ns open times + float64 OHLCV rows
+    _conf_ts: Optional[np.ndarray] = None
+    _conf_values: Optional[np.ndarray] = None
+    _last_conf_pos: int = -1
+    
+    # Optional caller-supplied alignment: entry bar i -> confirmation row _conf_idx[i] (-1 = none yet)
+    _conf_idx: Optional[np.ndarray] = None
+    
     def init(self):
         """Initialize strategy wrapper."""
         # Create fresh strategy instance
@@ -68,14 +143,54 @@ class BacktestStrategyWrapper(Strategy):
         
         # Store for external access
         BacktestStrategyWrapper._strategy_instance = self._strategy
+        
+        # Bound once; next() calls it every bar
+        self._on_bar = self._strategy.on_bar
         BacktestStrategyWrapper._trade_log = []
-        BacktestStrategyWrapper._last_conf_bar_time = None
         BacktestStrategyWrapper._current_conf_bar = None
+        BacktestStrategyWrapper._last_conf_pos = -1
+        
+        # Entry open times converted once (data is unsliced during init); next() only indexes them
+        entry_ts_ns = self.data.index.as_unit('ns').asi8
+        self._entry_ts_ms: List[int] = (entry_ts_ns // 1_000_000).tolist()
+        
+        # Entry OHLCV as one float64 [N, 5] block, kept as row lists so next() reads plain floats
+        close = np.asarray(self.data.Close, dtype=np.float64)
+        # Volume presence is invariant over a run, so it is decided here rather than per bar
+        self._has_volume = hasattr(self.data, 'Volume') and len(self.data.Volume) > 0
+        volume = self.data.Volume if self._has_volume else np.zeros(len(close))
+        self._ohlcv = np.column_stack([self.data.Open, self.data.High, self.data.Low, close, volume]).astype(np.float64)
+        self._ohlcv_rows: List[List[float]] = self._ohlcv.tolist()
+        
+        # Entry bar -> confirmation row for this run
+        self._conf_ix_for_entry: Optional[np.ndarray] = BacktestStrategyWrapper._conf_idx
+        if self._conf_ix_for_entry is None and BacktestStrategyWrapper._conf_ts is not None:
+            self._conf_ix_for_entry = conf_index_for_entry(entry_ts_ns, BacktestStrategyWrapper._conf_ts)
         
         # Track entry for proper exit logging
         self._entry_price: Optional[float] = None
         self._entry_time: Optional[datetime] = None
         
+        # Kernel mode: full close series (data is unsliced during init), events built on first next()
+        self._kernel_close: Optional[np.ndarray] = None
+        self._kernel_events: Optional[numba_core.TradeEvents] = None
+        self._kernel_start = 0
+        self._kernel_cursor = 0
+        self._kernel_slot = _SignalSlot(symbol=self._strategy.symbol, quantity=self._strategy.quantity)
+        if self.use_kernel:
+            if self._conf_ix_for_entry is None:
+                logger.warning("use_kernel needs set_conf_data(); using on_bar()")
+            else:
+                self._kernel_close = close
+        
+        # Precomputed EMAs: full close series, loaded into the strategy on first next()
+        self._ema_close: Optional[np.ndarray] = None
+        if self.precompute_emas:
+            if self._conf_ix_for_entry is None:
+                logger.warning("precompute_emas needs set_conf_data(); updating EMAs per bar")
+            else:
+                self._ema_close = close
+        
         logger.info("BacktestStrategyWrapper initialized")
     
     def next(self):
@@ -83,97 +198,132 @@ class BacktestStrategyWrapper(Strategy):
         Called on each bar by backtesting.py.
         Delegates to StrategyMultiTF.on_bar() for signal generation.
         """
-        # Get current timestamp
-        current_time = self.data.index[-1]
-        if hasattr(current_time, 'to_pydatetime'):
-            current_time = current_time.to_pydatetime()
+        if self._kernel_close is not None:
+            self._next_kernel()
+            return
         
-        # Create BarData for entry timeframe
-        bar_entry = BarData(
-            timestamp=current_time,
-            open=self.data.Open[-1],
-            high=self.data.High[-1],
-            low=self.data.Low[-1],
-            close=self.data.Close[-1],
-            volume=self.data.Volume[-1] if hasattr(self.data, 'Volume') and len(self.data.Volume) > 0 else 0
+        bar_pos = len(self.data) - 1
+        if self._ema_close is not None:
+            self._load_precomputed_emas(bar_pos)
+        
+        # Create BarData for entry timeframe (index is naive UTC, converted from epoch ms)
+        bar_entry = BarData.from_timestamp_ms(
+            self._entry_ts_ms[bar_pos],
+            *self._ohlcv_rows[bar_pos]
         )
         
-        # Get corresponding confirmation bar with proper alignment
-        bar_conf = self._get_aligned_conf_bar(current_time)
+        # Get corresponding confirmation bar from the precomputed alignment
+        bar_conf = None
+        if self._conf_ix_for_entry is not None:
+            bar_conf = self._get_indexed_conf_bar(bar_pos)
         
         # SINGLE SOURCE OF TRUTH: Call strategy.on_bar()
-        trade_intent = self._strategy.on_bar(bar_entry, bar_conf)
+        trade_intent = self._on_bar(bar_entry, bar_conf)
         
         # Execute trade if signal generated
         if trade_intent is not None:
             self._execute_trade(trade_intent, bar_entry)
     
-    def _get_aligned_conf_bar(self, timestamp_entry: datetime) -> Optional[BarData]:
+    def _load_precomputed_emas(self, bar_pos: int) -> None:
         """
-        Get the most recent completed confirmation bar for a given entry timestamp.
+        Compute the EMA streams from the first bar next() sees and hand them to the strategy.
         """
-        if BacktestStrategyWrapper._conf_data is None or BacktestStrategyWrapper._conf_data.empty:
-            return None
+        strategy = self._strategy
+        strategy.load_precomputed_emas(*precompute_emas(
+            self._ema_close[bar_pos:],
+            self._conf_ix_for_entry[bar_pos:],
+            BacktestStrategyWrapper._conf_values[:, 3],
+            strategy.ema_fast_entry_period, strategy.ema_slow_entry_period,
+            strategy.ema_fast_conf_period, strategy.ema_slow_conf_period
+        ))
+        self._ema_close = None
+    
+    def _next_kernel(self) -> None:
+        """
+        Kernel mode next(): replay precomputed trade events for this bar.
+        """
+        bar_pos = len(self.data) - 1
         
-        # Use proper alignment based on configured confirmation interval
-        conf_time = None
-        if TIMEFRAME_CONFIRMATION.endswith('m'):
-            minutes = int(TIMEFRAME_CONFIRMATION[:-1])
-            conf_time = timestamp_entry.replace(
-                minute=(timestamp_entry.minute // minutes) * minutes,
-                second=0, microsecond=0
+        # backtesting.py starts calling next() after bar 0; replay from the first bar we see
+        if self._kernel_events is None:
+            self._kernel_start = bar_pos
+            strategy = self._strategy
+            self._kernel_events = numba_core.run_backtest(
+                self._kernel_close[bar_pos:],
+                self._conf_ix_for_entry[bar_pos:],
+                BacktestStrategyWrapper._conf_values[:, 3],
+                strategy.ema_fast_entry_period, strategy.ema_slow_entry_period,
+                strategy.ema_fast_conf_period, strategy.ema_slow_conf_period,
+                strategy.quantity, strategy.stop_loss_pct, strategy.take_profit_pct,
+                strategy.position_timeout_bars
             )
-        elif TIMEFRAME_CONFIRMATION.endswith('h'):
-            hours = int(TIMEFRAME_CONFIRMATION[:-1])
-            conf_time = timestamp_entry.replace(
-                hour=(timestamp_entry.hour // hours) * hours,
-                minute=0, second=0, microsecond=0
+            logger.info(f"Kernel produced {len(self._kernel_events.bar)} trade events")
+        
+        events = self._kernel_events
+        k = self._kernel_cursor
+        if k >= len(events.bar) or events.bar[k] != bar_pos - self._kernel_start:
+            return
+        self._kernel_cursor = k + 1
+        
+        bar_entry = BarData.from_timestamp_ms(
+            self._entry_ts_ms[bar_pos],
+            *self._ohlcv_rows[bar_pos]
+        )
+        reason = numba_core.EVENT_REASONS[events.code[k]]
+        is_entry = reason in (_LONG, _SHORT)
+        
+        # Events alternate entry/exit, so an exit closes the position opened by event k-1
+        opening = reason if is_entry else numba_core.EVENT_REASONS[events.code[k - 1]]
+        is_long = opening is _LONG
+        side = _BUY if is_long == is_entry else _SELL
+        
+        slot = self._kernel_slot
+        slot.side = side
+        slot.reason = reason
+        slot.timestamp = bar_entry.timestamp
+        slot.price = bar_entry.close
+        slot.pnl = None if is_entry else float(events.pnl[k])
+        slot.pnl_pct = None if is_entry else float(events.pnl_pct[k])
+        slot.duration_bars = None if is_entry else int(events.duration_bars[k])
+        
+        self._execute_trade(slot, bar_entry)
+    
+    def _get_indexed_conf_bar(self, entry_pos: int) -> Optional[BarData]:
+        """
+        Get the confirmation bar for an entry bar position via the precomputed index.
+        """
+        return self._conf_bar_at(self._conf_ix_for_entry[entry_pos])
+    
+    def _conf_bar_at(self, conf_pos: int) -> Optional[BarData]:
+        """
+        BarData for confirmation row conf_pos (None when negative), cached until the row changes.
+        """
+        if conf_pos < 0:
+            return None
+        
+        if conf_pos != BacktestStrategyWrapper._last_conf_pos:
+            BacktestStrategyWrapper._last_conf_pos = conf_pos
+            BacktestStrategyWrapper._current_conf_bar = BarData.from_row(
+                int(BacktestStrategyWrapper._conf_ts[conf_pos]),
+                *BacktestStrategyWrapper._conf_values[conf_pos]
             )
-        else:
-            conf_time = timestamp_entry
         
-        try:
-            # Get bars up to and including the current period
-            mask = BacktestStrategyWrapper._conf_data.index <= conf_time
-            valid_bars = BacktestStrategyWrapper._conf_data[mask]
-            
-            if valid_bars.empty:
-                return None
-            
-            # Get the most recent completed bar
-            latest_bar_time = valid_bars.index[-1]
-            
-            # Only update if this is a new bar (optimization)
-            if BacktestStrategyWrapper._last_conf_bar_time != latest_bar_time:
-                BacktestStrategyWrapper._last_conf_bar_time = latest_bar_time
-                row = valid_bars.iloc[-1]
-                
-                BacktestStrategyWrapper._current_conf_bar = BarData(
-                    timestamp=latest_bar_time.to_pydatetime() if hasattr(latest_bar_time, 'to_pydatetime') else latest_bar_time,
-                    open=float(row['Open']),
-                    high=float(row['High']),
-                    low=float(row['Low']),
-                    close=float(row['Close']),
-                    volume=float(row.get('Volume', 0))
-                )
-            
-            return BacktestStrategyWrapper._current_conf_bar
-            
-        except Exception as e:
-            logger.debug(f"Error getting confirmation bar: {e}")
-            return BacktestStrategyWrapper._current_conf_bar
+        return BacktestStrategyWrapper._current_conf_bar
     
-    def _execute_trade(self, intent: TradeIntent, bar: BarData) -> None:
+    def _execute_trade(self, intent: Union[TradeIntent, _SignalSlot], bar: BarData) -> None:
         """
-        Execute trade based on intent.
+        Execute trade based on intent (a TradeIntent, or the kernel path's reused slot).
+        
+        Only plain values are copied out of intent, so a slot may be refilled afterwards.
         """
-        log_signal(logger, intent.reason.value, f"{intent.side.value} {intent.symbol}")
+        if logger.isEnabledFor(logging.INFO):
+            log_signal(logger, intent.reason.value, f"{intent.side.value} {intent.symbol}")
         
-        is_entry = intent.reason in [TradeReason.ENTRY_LONG, TradeReason.ENTRY_SHORT]
+        is_entry = intent.reason in (_LONG, _SHORT)
         
         if is_entry:
             log_order(logger, intent.side.value, intent.symbol, intent.quantity, bar.close)
-            if intent.reason == TradeReason.ENTRY_LONG:
+            if intent.reason is _LONG:
                 self.buy()
             else:
                 self.sell()
@@ -196,7 +346,7 @@ class BacktestStrategyWrapper(Strategy):
                     duration_bars=None
                 )
             else:
-                logger.warning(f"Order rejected by backtesting.py (likely insufficient margin): {intent.side.value} @ {bar.close}")
+                logger.warning("Order rejected by backtesting.py (likely insufficient margin): %s @ %s", intent.side.value, bar.close)
         else:
             # Only log exit if we actually have a position to close
             if self.position and self._entry_price:
@@ -220,7 +370,7 @@ class BacktestStrategyWrapper(Strategy):
                 self._entry_price = None
                 self._entry_time = None
             else:
-                logger.warning(f"Exit signal ignored - no active position to close")
+                logger.warning("Exit signal ignored - no active position to close")
     
     def _log_trade(
         self,
@@ -234,32 +384,44 @@ class BacktestStrategyWrapper(Strategy):
         duration_bars: Optional[int] = None
     ) -> None:
         """Log trade with extended metadata."""
-        trade_data = format_trade_for_csv(
-            timestamp=timestamp,
-            symbol=SYMBOL,
-            side=side,
-            entry_price=entry_price,
-            exit_price=exit_price,
-            quantity=TRADE_QUANTITY,
-            reason=reason,
-            pnl=pnl,
-            pnl_pct=pnl_pct,
-            duration_bars=duration_bars
-        )
-        BacktestStrategyWrapper._trade_log.append(trade_data)
-        logger.debug(f"Logged trade: {side} {reason}")
+        BacktestStrategyWrapper._trade_log.append((
+            timestamp, SYMBOL, side, entry_price, exit_price, TRADE_QUANTITY,
+            reason, pnl, pnl_pct, duration_bars
+        ))
+        logger.debug("Logged trade: %s %s", side, reason)
+    
+    @classmethod
+    def get_trade_frame(cls) -> pd.DataFrame:
+        """All logged trades as CSV-formatted strings (format_trade_for_csv layout)."""
+        raw = pd.DataFrame(cls._trade_log, columns=TRADE_CSV_HEADERS)
+        return format_trades_bulk(raw)
     
     @classmethod
     def get_trade_log(cls) -> List[Dict]:
         """Get all logged trades."""
-        return cls._trade_log
+        return cls.get_trade_frame().to_dict('records')
     
     @classmethod
-    def set_conf_data(cls, data: pd.DataFrame) -> None:
-        """Set confirmation timeframe data for multi-timeframe analysis."""
+    def set_conf_data(cls, data: pd.DataFrame, conf_idx: Optional[np.ndarray] = None) -> None:
+        """
+        Set confirmation timeframe data for multi-timeframe analysis.
+        
+        Args:
+            data: Confirmation timeframe OHLCV
+            conf_idx: Optional precomputed alignment, one confirmation row index per
+                entry bar (-1 where none exists). Without it the wrapper builds one
+                with conf_index_for_entry() when the run starts.
+        """
         cls._conf_data = data
-        cls._last_conf_bar_time = None
         cls._current_conf_bar = None
+        cls._last_conf_pos = -1
+        
+        cls._conf_ts = data.index.as_unit('ns').asi8
+        cls._conf_values = data.reindex(
+            columns=['Open', 'High', 'Low', 'Close', 'Volume'], fill_value=0.0
+        ).to_numpy(dtype=np.float64)
+        cls._conf_idx = np.asarray(conf_idx, dtype=np.int32) if conf_idx is not None else None
+        
         logger.info(f"Set confirmation data with {len(data)} bars")
     
     @classmethod
@@ -268,5 +430,8 @@ class BacktestStrategyWrapper(Strategy):
         cls._strategy_instance = None
         cls._trade_log = []
         cls._conf_data = None
-        cls._last_conf_bar_time = None
         cls._current_conf_bar = None
+        cls._conf_idx = None
+        cls._conf_ts = None
+        cls._conf_values = None
+        cls._last_conf_pos = -1
@@ -3,21 +3,22 @@ Live Binance Testnet Executor.
 Handles order execution on Binance Testnet.
 """
 
-import sys
-import os
 import time
 import hmac
 import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Dict
+from types import MappingProxyType
+from typing import Optional, Dict, Mapping
 from urllib.parse import urlencode
 
+import orjson
 import requests
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from src.core.trade_intent import TradeIntent, TradeSide, TradeResult
 from src.utils.logger import get_logger, log_order, log_fill
+from src.utils.http_session import create_session, start_keepalive, pick_fastest_base_url
 from config.config import (
     BINANCE_TRADING_URL, BINANCE_TESTNET_API_KEY, BINANCE_TESTNET_API_SECRET,
     SYMBOL
@@ -25,6 +26,9 @@ from config.config import (
 
 logger = get_logger(__name__)
 
+# Most prefix HMAC states kept (least recently used dropped), so varying order sizes can't grow it
+_PREFIX_HMAC_CACHE_SIZE = 32
+
 
 class BinanceLiveExecutor:
     """
@@ -38,10 +42,26 @@ class BinanceLiveExecutor:
     
     def __init__(self):
         """Initialize executor."""
-        self.base_url = BINANCE_TRADING_URL
         self.api_key = BINANCE_TESTNET_API_KEY
         self.api_secret = BINANCE_TESTNET_API_SECRET
         
+        # Keyed once; each signature copies the template instead of re-keying
+        self._hmac_template = hmac.new(self.api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+        self._headers = MappingProxyType({
+            'Content-Type': 'application/json',
+            'X-MBX-APIKEY': self.api_key
+        })
+        # HMAC state after the static part of fixed-shape queries, keyed by that prefix (LRU)
+        self._prefix_hmacs: "OrderedDict[str, hmac.HMAC]" = OrderedDict()
+        
+        # Persistent connection to the trading endpoint (kept warm between orders),
+        # opened up front only when orders will really be sent; see _get_session()
+        self.base_url = BINANCE_TRADING_URL
+        self._session: Optional[requests.Session] = None
+        self._keepalive: Optional[threading.Event] = None
+        if self.api_key and self.api_secret:
+            self._get_session()
+        
         # Track pending and completed orders
         self._pending_orders: Dict[str, TradeIntent] = {}
         self._completed_orders: Dict[str, TradeResult] = {}
@@ -51,24 +71,56 @@ class BinanceLiveExecutor:
         if not self.api_key or not self.api_secret:
             logger.warning("API credentials not configured - orders will be simulated")
     
+    def _get_session(self) -> requests.Session:
+        """The pooled trading session, opened (fastest endpoint, keep-alive ping) on first use."""
+        if self._session is None:
+            self._session = create_session()
+            self.base_url = pick_fastest_base_url(self._session, BINANCE_TRADING_URL)
+            self._keepalive = start_keepalive(self._session, lambda: self.base_url)
+        return self._session
+    
     def _sign_request(self, params: Dict) -> Dict:
         """Sign request with HMAC-SHA256."""
         params['timestamp'] = int(time.time() * 1000)
         query_string = urlencode(params)
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        params['signature'] = signature
+        h = self._hmac_template.copy()
+        h.update(query_string.encode('utf-8'))
+        params['signature'] = h.hexdigest()
         return params
     
-    def _get_headers(self) -> Dict:
-        """Get request headers."""
-        return {
-            'Content-Type': 'application/json',
-            'X-MBX-APIKEY': self.api_key
-        }
+    @staticmethod
+    def _market_order_prefix(symbol: str, side: str, quantity: float) -> str:
+        """Static part of a market order query (everything up to the timestamp value)."""
+        return f"symbol={symbol}&side={side}&type=MARKET&quantity={quantity}&timestamp="
+    
+    def _sign_prefixed(self, query_prefix: str, params: Dict) -> Dict:
+        """
+        Sign a fixed-shape query whose string is query_prefix + <timestamp>.
+        
+        The HMAC over the static prefix is computed once and copied per call, so
+        only the timestamp digits are hashed. params must hold the prefix fields
+        in the same order, since that is the order they are sent in.
+        """
+        prefix_hmac = self._prefix_hmacs.get(query_prefix)
+        if prefix_hmac is None:
+            prefix_hmac = self._hmac_template.copy()
+            prefix_hmac.update(query_prefix.encode('utf-8'))
+            self._prefix_hmacs[query_prefix] = prefix_hmac
+            if len(self._prefix_hmacs) > _PREFIX_HMAC_CACHE_SIZE:
+                self._prefix_hmacs.popitem(last=False)
+        else:
+            self._prefix_hmacs.move_to_end(query_prefix)
+        
+        timestamp = int(time.time() * 1000)
+        h = prefix_hmac.copy()
+        h.update(str(timestamp).encode('utf-8'))
+        params['timestamp'] = timestamp
+        params['signature'] = h.hexdigest()
+        return params
+    
+    def _get_headers(self) -> Mapping[str, str]:
+        """Get request headers (built once in __init__)."""
+        return self._headers
     
     def execute(self, intent: TradeIntent, current_price: float) -> Optional[TradeResult]:
         """
@@ -140,45 +192,57 @@ class BinanceLiveExecutor:
             'quantity': intent.quantity
         }
         
-        params = self._sign_request(params)
+        params = self._sign_prefixed(
+            self._market_order_prefix(intent.symbol, intent.side.value, intent.quantity), params
+        )
         
         try:
-            response = requests.post(
+            response = self._get_session().post(
                 url,
                 params=params,
-                headers=self._get_headers(),
+                headers=self._headers,
                 timeout=30
             )
-            response.raise_for_status()
-            order_response = response.json()
-            
-            # Extract fill information
-            fill_price = float(order_response.get('cummulativeQuoteQty', 0)) / float(order_response.get('executedQty', 1))
-            filled_qty = float(order_response.get('executedQty', intent.quantity))
-            
-            result = TradeResult(
-                timestamp=intent.timestamp,
-                symbol=intent.symbol,
-                side=intent.side.value,
-                entry_price=fill_price,
-                exit_price=None,
-                quantity=filled_qty,
-                reason=intent.reason.value
-            )
-            
-            log_fill(logger, intent.side.value, intent.symbol, filled_qty, fill_price)
-            
-            logger.info(f"Order executed: {order_response.get('orderId')} "
-                       f"status={order_response.get('status')}")
-            
-            return result
-            
         except requests.RequestException as e:
             logger.error(f"Order execution failed: {e}")
-            
-            # Fall back to simulation on error
-            logger.warning("Falling back to simulated execution")
-            return self._simulate_execution(intent, current_price)
+            return self._fall_back_to_simulation(intent, current_price)
+        
+        # Status checked directly: the success path parses the body once, errors raise nothing
+        if response.status_code != 200:
+            logger.error(f"Order execution failed: HTTP {response.status_code} {response.text[:200]}")
+            return self._fall_back_to_simulation(intent, current_price)
+        
+        try:
+            order_response = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Order execution failed: unreadable response ({e})")
+            return self._fall_back_to_simulation(intent, current_price)
+        
+        # Extract fill information
+        fill_price = float(order_response.get('cummulativeQuoteQty', 0)) / float(order_response.get('executedQty', 1))
+        filled_qty = float(order_response.get('executedQty', intent.quantity))
+        
+        result = TradeResult(
+            timestamp=intent.timestamp,
+            symbol=intent.symbol,
+            side=intent.side.value,
+            entry_price=fill_price,
+            exit_price=None,
+            quantity=filled_qty,
+            reason=intent.reason.value
+        )
+        
+        log_fill(logger, intent.side.value, intent.symbol, filled_qty, fill_price)
+        
+        logger.info(f"Order executed: {order_response.get('orderId')} "
+                   f"status={order_response.get('status')}")
+        
+        return result
+    
+    def _fall_back_to_simulation(self, intent: TradeIntent, current_price: float) -> TradeResult:
+        """Simulate the fill after a failed real order."""
+        logger.warning("Falling back to simulated execution")
+        return self._simulate_execution(intent, current_price)
     
     def get_account_info(self) -> Optional[Dict]:
         """Get account information from Binance."""
@@ -186,18 +250,18 @@ class BinanceLiveExecutor:
             return None
         
         url = f"{self.base_url}/api/v3/account"
-        params = self._sign_request({})
+        params = self._sign_prefixed('timestamp=', {})
         
         try:
-            response = requests.get(
+            response = self._get_session().get(
                 url,
                 params=params,
-                headers=self._get_headers(),
+                headers=self._headers,
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Failed to get account info: {e}")
             return None
     
@@ -207,17 +271,24 @@ class BinanceLiveExecutor:
             return []
         
         url = f"{self.base_url}/api/v3/openOrders"
-        params = self._sign_request({'symbol': symbol})
+        params = self._sign_prefixed(f'symbol={symbol}&timestamp=', {'symbol': symbol})
         
         try:
-            response = requests.get(
+            response = self._get_session().get(
                 url,
                 params=params,
-                headers=self._get_headers(),
+                headers=self._headers,
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Failed to get open orders: {e}")
             return []
+    
+    def close(self) -> None:
+        """Stop the keep-alive ping and release pooled connections."""
+        if self._session is not None:
+            self._keepalive.set()
+            self._session.close()
+            self._session = None
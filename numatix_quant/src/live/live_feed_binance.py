@@ -1,31 +1,80 @@
 """
 Binance Live Data Feed.
 Handles fetching real-time and historical data from Binance Testnet.
+
+Closed bars arrive over the public kline WebSocket stream when websocket-client
+is installed (LIVE_USE_WEBSOCKET); otherwise the feed falls back to REST polling.
 """
 
-import sys
-import os
+import queue
+import threading
 import time
-import hmac
-import hashlib
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Tuple
-from urllib.parse import urlencode
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, List, Optional, Dict, Tuple
 
+import numpy as np
+import orjson
 import pandas as pd
 import requests
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+try:
+    import websocket
+except ImportError:  # optional: REST polling only
+    websocket = None
 
 from src.core.strategy_base import BarData
 from src.utils.logger import get_logger, log_data_arrival
+from src.utils.http_session import create_session, start_keepalive, pick_fastest_base_url
 from config.config import (
-    BINANCE_API_BASE_URL, BINANCE_TESTNET_API_KEY, BINANCE_TESTNET_API_SECRET,
-    SYMBOL, TIMEFRAME_ENTRY, TIMEFRAME_CONFIRMATION, LIVE_WARMUP_BARS
+    BINANCE_API_BASE_URL, BINANCE_WS_URL,
+    SYMBOL, TIMEFRAME_ENTRY, TIMEFRAME_CONFIRMATION, LIVE_WARMUP_BARS, LIVE_USE_WEBSOCKET
 )
 
 logger = get_logger(__name__)
 
+# How often the REST base URL is re-picked by latency
+_ENDPOINT_REFRESH_SECONDS = 600
+
+# Rolling buffer length per timeframe (oldest bars are evicted on append)
+_BUFFER_BARS = LIVE_WARMUP_BARS + 100
+
+# Binance caps /api/v3/klines at 1000 rows per request
+_KLINES_PAGE_LIMIT = 1000
+_WARMUP_FETCH_WORKERS = 8
+
+_INTERVAL_UNIT_MS = {'m': 60_000, 'h': 3_600_000, 'd': 86_400_000, 'w': 604_800_000}
+
+
+def _interval_ms(interval: str) -> int:
+    """Bar length in ms for a Binance interval string like '5m' or '1h'."""
+    return int(interval[:-1]) * _INTERVAL_UNIT_MS[interval[-1]]
+
+
+def _parse_klines(klines: list) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a raw /api/v3/klines payload in one pass per column.
+    
+    Args:
+        klines: Kline rows as returned by Binance ([open_ms, "open", "high", ...])
+    
+    Returns:
+        (open times in epoch ms as int64, OHLCV as an (n, 5) float64 array)
+    """
+    if not klines:
+        return np.empty(0, dtype=np.int64), np.empty((0, 5), dtype=np.float64)
+    raw = np.array(klines, dtype=object)
+    return raw[:, 0].astype(np.int64), raw[:, 1:6].astype(np.float64)
+
+
+def _bars_from_arrays(open_ms: np.ndarray, ohlcv: np.ndarray) -> List[BarData]:
+    """Build BarData (naive UTC open time) from parsed kline columns."""
+    timestamps = open_ms.astype('datetime64[ms]').tolist()
+    return [
+        BarData(ts, o, h, l, c, v)
+        for ts, o, h, l, c, v in zip(timestamps, *ohlcv.T.tolist())
+    ]
+
 
 class BinanceLiveFeed:
     """
@@ -33,53 +82,115 @@ class BinanceLiveFeed:
     
     Features:
     - Fetches historical klines for warmup
-    - Polls for new klines
+    - Receives closed klines from the WebSocket stream (or polls for them)
     - Maintains rolling data buffers
     """
     
-    def __init__(self, symbol: str = SYMBOL):
+    def __init__(self, symbol: str = SYMBOL, use_websocket: bool = LIVE_USE_WEBSOCKET):
         """
         Initialize Binance feed.
         
         Args:
             symbol: Trading pair (e.g., 'BTCUSDT')
+            use_websocket: Stream closed klines instead of polling REST
+                (needs websocket-client)
         """
         self.symbol = symbol
         self.base_url = BINANCE_API_BASE_URL
-        self.api_key = BINANCE_TESTNET_API_KEY
-        self.api_secret = BINANCE_TESTNET_API_SECRET
+        
+        # Persistent connection to the market data endpoint (kept warm between polls)
+        self._session = create_session()
+        self._keepalive = start_keepalive(self._session, lambda: self.base_url)
+        self._endpoint_picked_at: Optional[float] = None
         
         # Rolling data buffers
-        self._bars_entry: List[BarData] = []
-        self._bars_conf: List[BarData] = []
+        self._bars_entry: Deque[BarData] = deque(maxlen=_BUFFER_BARS)
+        self._bars_conf: Deque[BarData] = deque(maxlen=_BUFFER_BARS)
+        
+        # Open time (epoch ms) of the newest bar held, to detect new bars (-1 = none yet)
+        self._last_entry_ms = -1
+        self._last_conf_ms = -1
+        
+        # Closed klines pushed by the stream thread as (open_ms, o, h, l, c, v), drained by poll_new_bars()
+        self._stream_queues: Dict[str, "queue.Queue[tuple]"] = {
+            TIMEFRAME_ENTRY: queue.Queue(),
+            TIMEFRAME_CONFIRMATION: queue.Queue(),
+        }
+        self._last_streamed_ms: Dict[str, int] = {}
+        # Set by the stream thread whenever it queues a closed bar (see wait_for_bar)
+        self._bar_event = threading.Event()
+        self._ws_app = None
+        self._ws_thread: Optional[threading.Thread] = None
         
-        # Track last bar timestamps to detect new bars
-        self._last_entry_timestamp: Optional[datetime] = None
-        self._last_conf_timestamp: Optional[datetime] = None
+        if use_websocket and websocket is None:
+            logger.warning("websocket-client not installed; polling klines over REST")
+        elif use_websocket:
+            self._start_stream()
         
         logger.info(f"BinanceLiveFeed initialized for {symbol}")
     
-    def _sign_request(self, params: Dict) -> Dict:
-        """Sign request with HMAC-SHA256."""
-        if not self.api_secret:
-            return params
-        
-        params['timestamp'] = int(time.time() * 1000)
-        query_string = urlencode(params)
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        params['signature'] = signature
-        return params
-    
-    def _get_headers(self) -> Dict:
-        """Get request headers."""
-        headers = {'Content-Type': 'application/json'}
-        if self.api_key:
-            headers['X-MBX-APIKEY'] = self.api_key
-        return headers
+    def _start_stream(self) -> None:
+        """Subscribe to the closed-kline streams for both timeframes in a background thread."""
+        symbol = self.symbol.lower()
+        streams = '/'.join(f"{symbol}@kline_{interval}" for interval in self._stream_queues)
+        url = f"{BINANCE_WS_URL}/stream?streams={streams}"
+        
+        self._ws_app = websocket.WebSocketApp(
+            url,
+            on_message=self._on_stream_message,
+            on_reconnect=self._on_stream_reconnect,
+            on_error=lambda ws, error: logger.warning(f"Kline stream error: {error}"),
+        )
+        self._ws_thread = threading.Thread(
+            target=self._ws_app.run_forever,
+            kwargs={'ping_interval': 60, 'ping_timeout': 20, 'reconnect': 5},
+            name='binance-kline-stream',
+            daemon=True
+        )
+        self._ws_thread.start()
+        logger.info(f"Subscribed to kline stream: {streams}")
+    
+    def _on_stream_message(self, ws, message: str) -> None:
+        """Queue the kline carried by a stream frame if it is a newly closed bar."""
+        try:
+            k = orjson.loads(message)['data']['k']
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Unexpected kline stream frame: {e}")
+            return
+        
+        if k['x']:
+            self._queue_closed_bar(
+                k['i'], k['t'], float(k['o']), float(k['h']), float(k['l']), float(k['c']), float(k['v'])
+            )
+    
+    def _on_stream_reconnect(self, ws) -> None:
+        """Backfill bars that closed while the stream was down."""
+        logger.info("Kline stream reconnected, backfilling closed bars")
+        for interval in self._stream_queues:
+            # Last kline is still forming; the rest are closed
+            open_ms, ohlcv = self._fetch_kline_arrays(interval, limit=10)
+            for ts_ms, row in zip(open_ms[:-1].tolist(), ohlcv[:-1].tolist()):
+                self._queue_closed_bar(interval, ts_ms, *row)
+    
+    def _queue_closed_bar(
+        self, interval: str, open_ms: int,
+        open: float, high: float, low: float, close: float, volume: float
+    ) -> None:
+        """Queue a closed bar once per open time (stream and backfill may both deliver it)."""
+        target = self._stream_queues.get(interval)
+        if target is None or open_ms <= self._last_streamed_ms.get(interval, -1):
+            return
+        self._last_streamed_ms[interval] = open_ms
+        target.put((open_ms, open, high, low, close, volume))
+        self._bar_event.set()
+    
+    def _refresh_base_url(self) -> None:
+        """Switch to the lowest-latency equivalent API host (re-checked every few minutes)."""
+        now = time.monotonic()
+        if self._endpoint_picked_at is not None and now - self._endpoint_picked_at < _ENDPOINT_REFRESH_SECONDS:
+            return
+        self._endpoint_picked_at = now
+        self.base_url = pick_fastest_base_url(self._session, BINANCE_API_BASE_URL)
     
     def fetch_klines(
         self,
@@ -87,9 +198,9 @@ class BinanceLiveFeed:
         limit: int = 500,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None
-    ) -> List[Dict]:
+    ) -> List[BarData]:
         """
-        Fetch klines from Binance.
+        Fetch klines from Binance as bars, oldest first.
         
         Args:
             interval: Kline interval ('15m', '1h', etc.)
@@ -98,7 +209,24 @@ class BinanceLiveFeed:
             end_time: End timestamp (ms)
         
         Returns:
-            List of kline dictionaries
+            List of BarData (timestamps are naive UTC open times)
+        """
+        return _bars_from_arrays(*self._fetch_kline_arrays(interval, limit, start_time, end_time))
+    
+    def _fetch_kline_arrays(
+        self,
+        interval: str,
+        limit: int = 500,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch klines and parse them column-wise (see _parse_klines).
+        
+        Klines are public market data: no timestamp, signature or API key is sent.
+        
+        Returns:
+            (open times in epoch ms, OHLCV float64 rows); both empty on error
         """
         url = f"{self.base_url}/api/v3/klines"
         
@@ -114,27 +242,13 @@ class BinanceLiveFeed:
             params['endTime'] = end_time
         
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = self._session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            klines = response.json()
-            
-            result = []
-            for k in klines:
-                result.append({
-                    'timestamp': datetime.fromtimestamp(k[0] / 1000),
-                    'open': float(k[1]),
-                    'high': float(k[2]),
-                    'low': float(k[3]),
-                    'close': float(k[4]),
-                    'volume': float(k[5]),
-                    'close_time': datetime.fromtimestamp(k[6] / 1000)
-                })
+            return _parse_klines(orjson.loads(response.content))
             
-            return result
-            
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching klines: {e}")
-            return []
+            return _parse_klines([])
     
     def warmup(self) -> bool:
         """
@@ -146,82 +260,186 @@ class BinanceLiveFeed:
             True if warmup successful
         """
         logger.info("Starting data warmup...")
+        self._refresh_base_url()
         
-        # Fetch entry historical data
-        logger.info(f"Fetching {LIVE_WARMUP_BARS} {TIMEFRAME_ENTRY} bars for warmup...")
-        klines_entry = self.fetch_klines(TIMEFRAME_ENTRY, limit=LIVE_WARMUP_BARS)
+        # Both timeframes (and every page of each) are fetched concurrently
+        logger.info(f"Fetching {LIVE_WARMUP_BARS} {TIMEFRAME_ENTRY} and {TIMEFRAME_CONFIRMATION} bars for warmup...")
+        with ThreadPoolExecutor(max_workers=_WARMUP_FETCH_WORKERS) as pool:
+            pending_entry = self._submit_recent_klines(pool, TIMEFRAME_ENTRY, LIVE_WARMUP_BARS)
+            pending_conf = self._submit_recent_klines(pool, TIMEFRAME_CONFIRMATION, LIVE_WARMUP_BARS)
+            entry_ms, entry_ohlcv = self._collect_recent_klines(pending_entry, LIVE_WARMUP_BARS)
+            conf_ms, conf_ohlcv = self._collect_recent_klines(pending_conf, LIVE_WARMUP_BARS)
         
-        if len(klines_entry) < LIVE_WARMUP_BARS:
-            logger.warning(f"Only got {len(klines_entry)} {TIMEFRAME_ENTRY} bars, expected {LIVE_WARMUP_BARS}")
+        for interval, open_ms in ((TIMEFRAME_ENTRY, entry_ms), (TIMEFRAME_CONFIRMATION, conf_ms)):
+            if len(open_ms) < LIVE_WARMUP_BARS:
+                logger.warning(f"Only got {len(open_ms)} {interval} bars, expected {LIVE_WARMUP_BARS}")
         
-        self._bars_entry = [BarData.from_dict(k) for k in klines_entry]
+        self._bars_entry = deque(_bars_from_arrays(entry_ms, entry_ohlcv), maxlen=_BUFFER_BARS)
+        self._bars_conf = deque(_bars_from_arrays(conf_ms, conf_ohlcv), maxlen=_BUFFER_BARS)
         
-        if self._bars_entry:
-            self._last_entry_timestamp = self._bars_entry[-1].timestamp
+        if len(entry_ms):
+            self._last_entry_ms = int(entry_ms[-1])
+        if len(conf_ms):
+            self._last_conf_ms = int(conf_ms[-1])
         
         logger.info(f"Loaded {len(self._bars_entry)} {TIMEFRAME_ENTRY} bars")
+        logger.info(f"Loaded {len(self._bars_conf)} {TIMEFRAME_CONFIRMATION} bars")
         
-        # Fetch confirmation historical data
-        logger.info(f"Fetching {LIVE_WARMUP_BARS} {TIMEFRAME_CONFIRMATION} bars for warmup...")
-        klines_conf = self.fetch_klines(TIMEFRAME_CONFIRMATION, limit=LIVE_WARMUP_BARS)
+        logger.info("Warmup complete")
+        return len(self._bars_entry) > 0 and len(self._bars_conf) > 0
+    
+    def _submit_recent_klines(self, pool: ThreadPoolExecutor, interval: str, n_bars: int) -> list:
+        """
+        Submit the requests for the latest n_bars klines, newest page first.
         
-        if len(klines_conf) < LIVE_WARMUP_BARS:
-            logger.warning(f"Only got {len(klines_conf)} {TIMEFRAME_CONFIRMATION} bars, expected {LIVE_WARMUP_BARS}")
+        Up to the page limit this is a single request; beyond it the range is split
+        into startTime/endTime windows counted back from the currently forming bar.
+        """
+        if n_bars <= _KLINES_PAGE_LIMIT:
+            return [pool.submit(self._fetch_kline_arrays, interval, n_bars)]
         
-        self._bars_conf = [BarData.from_dict(k) for k in klines_conf]
+        step_ms = _interval_ms(interval)
+        current_open = int(time.time() * 1000) // step_ms * step_ms
+        page_ms = _KLINES_PAGE_LIMIT * step_ms
+        n_pages = -(-n_bars // _KLINES_PAGE_LIMIT)
+        return [
+            pool.submit(
+                self._fetch_kline_arrays, interval, _KLINES_PAGE_LIMIT,
+                current_open - page * page_ms - page_ms + step_ms, current_open - page * page_ms
+            )
+            for page in range(n_pages)
+        ]
+    
+    @staticmethod
+    def _collect_recent_klines(futures: list, n_bars: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Join pages from _submit_recent_klines oldest first, keeping the last n_bars.
         
-        if self._bars_conf:
-            self._last_conf_timestamp = self._bars_conf[-1].timestamp
+        Pages older than a failed (empty) page are dropped so the result has no gaps.
+        """
+        pages = []
+        for future in futures:
+            open_ms, ohlcv = future.result()
+            if not len(open_ms):
+                break
+            pages.append((open_ms, ohlcv))
+        if not pages:
+            return _parse_klines([])
+        pages.reverse()
+        open_ms = np.concatenate([page[0] for page in pages])[-n_bars:]
+        ohlcv = np.concatenate([page[1] for page in pages])[-n_bars:]
+        return open_ms, ohlcv
+    
+    def poll_new_bars(self) -> Tuple[Optional[BarData], Optional[BarData]]:
+        """
+        Return newly completed bars (entry, confirmation); None where there is none.
         
-        logger.info(f"Loaded {len(self._bars_conf)} {TIMEFRAME_CONFIRMATION} bars")
+        With the stream running this only drains what it queued: every closed
+        confirmation bar is buffered (the latest is returned) and entry bars are
+        handed out one per call, oldest first, so none are skipped. While the
+        stream is disconnected, the REST poll is used instead.
+        """
+        if self._ws_app is not None and self._stream_connected():
+            return self._drain_stream()
+        return self._poll_rest()
+    
+    def wait_for_bar(self, timeout: float) -> bool:
+        """
+        Wait until the next poll_new_bars() call has something to return.
         
-        logger.info("Warmup complete")
-        return len(self._bars_entry) > 0 and len(self._bars_conf) > 0
+        With the stream connected this blocks until a closed bar is pushed (or
+        timeout elapses), so bars are handled on arrival instead of on the next
+        fixed poll. Entry bars still queued return immediately. Without the
+        stream it just sleeps for timeout before the next REST poll.
+        
+        Args:
+            timeout: Longest wait in seconds
+        
+        Returns:
+            True if a streamed bar is ready
+        """
+        if self._ws_app is None or not self._stream_connected():
+            time.sleep(timeout)
+            return False
+        if not self._stream_queues[TIMEFRAME_ENTRY].empty():
+            return True
+        # A bar pushed between wait() and clear() is still queued and seen by the check above next time
+        ready = self._bar_event.wait(timeout)
+        self._bar_event.clear()
+        return ready
     
-    def poll_new_bars(self) -> Tuple[Optional[BarData], Optional[BarData]]:
+    def _stream_connected(self) -> bool:
+        """True while the kline stream socket is open."""
+        sock = self._ws_app.sock
+        return sock is not None and sock.connected
+    
+    def _drain_stream(self) -> Tuple[Optional[BarData], Optional[BarData]]:
+        """Non-blocking read of the bars queued by the stream thread."""
+        new_conf_bar = None
+        conf_queue = self._stream_queues[TIMEFRAME_CONFIRMATION]
+        while True:
+            try:
+                row = conf_queue.get_nowait()
+            except queue.Empty:
+                break
+            if row[0] > self._last_conf_ms:
+                bar = new_conf_bar = BarData.from_timestamp_ms(*row)
+                self._bars_conf.append(bar)
+                self._last_conf_ms = row[0]
+                logger.info(f"DETECTED NEW {TIMEFRAME_CONFIRMATION} BAR @ {bar.timestamp} | Close: {bar.close}")
+        
+        new_entry_bar = None
+        entry_queue = self._stream_queues[TIMEFRAME_ENTRY]
+        while new_entry_bar is None:
+            try:
+                row = entry_queue.get_nowait()
+            except queue.Empty:
+                break
+            # Bars already loaded by warmup are skipped
+            if row[0] > self._last_entry_ms:
+                bar = new_entry_bar = BarData.from_timestamp_ms(*row)
+                self._bars_entry.append(bar)
+                self._last_entry_ms = row[0]
+                logger.info(f"DETECTED NEW {TIMEFRAME_ENTRY} BAR @ {bar.timestamp} | Close: {bar.close}")
+        
+        return new_entry_bar, new_conf_bar
+    
+    def _poll_rest(self) -> Tuple[Optional[BarData], Optional[BarData]]:
         """
-        Poll for new completed bars.
+        Poll for new completed bars over REST.
         
         Strict Detection Mechanism:
         1. Fetch last 2 klines (0=fully closed, 1=currently forming)
         2. Verify if kline[0] timestamp is newer than our last seen
         3. If yes, it's a new closed candle
         """
+        self._refresh_base_url()
+        
         new_entry_bar = None
         new_conf_bar = None
         
         # Poll entry timeframe
-        klines_entry = self.fetch_klines(TIMEFRAME_ENTRY, limit=2)
-        if len(klines_entry) >= 2:
+        open_ms, ohlcv = self._fetch_kline_arrays(TIMEFRAME_ENTRY, limit=2)
+        if len(open_ms) >= 2:
             # Index -2 is the MOST RECENTLY CLOSED candle
-            closed_kline = klines_entry[-2]
-            ts = closed_kline['timestamp']
+            ts_ms = int(open_ms[-2])
             
-            if self._last_entry_timestamp is None or ts > self._last_entry_timestamp:
-                new_entry_bar = BarData.from_dict(closed_kline)
+            if ts_ms > self._last_entry_ms:
+                new_entry_bar = BarData.from_timestamp_ms(ts_ms, *ohlcv[-2].tolist())
                 self._bars_entry.append(new_entry_bar)
-                self._last_entry_timestamp = ts
-                logger.info(f"DETECTED NEW {TIMEFRAME_ENTRY} BAR @ {ts} | Close: {new_entry_bar.close}")
-                
-                # Buffer management
-                if len(self._bars_entry) > LIVE_WARMUP_BARS + 100:
-                    self._bars_entry = self._bars_entry[-LIVE_WARMUP_BARS:]
+                self._last_entry_ms = ts_ms
+                logger.info(f"DETECTED NEW {TIMEFRAME_ENTRY} BAR @ {new_entry_bar.timestamp} | Close: {new_entry_bar.close}")
         
         # Poll confirmation timeframe
-        klines_conf = self.fetch_klines(TIMEFRAME_CONFIRMATION, limit=2)
-        if len(klines_conf) >= 2:
-            closed_kline = klines_conf[-2]
-            ts = closed_kline['timestamp']
+        open_ms, ohlcv = self._fetch_kline_arrays(TIMEFRAME_CONFIRMATION, limit=2)
+        if len(open_ms) >= 2:
+            ts_ms = int(open_ms[-2])
             
-            if self._last_conf_timestamp is None or ts > self._last_conf_timestamp:
-                new_conf_bar = BarData.from_dict(closed_kline)
+            if ts_ms > self._last_conf_ms:
+                new_conf_bar = BarData.from_timestamp_ms(ts_ms, *ohlcv[-2].tolist())
                 self._bars_conf.append(new_conf_bar)
-                self._last_conf_timestamp = ts
-                logger.info(f"DETECTED NEW {TIMEFRAME_CONFIRMATION} BAR @ {ts} | Close: {new_conf_bar.close}")
-
-                # Buffer management
-                if len(self._bars_conf) > LIVE_WARMUP_BARS + 100:
-                    self._bars_conf = self._bars_conf[-LIVE_WARMUP_BARS:]
+                self._last_conf_ms = ts_ms
+                logger.info(f"DETECTED NEW {TIMEFRAME_CONFIRMATION} BAR @ {new_conf_bar.timestamp} | Close: {new_conf_bar.close}")
 
         return new_entry_bar, new_conf_bar
     
@@ -233,13 +451,29 @@ class BinanceLiveFeed:
         """Get the latest confirmation timeframe bar from buffer."""
         return self._bars_conf[-1] if self._bars_conf else None
     
-    def get_all_entry_bars(self) -> List[BarData]:
-        """Get all entry timeframe bars in buffer."""
-        return self._bars_entry.copy()
+    def get_all_entry_bars(self) -> Tuple[BarData, ...]:
+        """Get all entry timeframe bars in buffer (read-only snapshot)."""
+        return tuple(self._bars_entry)
+    
+    def get_all_conf_bars(self) -> Tuple[BarData, ...]:
+        """Get all confirmation timeframe bars in buffer (read-only snapshot)."""
+        return tuple(self._bars_conf)
+    
+    def entry_bar_count(self) -> int:
+        """Number of entry timeframe bars in buffer."""
+        return len(self._bars_entry)
+    
+    def conf_bar_count(self) -> int:
+        """Number of confirmation timeframe bars in buffer."""
+        return len(self._bars_conf)
     
-    def get_all_conf_bars(self) -> List[BarData]:
-        """Get all confirmation timeframe bars in buffer."""
-        return self._bars_conf.copy()
+    def close(self) -> None:
+        """Stop the kline stream (if running) and the pooled HTTP session."""
+        if self._ws_app is not None:
+            self._ws_app.close()
+            self._ws_app = None
+        self._keepalive.set()
+        self._session.close()
     
     def get_current_price(self) -> Optional[float]:
         """Get current price from latest bar."""
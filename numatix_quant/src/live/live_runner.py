@@ -11,9 +11,15 @@ import os
 import time
 import signal as sig
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, List, Sequence
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import numpy as np
+
+# Project root on sys.path only when run as a script (python src/...); imports as a module are untouched
+if not __package__:
+    _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if _PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, _PROJECT_ROOT)
 
 from src.core.strategy_multi_tf import StrategyMultiTF
 from src.core.strategy_base import BarData
@@ -22,7 +28,7 @@ from src.core.position_state import PositionStatus
 from src.live.live_feed_binance import BinanceLiveFeed
 from src.execution.executor_live_binance import BinanceLiveExecutor
 from src.utils.logger import get_live_logger
-from src.utils.csv_writer import CSVWriter, format_trade_for_csv
+from src.utils.csv_writer import BackgroundCSVWriter, format_trade_for_csv
 from config.config import (
     SYMBOL, TRADE_QUANTITY, LIVE_TRADES_PATH,
     LIVE_POLL_INTERVAL_SECONDS, LIVE_WARMUP_BARS,
@@ -33,6 +39,52 @@ from config.config import (
 logger = get_live_logger("LIVE")
 
 
+def _timeframe_minutes(timeframe: str) -> int:
+    """Minutes per bar for an 'Nm' / 'Nh' timeframe (0 if unsupported)."""
+    if timeframe.endswith('m'):
+        return int(timeframe[:-1])
+    if timeframe.endswith('h'):
+        return int(timeframe[:-1]) * 60
+    return 0
+
+
+def _open_times_ms(bars: Sequence[BarData]) -> np.ndarray:
+    """Bar open times as int64 epoch ms (naive timestamps are taken as UTC)."""
+    return np.array([bar.timestamp for bar in bars], dtype='datetime64[ms]').astype(np.int64)
+
+
+def align_conf_bars(
+    bars_entry: Sequence[BarData],
+    bars_conf: Sequence[BarData],
+    conf_minutes: int
+) -> List[Optional[BarData]]:
+    """
+    Confirmation bar for each entry bar: the one whose period contains the entry open time.
+    
+    Entry open times are floored to the confirmation period in integer epoch ms
+    and matched exactly against the confirmation open times; an entry bar gets
+    None when that confirmation bar is missing (or conf_minutes is 0).
+    
+    Args:
+        bars_entry: Entry bars, oldest first
+        bars_conf: Confirmation bars, oldest first
+        conf_minutes: Confirmation bar length in minutes
+    
+    Returns:
+        List aligned with bars_entry
+    """
+    if not bars_entry or not bars_conf or conf_minutes <= 0:
+        return [None] * len(bars_entry)
+    
+    step_ms = conf_minutes * 60_000
+    period_start = _open_times_ms(bars_entry) // step_ms * step_ms
+    conf_ms = _open_times_ms(bars_conf)
+    
+    pos = np.minimum(np.searchsorted(conf_ms, period_start), len(conf_ms) - 1)
+    conf_pos = np.where(conf_ms[pos] == period_start, pos, -1).tolist()
+    return [bars_conf[j] if j >= 0 else None for j in conf_pos]
+
+
 class LiveRunner:
     """
     Long-running live trading loop.
@@ -56,8 +108,12 @@ class LiveRunner:
             quantity=TRADE_QUANTITY
         )
         
-        # Trade logging
-        self.csv_writer = CSVWriter(LIVE_TRADES_PATH)
+        # Bar lengths are fixed for the run, so the timeframe strings are parsed once
+        self._entry_minutes = _timeframe_minutes(TIMEFRAME_ENTRY)
+        self._conf_minutes = _timeframe_minutes(TIMEFRAME_CONFIRMATION)
+        
+        # Trade logging (rows are appended by a background thread)
+        self.csv_writer = BackgroundCSVWriter(LIVE_TRADES_PATH)
         
         # State tracking
         self._running = False
@@ -90,16 +146,9 @@ class LiveRunner:
         """
         logger.info("Initializing historical data...")
         
-        # Calculate approximate days of data for entry timeframe
-        # (Assuming TIMEFRAME_ENTRY is something like '5m', '15m')
-        minutes_per_bar = 0
-        if TIMEFRAME_ENTRY.endswith('m'):
-            minutes_per_bar = int(TIMEFRAME_ENTRY[:-1])
-        elif TIMEFRAME_ENTRY.endswith('h'):
-            minutes_per_bar = int(TIMEFRAME_ENTRY[:-1]) * 60
-        
-        days_of_data = (LIVE_WARMUP_BARS * minutes_per_bar) // (60 * 24)
-        hours_of_data = (LIVE_WARMUP_BARS * minutes_per_bar) / 60
+        # Approximate span of the entry timeframe warmup
+        days_of_data = (LIVE_WARMUP_BARS * self._entry_minutes) // (60 * 24)
+        hours_of_data = (LIVE_WARMUP_BARS * self._entry_minutes) / 60
         if days_of_data >= 1:
             print(f"Loading ~{days_of_data} days of historical data...")
         else:
@@ -120,30 +169,11 @@ class LiveRunner:
         # Process historical bars through strategy to build EMA state
         logger.info("Strategy initialized with historical data")
         
-        # Create a mapping of confirmation bars by their open time for alignment
-        bars_conf_by_time: Dict[datetime, BarData] = {bar.timestamp: bar for bar in bars_conf}
+        # Confirmation bar for every entry bar, aligned in one pass
+        aligned_conf = align_conf_bars(bars_entry, bars_conf, self._conf_minutes)
         
         # Process each entry bar to build EMA state ONLY
-        for i, bar_entry in enumerate(bars_entry):
-            # Find closest confirmation bar that was completed before or at this time
-            # For simplicity in warmup, we look for exact or previous hour/period
-            # (In true alignment, we'd need to know the confirmation interval)
-            conf_time = None
-            if TIMEFRAME_CONFIRMATION.endswith('m'):
-                minutes = int(TIMEFRAME_CONFIRMATION[:-1])
-                conf_time = bar_entry.timestamp.replace(
-                    minute=(bar_entry.timestamp.minute // minutes) * minutes,
-                    second=0, microsecond=0
-                )
-            elif TIMEFRAME_CONFIRMATION.endswith('h'):
-                hours = int(TIMEFRAME_CONFIRMATION[:-1])
-                conf_time = bar_entry.timestamp.replace(
-                    hour=(bar_entry.timestamp.hour // hours) * hours,
-                    minute=0, second=0, microsecond=0
-                )
-            
-            bar_conf = bars_conf_by_time.get(conf_time)
-            
+        for bar_entry, bar_conf in zip(bars_entry, aligned_conf):
             # Call on_bar to build EMA state
             _ = self.strategy.on_bar(bar_entry, bar_conf)
             
@@ -151,9 +181,9 @@ class LiveRunner:
             self.strategy.position.close()
         
         # Log initial EMA state
-        ema_state = self.strategy.get_ema_state()
-        ema_fast_entry = ema_state['ema_fast_entry'] or 0
-        ema_slow_entry = ema_state['ema_slow_entry'] or 0
+        state = self.strategy.snapshot()
+        ema_fast_entry = state.ema_fast_entry or 0
+        ema_slow_entry = state.ema_slow_entry or 0
         logger.info(f"Initial EMA state - {TIMEFRAME_ENTRY} EMA: {ema_fast_entry:.2f}, {TIMEFRAME_ENTRY} EMA: {ema_slow_entry:.2f}")
         
         if not self.strategy.is_warmup_complete():
@@ -192,16 +222,15 @@ class LiveRunner:
                 new_entry_bar, new_conf_bar = self.feed.poll_new_bars()
                 
                 # Get current status info
-                bars_entry_count = len(self.feed.get_all_entry_bars())
-                bars_conf_count = len(self.feed.get_all_conf_bars())
+                bars_entry_count = self.feed.entry_bar_count()
+                bars_conf_count = self.feed.conf_bar_count()
                 price = self.feed.get_current_price() or 0
-                position = self.strategy.get_position_state()
-                ema = self.strategy.get_ema_state()
-                ema_fast = ema['ema_fast_entry'] or 0
-                ema_slow = ema['ema_slow_entry'] or 0
+                state = self.strategy.snapshot()
+                ema_fast = state.ema_fast_entry or 0
+                ema_slow = state.ema_slow_entry or 0
                 
                 logger.info(f"Processing with {bars_entry_count} {TIMEFRAME_ENTRY} bars, {bars_conf_count} {TIMEFRAME_CONFIRMATION} bars")
-                logger.info(f"Price: ${price:,.2f} | Position: {position.status.value} | Fast EMA: {ema_fast:.2f}, Slow EMA: {ema_slow:.2f}")
+                logger.info(f"Price: ${price:,.2f} | Position: {state.position_status.name} | Fast EMA: {ema_fast:.2f}, Slow EMA: {ema_slow:.2f}")
                 
                 # Log new bars if detected
                 if new_entry_bar is not None:
@@ -227,13 +256,16 @@ class LiveRunner:
                     logger.info(f"Reached max iterations ({max_iterations}), stopping")
                     break
                 
-                # Wait before next poll
-                time.sleep(LIVE_POLL_INTERVAL_SECONDS)
+                # Wait for the next streamed bar (or the poll interval over REST)
+                self.feed.wait_for_bar(LIVE_POLL_INTERVAL_SECONDS)
                 
             except Exception as e:
                 logger.error(f"Error in main loop: {e}", exc_info=True)
                 time.sleep(LIVE_POLL_INTERVAL_SECONDS)
         
+        self.feed.close()
+        self.executor.close()
+        self.csv_writer.close()
         logger.info("Live trading stopped")
         self._log_final_summary()
     
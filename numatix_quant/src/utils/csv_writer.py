@@ -4,13 +4,21 @@ Handles writing trade data to CSV files.
 """
 
 import csv
+import itertools
+import operator
+import os
+import queue
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
-import os
-import sys
+from typing import Iterator, List, Dict, Optional, Tuple, Union
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 from src.utils.logger import get_logger
 
@@ -31,12 +39,147 @@ TRADE_CSV_HEADERS = [
     'duration_bars'
 ]
 
+# Batches at least this large are written column-wise through Arrow's C++ CSV writer.
+# Unquoted like csv.writer's rows; Arrow rejects a field that would need quotes
+_BULK_WRITE_MIN_ROWS = 256
+_BULK_WRITE_OPTIONS = pa_csv.WriteOptions(include_header=False, eol='\r\n', quoting_style='none')
+
+# Trade dict -> row tuple in header order; missing fields are filled from _ROW_DEFAULTS
+_ROW_DEFAULTS = dict.fromkeys(TRADE_CSV_HEADERS, '')
+_row_values = operator.itemgetter(*TRADE_CSV_HEADERS)
+
+# Write buffer for a CSVWriter used as a context manager
+_OPEN_WRITE_BUFFER_BYTES = 1 << 20
+
+
+# How often a waiting BackgroundCSVWriter.flush() checks that the writer thread is alive
+_FLUSH_POLL_SECONDS = 0.5
+
+# Rows per iter_trades() batch
+ITER_BATCH_ROWS = 50_000
+_STREAM_BLOCK_BYTES = 1 << 20
+
+
+def _read_header(path: str) -> List[str]:
+    """Column names from the first CSV row ([] for an empty file)."""
+    with open(path, 'r', newline='') as f:
+        return next(csv.reader(f), [])
+
+
+def _arrow_text_options(header: List[str]) -> Tuple[pa_csv.ParseOptions, pa_csv.ConvertOptions]:
+    """Arrow parse/convert options that keep every column as text, the way csv.DictReader does."""
+    return (
+        pa_csv.ParseOptions(newlines_in_values=True),
+        pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False
+        )
+    )
+
+
+def _batch_rows(batch) -> List[Dict]:
+    """Arrow table/record batch as row dicts, zipped from whole columns."""
+    names = batch.schema.names
+    columns = [column.to_pylist() for column in batch.columns]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+@lru_cache(maxsize=8)
+def _read_trades_cached(path: str, mtime_ns: int, size: int) -> Tuple[Dict, ...]:
+    """
+    Parse a trade CSV; keyed on (path, mtime, size) so any rewrite or append invalidates it.
+    
+    Arrow's C++ reader does the parsing with every column kept as text, matching
+    csv.DictReader's rows; files Arrow rejects (e.g. ragged rows) use DictReader.
+    """
+    header = _read_header(path)
+    if not header:
+        return ()
+    
+    parse_options, convert_options = _arrow_text_options(header)
+    try:
+        table = pa_csv.read_csv(path, parse_options=parse_options, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        with open(path, 'r', newline='') as f:
+            return tuple(csv.DictReader(f))
+    
+    # Table.to_pylist() would build each dict through per-cell Arrow scalars
+    return tuple(_batch_rows(table))
+
+
+@lru_cache(maxsize=8)
+def _read_columns_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    names: Optional[Tuple[str, ...]] = None,
+    categorical: Tuple[str, ...] = ()
+) -> Dict[str, Union[np.ndarray, pd.Categorical]]:
+    """
+    Parse a trade CSV into one read-only string array per column; cached like _read_trades_cached.
+    
+    Only `names` present in the header are converted (all columns when None).
+    `categorical` columns are dictionary-decoded by Arrow and returned as
+    pd.Categorical, so no Python string is created per cell.
+    Missing values of ragged rows (DictReader fallback) read as ''.
+    """
+    header = _read_header(path)
+    if names is not None:
+        header = [name for name in header if name in names]
+    if not header:
+        return {}
+    
+    parse_options, convert_options = _arrow_text_options(header)
+    convert_options.include_columns = header
+    # column_types returns a copy, so the dictionary types go in as a whole new mapping
+    convert_options.column_types = {
+        **convert_options.column_types,
+        **{name: pa.dictionary(pa.int32(), pa.string()) for name in categorical if name in header}
+    }
+    try:
+        table = pa_csv.read_csv(path, parse_options=parse_options, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        rows = _read_trades_cached(path, mtime_ns, size)
+        columns = {name: [row.get(name) or '' for row in rows] for name in header}
+    else:
+        # Per-block dictionaries are merged so each column has one set of categories
+        table = table.unify_dictionaries()
+        columns = {}
+        for name, column in zip(table.column_names, table.columns):
+            if pa.types.is_dictionary(column.type):
+                encoded = column.combine_chunks()
+                columns[name] = pd.Categorical.from_codes(
+                    encoded.indices.to_numpy(zero_copy_only=False), encoded.dictionary.to_pylist()
+                )
+            else:
+                columns[name] = column.to_numpy()
+    
+    # Shared through the cache, so callers get arrays they can't modify (categoricals are copied on read)
+    arrays = {}
+    for name, values in columns.items():
+        if name in categorical:
+            arrays[name] = values if isinstance(values, pd.Categorical) else pd.Categorical(values)
+            continue
+        array = np.asarray(values, dtype=str)
+        array.flags.writeable = False
+        arrays[name] = array
+    return arrays
+
 
 class CSVWriter:
     """
     Handles CSV file writing for trade logs.
+    
+    Used as a context manager, the file stays open (buffered) and one
+    csv.writer serves every write until exit; otherwise each write opens and
+    closes the file.
     """
     
+    # Paths whose directory and header were already set up; later writers skip the mkdir only
+    _headered_paths = set()
+    _headered_lock = threading.Lock()
+    
     def __init__(self, filepath: Path):
         """
         Initialize CSV writer.
@@ -45,16 +188,55 @@ class CSVWriter:
             filepath: Path to CSV file
         """
         self.filepath = Path(filepath)
-        self.filepath.parent.mkdir(parents=True, exist_ok=True)
         self._ensure_headers()
+        
+        self._file = None
+        self._writer = None  # csv.writer on self._file inside a context
+    
+    def __enter__(self) -> 'CSVWriter':
+        """Keep the file open for appending until the block exits."""
+        self._file = open(self.filepath, 'a', newline='', buffering=_OPEN_WRITE_BUFFER_BYTES)
+        self._writer = csv.writer(self._file)
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Write out buffered rows and close the file."""
+        self._file.close()
+        self._file = None
+        self._writer = None
+    
+    def _flush_open_file(self) -> None:
+        """Push rows buffered by an open context to the OS, so other handles see them."""
+        if self._file is not None:
+            self._file.flush()
     
     def _ensure_headers(self) -> None:
-        """Ensure CSV file has headers."""
-        if not self.filepath.exists():
-            with open(self.filepath, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=TRADE_CSV_HEADERS)
-                writer.writeheader()
-            logger.info(f"Created CSV file with headers: {self.filepath}")
+        """
+        Ensure CSV file has headers.
+        
+        A path already set up in this process skips the mkdir but is still
+        stat'ed on purpose, so a file deleted or emptied since gets its header back.
+        """
+        key = str(self.filepath)
+        if key in CSVWriter._headered_paths and self._has_content():
+            return
+        
+        # First writer for the path, or the file was deleted/truncated since
+        with CSVWriter._headered_lock:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            if not self._has_content():
+                with open(self.filepath, 'w', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=TRADE_CSV_HEADERS)
+                    writer.writeheader()
+                logger.info(f"Created CSV file with headers: {self.filepath}")
+            CSVWriter._headered_paths.add(key)
+    
+    def _has_content(self) -> bool:
+        """True if the file exists and isn't empty."""
+        try:
+            return self.filepath.stat().st_size > 0
+        except FileNotFoundError:
+            return False
     
     def write_trade(self, trade_data: Dict) -> None:
         """
@@ -63,31 +245,94 @@ class CSVWriter:
         Args:
             trade_data: Dictionary with trade fields
         """
-        with open(self.filepath, 'a', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=TRADE_CSV_HEADERS)
-            
-            # Ensure all required fields exist
-            row = {header: trade_data.get(header, '') for header in TRADE_CSV_HEADERS}
-            writer.writerow(row)
+        # Ensure all required fields exist
+        row = _row_values({**_ROW_DEFAULTS, **trade_data})
+        
+        if self._writer is not None:
+            self._writer.writerow(row)
+        else:
+            with open(self.filepath, 'a', newline='') as f:
+                csv.writer(f).writerow(row)
         
         logger.debug(f"Wrote trade to CSV: {trade_data.get('side')} {trade_data.get('symbol')}")
     
-    def write_trades(self, trades: List[Dict]) -> None:
+    def write_trades(self, trades: List[Dict], sync: bool = False) -> None:
         """
         Write multiple trades to CSV.
         
         Args:
             trades: List of trade dictionaries
+            sync: fsync the file before returning
         """
-        with open(self.filepath, 'a', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=TRADE_CSV_HEADERS)
-            
-            for trade_data in trades:
-                row = {header: trade_data.get(header, '') for header in TRADE_CSV_HEADERS}
-                writer.writerow(row)
+        payload = self._bulk_csv(trades) if len(trades) >= _BULK_WRITE_MIN_ROWS else None
+        
+        if payload is not None:
+            self._flush_open_file()
+            with open(self.filepath, 'ab') as f:
+                f.write(payload)
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            logger.info(f"Wrote {len(trades)} trades to CSV: {self.filepath}")
+            return
+        
+        if self._writer is not None:
+            self._write_rows(self._writer, trades)
+            if sync:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+        else:
+            with open(self.filepath, 'a', newline='') as f:
+                self._write_rows(csv.writer(f), trades)
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
         
         logger.info(f"Wrote {len(trades)} trades to CSV: {self.filepath}")
     
+    @staticmethod
+    def _write_rows(writer, trades: List[Dict]) -> None:
+        """Write trades through a csv.writer, in header order with missing fields as ''."""
+        try:
+            # Complete rows (format_trade_for_csv output) are projected to tuples entirely in C
+            rows = list(map(_row_values, trades))
+        except KeyError:
+            rows = [_row_values({**_ROW_DEFAULTS, **trade_data}) for trade_data in trades]
+        writer.writerows(rows)
+    
+    @staticmethod
+    def _bulk_table(trades: List[Dict]) -> Optional[pa.Table]:
+        """
+        Trades as an Arrow table of string columns, or None if a column isn't all strings.
+        
+        format_trade_for_csv rows are all strings; anything else takes the csv.writer path.
+        """
+        columns = {header: [trade.get(header, '') for trade in trades] for header in TRADE_CSV_HEADERS}
+        try:
+            table = pa.table(columns)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return None
+        return table if all(pa.types.is_string(t) for t in table.schema.types) else None
+    
+    @classmethod
+    def _bulk_csv(cls, trades: List[Dict]) -> Optional[pa.Buffer]:
+        """
+        Trades encoded by Arrow as CSV rows, or None to use csv.writer instead.
+        
+        None when _bulk_table() can't hold them or a field contains a comma,
+        quote or newline: csv.writer quotes only such fields, so every batch size
+        writes the same bytes.
+        """
+        table = cls._bulk_table(trades)
+        if table is None:
+            return None
+        sink = pa.BufferOutputStream()
+        try:
+            pa_csv.write_csv(table, sink, _BULK_WRITE_OPTIONS)
+        except pa.ArrowInvalid:
+            return None
+        return sink.getvalue()
+    
     def read_trades(self) -> List[Dict]:
         """
         Read all trades from CSV.
@@ -95,26 +340,214 @@ class CSVWriter:
         Returns:
             List of trade dictionaries
         """
-        if not self.filepath.exists():
+        self._flush_open_file()
+        try:
+            stat = self.filepath.stat()
+        except FileNotFoundError:
             return []
         
-        trades = []
-        with open(self.filepath, 'r', newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                trades.append(dict(row))
+        # Unchanged files are served from the parse cache; rows are copied so callers may mutate them
+        rows = _read_trades_cached(str(self.filepath), stat.st_mtime_ns, stat.st_size)
+        trades = [dict(row) for row in rows]
         
         logger.debug(f"Read {len(trades)} trades from CSV: {self.filepath}")
         return trades
     
+    def iter_trades(self, batch_size: int = ITER_BATCH_ROWS) -> Iterator[List[Dict]]:
+        """
+        Stream trades from CSV in batches instead of loading the whole file.
+        
+        Arrow's streaming reader parses the file block by block, so memory stays
+        bounded by the batch rather than the log. Rows match read_trades().
+        
+        Args:
+            batch_size: Most trades per batch
+        
+        Yields:
+            Lists of up to batch_size trade dictionaries, in file order
+        """
+        self._flush_open_file()
+        path = str(self.filepath)
+        try:
+            header = _read_header(path)
+        except FileNotFoundError:
+            return
+        if not header:
+            return
+        
+        parse_options, convert_options = _arrow_text_options(header)
+        pending: List[Dict] = []
+        emitted = 0
+        try:
+            reader = pa_csv.open_csv(
+                path,
+                read_options=pa_csv.ReadOptions(block_size=_STREAM_BLOCK_BYTES),
+                parse_options=parse_options,
+                convert_options=convert_options
+            )
+            for record_batch in reader:
+                pending.extend(_batch_rows(record_batch))
+                while len(pending) >= batch_size:
+                    yield pending[:batch_size]
+                    del pending[:batch_size]
+                    emitted += batch_size
+        except pa.ArrowInvalid as e:
+            # Arrow rejected a later block (e.g. a ragged row): resume after the rows already yielded
+            logger.debug(f"Streaming {path} with csv.DictReader: {e}")
+            with open(path, 'r', newline='') as f:
+                rows = itertools.islice(csv.DictReader(f), emitted, None)
+                pending = list(itertools.islice(rows, batch_size))
+                while pending:
+                    yield pending
+                    pending = list(itertools.islice(rows, batch_size))
+            return
+        
+        if pending:
+            yield pending
+    
+    def read_columns(
+        self,
+        names: Optional[Tuple[str, ...]] = None,
+        categorical: Tuple[str, ...] = ()
+    ) -> Dict[str, Union[np.ndarray, pd.Categorical]]:
+        """
+        Read all trades from CSV column-wise.
+        
+        Args:
+            names: Columns to read (default: all); absent ones are left out
+            categorical: Low-cardinality columns (e.g. side, reason) to return as pd.Categorical
+        
+        Returns:
+            Read-only string array (or Categorical) per CSV column, in trade order
+        """
+        self._flush_open_file()
+        try:
+            stat = self.filepath.stat()
+        except FileNotFoundError:
+            return {}
+        
+        cached = _read_columns_cached(str(self.filepath), stat.st_mtime_ns, stat.st_size, names, categorical)
+        columns = {
+            name: values.copy() if isinstance(values, pd.Categorical) else values
+            for name, values in cached.items()
+        }
+        logger.debug(f"Read {len(next(iter(columns.values()), ()))} trades column-wise from CSV: {self.filepath}")
+        return columns
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every cached read_trades()/read_columns() parse and set-up path."""
+        _read_trades_cached.cache_clear()
+        _read_columns_cached.cache_clear()
+        with cls._headered_lock:
+            cls._headered_paths.clear()
+    
     def clear(self) -> None:
         """Clear the CSV file and rewrite headers."""
+        self._flush_open_file()
         with open(self.filepath, 'w', newline='') as f:
             writer = csv.DictWriter(f, fieldnames=TRADE_CSV_HEADERS)
             writer.writeheader()
         logger.info(f"Cleared CSV file: {self.filepath}")
 
 
+class BackgroundCSVWriter(CSVWriter):
+    """
+    CSVWriter whose write_trade() only enqueues; a daemon thread appends the rows.
+    
+    Rows are batched (up to batch_size, or whatever arrived within
+    flush_interval of the first) into one fsynced write_trades() call, so the
+    caller never blocks on file I/O. Call close() to write everything pending.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, filepath: Path, flush_interval: float = 0.1, batch_size: int = 32):
+        """
+        Initialize the writer and start its thread.
+        
+        Args:
+            filepath: Path to CSV file
+            flush_interval: Seconds to gather rows after the first one arrives
+            batch_size: Most rows per write
+        """
+        super().__init__(filepath)
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._writer_loop, name='csv-writer', daemon=True)
+        self._thread.start()
+    
+    def __enter__(self) -> 'BackgroundCSVWriter':
+        """The writer thread already batches writes; exiting the block closes it."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def write_trade(self, trade_data: Dict) -> None:
+        """Queue a trade for the writer thread (returns immediately)."""
+        self._queue.put_nowait(trade_data)
+    
+    def flush(self) -> None:
+        """
+        Block until every queued trade is on disk.
+        
+        Raises:
+            RuntimeError: If trades are still queued but the writer thread has stopped
+        """
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                if not self._thread.is_alive():
+                    raise RuntimeError(
+                        f"CSV writer thread stopped with {self._queue.unfinished_tasks} trades unwritten: {self.filepath}"
+                    )
+                self._queue.all_tasks_done.wait(_FLUSH_POLL_SECONDS)
+    
+    def close(self) -> None:
+        """Write the remaining trades and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+    
+    def read_trades(self) -> List[Dict]:
+        """Read all trades from CSV, including ones still queued."""
+        self.flush()
+        return super().read_trades()
+    
+    def _writer_loop(self) -> None:
+        """Gather queued rows into batches and append them."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch = []
+            if item is self._STOP:
+                stopping = True
+            else:
+                batch.append(item)
+                deadline = time.monotonic() + self._flush_interval
+                while len(batch) < self._batch_size:
+                    try:
+                        item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                    if item is self._STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+            
+            try:
+                if batch:
+                    self.write_trades(batch, sync=True)
+            except Exception as e:
+                # A bad batch is dropped, not allowed to kill the thread
+                logger.error(f"Failed to write {len(batch)} trades to CSV: {e}")
+            finally:
+                # One task_done per item taken, sentinel included, so flush() can return
+                for _ in range(len(batch) + (item is self._STOP)):
+                    self._queue.task_done()
+
+
 def format_trade_for_csv(
     timestamp: datetime,
     symbol: str,
@@ -142,3 +575,53 @@ def format_trade_for_csv(
         'pnl_pct': f"{pnl_pct:.4f}" if pnl_pct is not None else '0.0000',
         'duration_bars': str(duration_bars) if duration_bars is not None else '0'
     }
+
+
+def _fixed_column(values: pd.Series, precision: int, zero_if_falsy: bool = False) -> List[str]:
+    """Fixed-point strings of a numeric column; missing (None/NaN) and, optionally, zero as 0."""
+    numbers = pd.to_numeric(values).to_numpy(dtype=np.float64)
+    blank = np.isnan(numbers)
+    if zero_if_falsy:
+        blank |= numbers == 0
+    return list(map(f"{{:.{precision}f}}".format, np.where(blank, 0.0, numbers).tolist()))
+
+
+def format_trades_bulk(trades: pd.DataFrame) -> pd.DataFrame:
+    """
+    Column-wise format_trade_for_csv over a whole table of raw trades.
+    
+    Each column is formatted in one pass instead of one call per trade.
+    Missing optional values may be None or NaN (both format as zero).
+    
+    Args:
+        trades: Raw trade values, one column per TRADE_CSV_HEADERS name
+    
+    Returns:
+        String DataFrame in TRADE_CSV_HEADERS order, row for row equal to format_trade_for_csv
+    """
+    stamps = trades['timestamp']
+    if pd.api.types.is_datetime64_dtype(stamps) and not stamps.isna().any():
+        values = stamps.to_numpy()
+        whole_seconds = bool((values.astype('datetime64[s]') == values).all())
+    else:
+        whole_seconds = False
+    if whole_seconds:
+        # Naive whole-second times: numpy's ISO strings equal datetime.isoformat()
+        timestamps = np.datetime_as_string(values, unit='s').tolist()
+    else:
+        timestamps = [t.isoformat() if isinstance(t, datetime) else str(t) for t in stamps]
+    
+    durations = pd.to_numeric(trades['duration_bars']).to_numpy(dtype=np.float64)
+    
+    return pd.DataFrame({
+        'timestamp': timestamps,
+        'symbol': trades['symbol'].tolist(),
+        'side': trades['side'].tolist(),
+        'entry_price': _fixed_column(trades['entry_price'], 8, zero_if_falsy=True),
+        'exit_price': _fixed_column(trades['exit_price'], 8, zero_if_falsy=True),
+        'quantity': _fixed_column(trades['quantity'], 8, zero_if_falsy=True),
+        'reason': trades['reason'].tolist(),
+        'pnl': _fixed_column(trades['pnl'], 8),
+        'pnl_pct': _fixed_column(trades['pnl_pct'], 4),
+        'duration_bars': np.where(np.isnan(durations), 0, durations).astype(np.int64).astype(str).tolist()
+    }, columns=TRADE_CSV_HEADERS)
@@ -0,0 +1,129 @@
+"""
+Pooled HTTP sessions for the live Binance clients.
+
+A persistent requests.Session keeps TCP+TLS connections open between calls, so
+only the first request to a host pays the handshake. A background ping keeps the
+pooled connection from being torn down while the live loop is idle.
+pick_fastest_base_url() chooses between Binance's equivalent API hosts by RTT.
+"""
+
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+KEEPALIVE_INTERVAL_SECONDS = 30
+
+# api.binance.com and its api1-3 cluster aliases serve the same REST API
+_BINANCE_API_HOSTS = ('api.binance.com', 'api1.binance.com', 'api2.binance.com', 'api3.binance.com')
+
+# Nagle off (urllib3's default, kept explicit) and TCP keep-alive probes on idle pooled sockets
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class _LowLatencyAdapter(HTTPAdapter):
+    """HTTPAdapter that opens every pooled (and proxied) connection with _SOCKET_OPTIONS."""
+    
+    def init_poolmanager(self, *args, **pool_kwargs):
+        pool_kwargs.setdefault('socket_options', _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **pool_kwargs)
+    
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs.setdefault('socket_options', _SOCKET_OPTIONS)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def create_session() -> requests.Session:
+    """
+    Session with an HTTPS connection pool (TCP_NODELAY, SO_KEEPALIVE) and no automatic retries.
+
+    Retries are left to the callers: an order POST must never be replayed blindly.
+    """
+    session = requests.Session()
+    session.mount('https://', _LowLatencyAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+    return session
+
+
+def start_keepalive(
+    session: requests.Session,
+    base_url: Callable[[], str],
+    interval: float = KEEPALIVE_INTERVAL_SECONDS
+) -> threading.Event:
+    """
+    Ping {base_url()}/api/v3/ping every `interval` seconds in a daemon thread.
+
+    Args:
+        session: Session whose pooled connection should stay warm
+        base_url: Returns the current base URL (it may be switched at runtime)
+        interval: Seconds between pings
+
+    Returns:
+        Event that stops the thread when set
+    """
+    stop = threading.Event()
+
+    def _ping() -> None:
+        while not stop.wait(interval):
+            try:
+                session.get(f"{base_url()}/api/v3/ping", timeout=5)
+            except requests.RequestException as e:
+                logger.debug("Keep-alive ping failed: %s", e)
+
+    threading.Thread(target=_ping, name='binance-keepalive', daemon=True).start()
+    return stop
+
+
+def endpoint_candidates(base_url: str) -> List[str]:
+    """Equivalent base URLs for base_url (only api.binance.com has aliases; testnet has none)."""
+    parts = urlsplit(base_url)
+    if parts.hostname not in _BINANCE_API_HOSTS:
+        return [base_url]
+    return [f"{parts.scheme}://{host}" for host in _BINANCE_API_HOSTS]
+
+
+def pick_fastest_base_url(session: requests.Session, base_url: str, timeout: float = 2.0) -> str:
+    """
+    Time GET /api/v3/time against every equivalent host in parallel and return the fastest.
+
+    Args:
+        session: Session to probe with (the winner's connection stays pooled)
+        base_url: Configured base URL
+        timeout: Per-probe timeout in seconds
+
+    Returns:
+        Fastest responding base URL, or base_url if it has no aliases or none respond
+    """
+    candidates = endpoint_candidates(base_url)
+    if len(candidates) == 1:
+        return base_url
+
+    def _rtt(url: str) -> float:
+        started = time.perf_counter()
+        try:
+            session.get(f"{url}/api/v3/time", timeout=timeout).raise_for_status()
+        except requests.RequestException:
+            return float('inf')
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+        rtts = list(pool.map(_rtt, candidates))
+
+    best = min(range(len(candidates)), key=rtts.__getitem__)
+    if rtts[best] == float('inf'):
+        logger.warning(f"No Binance endpoint answered; keeping {base_url}")
+        return base_url
+
+    logger.info(f"Fastest Binance endpoint: {candidates[best]} ({rtts[best] * 1000:.0f} ms)")
+    return candidates[best]
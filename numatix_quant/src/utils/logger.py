@@ -1,13 +1,22 @@
 """
 Structured Logger for Numatix-Quant Trading System.
 Provides unified logging format across all modules.
+
+Loggers enqueue records through a QueueHandler; the console and file
+handlers run on a background QueueListener so log calls never wait on I/O.
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional
 
 
 # Create logs directory
@@ -19,17 +28,38 @@ class StructuredFormatter(logging.Formatter):
     """
     Custom formatter for structured logging.
     Format: [TIMESTAMP] [LEVEL] [MODULE] MESSAGE
+    
+    The second-resolution part of the timestamp is rendered once per second
+    and the milliseconds appended from record.msecs, and each logger's module
+    name is derived once, so a record costs one %-substitution.
     """
     
+    _LINE_FORMAT = '[%s.%03d] [%-8s] [%-20s] %s'
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = (None, '')
+        self._modules: Dict[str, str] = {}
+    
+    def _second_stamp(self, created: float) -> str:
+        """'%Y-%m-%d %H:%M:%S' of created (local time), reformatted only when the second changes."""
+        second = int(created)
+        cached_second, stamp = self._cached_second
+        if second != cached_second:
+            stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+            self._cached_second = (second, stamp)
+        return stamp
+    
     def format(self, record: logging.LogRecord) -> str:
-        # Add custom timestamp format
-        timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-        
         # Module name (last part of logger name)
-        module = record.name.split('.')[-1] if '.' in record.name else record.name
+        module = self._modules.get(record.name)
+        if module is None:
+            module = self._modules[record.name] = record.name.rsplit('.', 1)[-1]
         
         # Format the message
-        formatted = f"[{timestamp}] [{record.levelname:8}] [{module:20}] {record.getMessage()}"
+        formatted = self._LINE_FORMAT % (
+            self._second_stamp(record.created), record.msecs, record.levelname, module, record.getMessage()
+        )
         
         # Add exception info if present
         if record.exc_info:
@@ -38,6 +68,78 @@ class StructuredFormatter(logging.Formatter):
         return formatted
 
 
+# Console/file handlers run on QueueListener threads; loggers only get a QueueHandler per sink
+_queue_handlers: Dict[str, QueueHandler] = {}
+_listeners: List[QueueListener] = []
+_sinks_lock = threading.Lock()
+
+
+def _sink_handler(sink: str, build_handlers: Callable[[], List[logging.Handler]]) -> QueueHandler:
+    """
+    QueueHandler for a named sink, building its handlers and listener on first use.
+    
+    Args:
+        sink: Sink name (one listener thread and set of handlers per sink)
+        build_handlers: Creates the sink's console/file handlers
+    
+    Returns:
+        Shared QueueHandler that enqueues records for the sink's listener
+    """
+    with _sinks_lock:
+        handler = _queue_handlers.get(sink)
+        if handler is None:
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, *build_handlers(), respect_handler_level=True)
+            listener.start()
+            _listeners.append(listener)
+            handler = _queue_handlers[sink] = QueueHandler(log_queue)
+        return handler
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    """Write out every queued record and stop the listener threads."""
+    for listener in _listeners:
+        listener.stop()
+
+
+def _build_structured_handlers() -> List[logging.Handler]:
+    """Console (INFO) and daily file (DEBUG) handlers with StructuredFormatter."""
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(StructuredFormatter())
+    
+    # File handler
+    log_file = LOGS_DIR / f'numatix_{datetime.now().strftime("%Y%m%d")}.log'
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(StructuredFormatter())
+    
+    return [console_handler, file_handler]
+
+
+def _build_live_handlers() -> List[logging.Handler]:
+    """Console (INFO) and daily live file (DEBUG) handlers with the simple live format."""
+    # Simple format: timestamp - name - level - message
+    simple_format = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(simple_format)
+    
+    # File handler
+    log_file = LOGS_DIR / f'live_{datetime.now().strftime("%Y%m%d")}.log'
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(simple_format)
+    
+    return [console_handler, file_handler]
+
+
 def get_logger(name: str, level: int = logging.DEBUG) -> logging.Logger:
     """
     Get a configured logger instance.
@@ -49,6 +151,12 @@ def get_logger(name: str, level: int = logging.DEBUG) -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    return _build_logger(name, level)
+
+
+@lru_cache(maxsize=None)
+def _build_logger(name: str, level: int) -> logging.Logger:
+    """Configure the named logger once; later get_logger() calls are a cache lookup."""
     logger = logging.getLogger(name)
     
     # Avoid adding handlers multiple times
@@ -57,18 +165,8 @@ def get_logger(name: str, level: int = logging.DEBUG) -> logging.Logger:
     
     logger.setLevel(level)
     
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(StructuredFormatter())
-    logger.addHandler(console_handler)
-    
-    # File handler
-    log_file = LOGS_DIR / f'numatix_{datetime.now().strftime("%Y%m%d")}.log'
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(StructuredFormatter())
-    logger.addHandler(file_handler)
+    # Console + file output happen on the listener thread, off the caller's path
+    logger.addHandler(_sink_handler('structured', _build_structured_handlers))
     
     return logger
 
@@ -80,18 +178,20 @@ def log_data_arrival(logger: logging.Logger, symbol: str, timeframe: str, timest
 
 def log_signal(logger: logging.Logger, signal_type: str, details: str) -> None:
     """Log signal generation event."""
-    logger.info(f"SIGNAL: {signal_type} - {details}")
+    logger.info("SIGNAL: %s - %s", signal_type, details)
 
 
 def log_order(logger: logging.Logger, side: str, symbol: str, quantity: float, price: Optional[float] = None) -> None:
     """Log order placement event."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     price_str = f"@ {price:.2f}" if price else "MARKET"
-    logger.info(f"ORDER: {side} {quantity} {symbol} {price_str}")
+    logger.info("ORDER: %s %s %s %s", side, quantity, symbol, price_str)
 
 
 def log_fill(logger: logging.Logger, side: str, symbol: str, quantity: float, fill_price: float) -> None:
     """Log order fill event."""
-    logger.info(f"FILL: {side} {quantity} {symbol} @ {fill_price:.2f}")
+    logger.info("FILL: %s %s %s @ %.2f", side, quantity, symbol, fill_price)
 
 
 def get_live_logger(name: str = "LIVE") -> logging.Logger:
@@ -115,22 +215,7 @@ def get_live_logger(name: str = "LIVE") -> logging.Logger:
     
     logger.setLevel(logging.DEBUG)
     
-    # Simple format: timestamp - name - level - message
-    simple_format = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(simple_format)
-    logger.addHandler(console_handler)
-    
-    # File handler
-    log_file = LOGS_DIR / f'live_{datetime.now().strftime("%Y%m%d")}.log'
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(simple_format)
-    logger.addHandler(file_handler)
+    # Console + file output happen on the listener thread, off the caller's path
+    logger.addHandler(_sink_handler('live', _build_live_handlers))
     
     return logger
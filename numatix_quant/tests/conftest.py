@@ -0,0 +1,8 @@
+"""Puts the project root on sys.path once for every test module (src.*, config.*)."""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
@@ -0,0 +1,21 @@
+import dataclasses
+import pickle
+import pytest
+from config import config
+from config.config import CFG
+
+
+def test_cfg_mirrors_module_constants():
+    """CFG carries the same values as the module-level settings."""
+    for field in dataclasses.fields(CFG):
+        assert getattr(CFG, field.name) == getattr(config, field.name)
+
+
+def test_cfg_is_frozen_and_picklable():
+    """CFG cannot be mutated; overrides go through replace() and survive pickling."""
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        CFG.SYMBOL = 'ETHUSDT'
+    
+    variant = dataclasses.replace(CFG, EMA_FAST_ENTRY=CFG.EMA_FAST_ENTRY + 1)
+    assert pickle.loads(pickle.dumps(variant)) == variant
+    assert variant.EMA_FAST_ENTRY != CFG.EMA_FAST_ENTRY
@@ -0,0 +1,246 @@
+from datetime import datetime
+from src.utils.csv_writer import BackgroundCSVWriter, CSVWriter, format_trade_for_csv
+
+
+def _trade(i):
+    return format_trade_for_csv(
+        timestamp=datetime(2024, 9, 1, 0, 5 * i), symbol='BTCUSDT', side='BUY',
+        entry_price=100.0 + i, quantity=1.0, reason='ENTRY_LONG'
+    )
+
+
+def test_background_writer_matches_direct_writes(tmp_path):
+    """Queued rows land in the file in order, identical to writing them synchronously."""
+    direct = CSVWriter(tmp_path / 'direct.csv')
+    queued = BackgroundCSVWriter(tmp_path / 'queued.csv', flush_interval=0.01, batch_size=4)
+
+    for i in range(10):
+        direct.write_trade(_trade(i))
+        queued.write_trade(_trade(i))
+
+    assert queued.read_trades() == direct.read_trades()  # read_trades flushes first
+    queued.write_trade(_trade(10))
+    queued.close()
+
+    assert len(CSVWriter(tmp_path / 'queued.csv').read_trades()) == 11
+    assert (tmp_path / 'queued.csv').read_text().count('\n') == 12  # header + rows
+
+
+def test_background_writer_survives_a_bad_batch(tmp_path):
+    """A batch that fails to write is dropped; the thread keeps going and flush() never hangs."""
+    import pytest
+
+    writer = BackgroundCSVWriter(tmp_path / 'queued.csv', flush_interval=0.01, batch_size=1)
+    writer.write_trade(None)  # TypeError inside write_trades
+    writer.flush()
+    writer.write_trade(_trade(0))
+    assert len(writer.read_trades()) == 1
+
+    writer.close()
+    writer.write_trade(_trade(1))
+    with pytest.raises(RuntimeError):
+        writer.flush()
+
+
+def test_bulk_write_matches_row_writes(tmp_path):
+    """Large batches go through the columnar writer and write the same bytes as per-row writes."""
+    from src.utils import csv_writer
+
+    trades = [_trade(i % 12) for i in range(csv_writer._BULK_WRITE_MIN_ROWS + 5)]
+    trades[3] = {'timestamp': '2024-09-01T00:00:00', 'symbol': 'BTCUSDT', 'side': 'SELL'}  # sparse
+    assert CSVWriter._bulk_csv(trades) is not None
+    quoted = list(trades)
+    quoted[4] = dict(trades[4], symbol='BTC,"USDT"')  # needs quotes: csv.writer path
+    assert CSVWriter._bulk_csv(quoted) is None
+
+    for name, batch in (('plain', trades), ('quoted', quoted)):
+        bulk = CSVWriter(tmp_path / f'bulk_{name}.csv')
+        bulk.write_trades(batch)
+        rows = CSVWriter(tmp_path / f'rows_{name}.csv')
+        for trade in batch:
+            rows.write_trade(trade)
+
+        assert (tmp_path / f'bulk_{name}.csv').read_bytes() == (tmp_path / f'rows_{name}.csv').read_bytes()
+        assert bulk.read_trades() == rows.read_trades()
+
+    # Non-string values fall back to the row-wise csv.writer path
+    mixed = [dict(trade, quantity=1.0) for trade in trades]
+    assert CSVWriter._bulk_table(mixed) is None
+
+
+def test_read_trades_cache_follows_file_changes(tmp_path):
+    """Repeat reads reuse the parse; appends invalidate it and returned rows are independent copies."""
+    from src.utils import csv_writer
+
+    CSVWriter.clear_cache()
+    writer = CSVWriter(tmp_path / 'trades.csv')
+    writer.write_trade(_trade(0))
+
+    first = writer.read_trades()
+    first[0]['side'] = 'MUTATED'
+    assert writer.read_trades()[0]['side'] == 'BUY'
+    assert csv_writer._read_trades_cached.cache_info().hits == 1
+
+    writer.write_trade(_trade(1))
+    assert len(writer.read_trades()) == 2
+
+
+def test_read_trades_matches_dict_reader(tmp_path):
+    """Arrow-parsed rows equal csv.DictReader's: all text, quoted commas/newlines intact."""
+    import csv
+
+    writer = CSVWriter(tmp_path / 'trades.csv')
+    writer.write_trade(_trade(0))
+    writer.write_trade({'timestamp': '2024-09-01T00:10:00', 'symbol': 'BTC,\n"USDT"', 'side': 'SELL'})
+
+    with open(tmp_path / 'trades.csv', newline='') as f:
+        expected = list(csv.DictReader(f))
+    rows = writer.read_trades()
+    assert rows == expected
+    assert all(isinstance(value, str) for row in rows for value in row.values())
+
+    (tmp_path / 'empty.csv').write_text('')
+    assert CSVWriter(tmp_path / 'empty.csv').read_trades() == []
+
+
+def test_iter_trades_batches_match_read_trades(tmp_path):
+    """Streamed batches concatenate to read_trades(), including files Arrow rejects."""
+    writer = CSVWriter(tmp_path / 'trades.csv')
+    writer.write_trades([_trade(i % 12) for i in range(23)])
+
+    batches = list(writer.iter_trades(batch_size=10))
+    assert [len(b) for b in batches] == [10, 10, 3]
+    assert [row for batch in batches for row in batch] == writer.read_trades()
+
+    with open(tmp_path / 'trades.csv', 'a') as f:
+        f.write('2024-09-02T00:00:00,BTCUSDT\n')  # ragged row
+    rows = [row for batch in writer.iter_trades(batch_size=10) for row in batch]
+    assert rows == writer.read_trades() and len(rows) == 24
+
+
+def test_context_writer_keeps_one_handle(tmp_path):
+    """Inside the context rows go through one open file and read back like per-call writes."""
+    direct = CSVWriter(tmp_path / 'direct.csv')
+    for i in range(5):
+        direct.write_trade(_trade(i))
+
+    with CSVWriter(tmp_path / 'held.csv') as held:
+        handle = held._file
+        for i in range(4):
+            held.write_trade(_trade(i))
+        assert held._file is handle
+        assert len(held.read_trades()) == 4  # buffered rows are flushed before reading
+        held.write_trades([_trade(4)])
+    assert held._file is None and handle.closed
+
+    assert held.read_trades() == direct.read_trades()
+    held.write_trade(_trade(5))  # outside the context: open-per-call fallback
+    assert len(held.read_trades()) == 6
+
+
+def test_rows_follow_header_order(tmp_path):
+    """Rows are written in header order; missing fields are blank and unknown keys ignored."""
+    writer = CSVWriter(tmp_path / 'trades.csv')
+    writer.write_trade({'side': 'SELL', 'symbol': 'BTCUSDT', 'note': 'ignored'})
+    lines = (tmp_path / 'trades.csv').read_text().splitlines()
+    assert lines[1] == ',BTCUSDT,SELL,,,,,,,'
+
+
+def test_format_trades_bulk_matches_per_trade_formatting():
+    """Column-wise formatting gives exactly format_trade_for_csv's rows, including the zero defaults."""
+    import pandas as pd
+    from datetime import timedelta
+    from src.utils.csv_writer import TRADE_CSV_HEADERS, format_trades_bulk
+
+    rows = []
+    for i in range(6):
+        closed = i % 2 == 1
+        rows.append((
+            datetime(2024, 9, 1) + timedelta(minutes=5 * i, microseconds=250 if i == 3 else 0),
+            'BTCUSDT', 'SELL' if closed else 'BUY', 0.0 if i == 4 else 100.0 + i,
+            101.5 + i if closed else None, 0.01, 'EXIT_SIGNAL' if closed else 'ENTRY_LONG',
+            -0.0 if i == 5 else (1.25 if closed else None), 0.5 if closed else None, i if closed else None
+        ))
+
+    expected = [format_trade_for_csv(*row) for row in rows]
+    assert format_trades_bulk(pd.DataFrame(rows, columns=TRADE_CSV_HEADERS)).to_dict('records') == expected
+    whole = [rows[i] for i in (0, 1, 2, 4, 5)]  # whole-second timestamps take the numpy path
+    assert format_trades_bulk(pd.DataFrame(whole, columns=TRADE_CSV_HEADERS)).to_dict('records') == [expected[i] for i in (0, 1, 2, 4, 5)]
+
+
+def test_read_columns_match_read_trades(tmp_path):
+    """Column-wise reads hold the same values as read_trades() and can't be modified."""
+    import pytest
+
+    writer = CSVWriter(tmp_path / 'trades.csv')
+    writer.write_trades([_trade(i) for i in range(5)])
+
+    columns = writer.read_columns()
+    rows = writer.read_trades()
+    assert list(columns) == list(rows[0])
+    assert all(columns[name].tolist() == [row[name] for row in rows] for name in columns)
+    with pytest.raises(ValueError):
+        columns['side'][0] = 'SELL'
+    assert list(writer.read_columns(('side', 'missing', 'timestamp'))) == ['timestamp', 'side']
+
+
+def test_categorical_columns_are_read_as_arrow_dictionaries(tmp_path, monkeypatch):
+    """Categorical columns are dictionary-encoded by Arrow itself, not parsed as text first."""
+    import pandas as pd
+    import pyarrow as pa
+    from src.utils import csv_writer
+
+    writer = CSVWriter(tmp_path / 'trades.csv')
+    writer.write_trades([_trade(i) for i in range(5)])
+
+    tables = []
+    read_csv = csv_writer.pa_csv.read_csv
+    def recording_read_csv(*args, **kwargs):
+        tables.append(read_csv(*args, **kwargs))
+        return tables[-1]
+    monkeypatch.setattr(csv_writer.pa_csv, 'read_csv', recording_read_csv)
+
+    columns = writer.read_columns(('side', 'reason', 'symbol'), categorical=('side', 'reason'))
+    schema = tables[0].schema
+    assert pa.types.is_dictionary(schema.field('side').type)
+    assert pa.types.is_dictionary(schema.field('reason').type)
+    assert pa.types.is_string(schema.field('symbol').type)
+    assert isinstance(columns['side'], pd.Categorical)
+    assert columns['side'].tolist() == ['BUY'] * 5
+
+
+def test_header_check_is_cached_per_path(tmp_path, monkeypatch):
+    """Only the first writer for a path creates its directory; clear_cache() forgets it."""
+    from pathlib import Path
+
+    path = tmp_path / 'nested' / 'trades.csv'
+    CSVWriter(path)
+    assert path.read_text().startswith('timestamp,')
+
+    def no_mkdir(self, *args, **kwargs):
+        raise AssertionError('mkdir after the first writer')
+
+    monkeypatch.setattr(Path, 'mkdir', no_mkdir)
+    CSVWriter(path).write_trade(_trade(0))
+    monkeypatch.undo()
+
+    path.unlink()
+    CSVWriter.clear_cache()
+    CSVWriter(path)
+    assert path.read_text().count('\n') == 1
+
+
+def test_header_is_rewritten_after_the_file_is_deleted(tmp_path):
+    """A cached path whose file was removed or emptied gets its header back."""
+    path = tmp_path / 'trades.csv'
+    CSVWriter(path).write_trade(_trade(0))
+
+    path.unlink()
+    writer = CSVWriter(path)
+    writer.write_trade(_trade(1))
+    assert path.read_text().startswith('timestamp,')
+    assert [row['entry_price'] for row in writer.read_trades()] == [_trade(1)['entry_price']]
+
+    path.write_text('')
+    CSVWriter(path)
+    assert path.read_text().startswith('timestamp,')
@@ -1,7 +1,3 @@
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 try:
     from src.core.strategy_multi_tf import StrategyMultiTF
     print("Import StrategyMultiTF successful")
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from src.core.indicators import ema, ema_sma_seeded
+from src.core.strategy_multi_tf import StrategyMultiTF
+
+
+def _prices(n=300, seed=7):
+    rng = np.random.default_rng(seed)
+    return 50000 + np.cumsum(rng.normal(0, 50, n))
+
+
+def test_ema_matches_recursive_formula():
+    """Plain EMA seeds with the first value and follows the strategy formula."""
+    prices = _prices()
+    out = ema(prices, 8)
+    
+    expected = prices[0]
+    for i, price in enumerate(prices):
+        if i > 0:
+            expected = (price - expected) * (2 / 9) + expected
+        assert out[i] == expected
+
+
+def test_ema_sma_seeded_matches_strategy():
+    """SMA-seeded kernel reproduces the strategy's incremental entry EMAs."""
+    s = StrategyMultiTF(symbol="BTCUSDT", quantity=1.0)
+    prices = _prices()
+    fast = ema_sma_seeded(prices, s.ema_fast_entry_period, s.ema_slow_entry_period)
+    slow = ema_sma_seeded(prices, s.ema_slow_entry_period, s.ema_slow_entry_period)
+    
+    for i, price in enumerate(prices):
+        s._update_emas_entry(price)
+        if s._ema_fast_entry is None:
+            assert np.isnan(fast[i]) and np.isnan(slow[i])
+        else:
+            assert fast[i] == pytest.approx(s._ema_fast_entry, rel=1e-12)
+            assert slow[i] == pytest.approx(s._ema_slow_entry, rel=1e-12)
+
+
+def test_ema_sma_seeded_short_input():
+    """Series shorter than the seed length is all NaN."""
+    out = ema_sma_seeded(_prices(10), 8, 21)
+    assert out.shape == (10,)
+    assert np.isnan(out).all()
@@ -0,0 +1,286 @@
+import json
+from datetime import datetime
+from src.live.live_feed_binance import BinanceLiveFeed
+from config.config import TIMEFRAME_ENTRY, TIMEFRAME_CONFIRMATION
+
+
+def _frame(interval, open_ms, close, closed=True):
+    return json.dumps({
+        'stream': f"btcusdt@kline_{interval}",
+        'data': {'e': 'kline', 'k': {
+            't': open_ms, 'i': interval, 'o': '100.0', 'h': '101.0', 'l': '99.0',
+            'c': str(close), 'v': '5.0', 'x': closed
+        }}
+    })
+
+
+def test_stream_frames_drain_in_order():
+    """Closed stream klines are queued once and handed out oldest first; forming ones are ignored."""
+    feed = BinanceLiveFeed('BTCUSDT', use_websocket=False)
+    t0 = 1_725_148_800_000
+
+    feed._on_stream_message(None, _frame(TIMEFRAME_ENTRY, t0, 100.5))
+    feed._on_stream_message(None, _frame(TIMEFRAME_ENTRY, t0, 100.5))  # duplicate
+    feed._on_stream_message(None, _frame(TIMEFRAME_ENTRY, t0 + 300_000, 102.0, closed=False))
+    feed._on_stream_message(None, _frame(TIMEFRAME_ENTRY, t0 + 300_000, 101.5))
+    feed._on_stream_message(None, _frame(TIMEFRAME_CONFIRMATION, t0, 99.5))
+
+    entry, conf = feed._drain_stream()
+    assert entry.timestamp == datetime(2024, 9, 1)  # naive UTC open time
+    assert entry.close == 100.5
+    assert conf.close == 99.5
+
+    entry, conf = feed._drain_stream()
+    assert entry.close == 101.5
+    assert conf is None
+
+    assert feed._drain_stream() == (None, None)
+    assert len(feed.get_all_entry_bars()) == 2
+
+
+def test_parse_klines_columns():
+    """Raw kline rows parse into int64 open times and float64 OHLCV bars."""
+    from src.live.live_feed_binance import _parse_klines, _bars_from_arrays
+
+    t0 = 1_725_148_800_000
+    raw = [
+        [t0, '100.0', '101.5', '99.0', '100.5', '12.25', t0 + 299_999, '0', 10, '0', '0', '0'],
+        [t0 + 300_000, '100.5', '102.0', '100.0', '101.0', '8.5', t0 + 599_999, '0', 7, '0', '0', '0'],
+    ]
+    open_ms, ohlcv = _parse_klines(raw)
+    assert open_ms.tolist() == [t0, t0 + 300_000]
+    assert ohlcv.dtype == 'float64' and ohlcv.shape == (2, 5)
+
+    bars = _bars_from_arrays(open_ms, ohlcv)
+    assert bars[1].timestamp == datetime(2024, 9, 1, 0, 5)
+    assert (bars[1].open, bars[1].close, bars[1].volume) == (100.5, 101.0, 8.5)
+    assert _bars_from_arrays(*_parse_klines([])) == []
+
+
+def test_rest_poll_compares_epoch_ms(monkeypatch):
+    """The REST poll emits the last closed kline once, keyed by its integer open time."""
+    from src.live.live_feed_binance import _parse_klines
+
+    feed = BinanceLiveFeed('BTCUSDT', use_websocket=False)
+    monkeypatch.setattr(feed, '_refresh_base_url', lambda: None)
+    t0 = 1_725_148_800_000
+    raw = [
+        [t0, '100.0', '101.0', '99.0', '100.5', '1.0'],
+        [t0 + 300_000, '100.5', '102.0', '100.0', '101.0', '1.0'],
+    ]
+    monkeypatch.setattr(feed, '_fetch_kline_arrays', lambda interval, limit: _parse_klines(raw))
+
+    entry, conf = feed.poll_new_bars()
+    assert entry.timestamp == datetime(2024, 9, 1) and entry.close == 100.5
+    assert feed._last_entry_ms == t0
+    assert conf is not None
+
+    assert feed.poll_new_bars() == (None, None)
+
+
+def test_paginated_warmup_fetch_is_contiguous(monkeypatch):
+    """Warmup beyond one page joins concurrent endTime windows into one gap-free series."""
+    import numpy as np
+    from concurrent.futures import ThreadPoolExecutor
+
+    feed = BinanceLiveFeed('BTCUSDT', use_websocket=False)
+    step = 300_000
+    now_open = 1_725_148_800_000
+    monkeypatch.setattr('time.time', lambda: (now_open + 1_000) / 1000)
+    requested = []
+
+    def fake_fetch(interval, limit, start_time=None, end_time=None):
+        requested.append((start_time, end_time))
+        open_ms = np.arange(start_time, end_time + 1, step, dtype=np.int64)[:limit]
+        return open_ms, np.ones((len(open_ms), 5))
+
+    monkeypatch.setattr(feed, '_fetch_kline_arrays', fake_fetch)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        open_ms, ohlcv = feed._collect_recent_klines(feed._submit_recent_klines(pool, '5m', 2500), 2500)
+
+    assert len(requested) == 3
+    assert len(open_ms) == 2500 and ohlcv.shape == (2500, 5)
+    assert open_ms[-1] == now_open
+    assert (np.diff(open_ms) == step).all()
+
+
+def test_pick_fastest_base_url_skips_dead_hosts():
+    """The fastest answering alias wins; hosts without aliases are returned untouched."""
+    import requests
+    from src.utils.http_session import pick_fastest_base_url
+
+    class _Session:
+        def get(self, url, timeout):
+            if 'api1.' not in url:
+                raise requests.ConnectionError(url)
+            return _Ok()
+
+    class _Ok:
+        def raise_for_status(self):
+            pass
+
+    assert pick_fastest_base_url(_Session(), 'https://api.binance.com') == 'https://api1.binance.com'
+    assert pick_fastest_base_url(_Session(), 'https://testnet.binance.vision') == 'https://testnet.binance.vision'
+
+
+def test_sign_request_matches_binance_example(monkeypatch):
+    """Signing with the reused HMAC template reproduces Binance's documented example signature."""
+    import hmac
+    import hashlib
+    from src.execution import executor_live_binance
+    from src.execution.executor_live_binance import BinanceLiveExecutor
+
+    executor = BinanceLiveExecutor()
+    secret = 'NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j'
+    executor._hmac_template = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+    monkeypatch.setattr(executor_live_binance.time, 'time', lambda: 1499827319.559)
+
+    params = {
+        'symbol': 'LTCBTC', 'side': 'BUY', 'type': 'LIMIT', 'timeInForce': 'GTC',
+        'quantity': 1, 'price': 0.1, 'recvWindow': 5000
+    }
+    for _ in range(2):  # the template must not be consumed by the first signature
+        signed = executor._sign_request(dict(params))
+        assert signed['signature'] == 'c8db56825ae71d6d79447849e617115f4a920fa2acdcab2b053c4b2838bd6b71'
+    executor.close()
+
+
+def test_align_conf_bars_matches_period_lookup():
+    """Warmup alignment picks the confirmation bar opened at the entry bar's period start, or None."""
+    from datetime import timedelta
+    from src.core.strategy_base import BarData
+    from src.live.live_runner import align_conf_bars
+
+    t0 = datetime(2024, 9, 1)
+    bars_entry = [BarData(t0 + timedelta(minutes=15 * i), 1, 1, 1, 1, 1) for i in range(40)]
+    # Hourly bars with one missing (02:00) and none before 01:00
+    bars_conf = [BarData(t0 + timedelta(hours=h), 1, 1, 1, h, 1) for h in (1, 3, 4, 5, 6, 7, 8, 9)]
+
+    by_open = {bar.timestamp: bar for bar in bars_conf}
+    expected = [by_open.get(bar.timestamp.replace(minute=0)) for bar in bars_entry]
+
+    assert align_conf_bars(bars_entry, bars_conf, 60) == expected
+    assert expected[4] is bars_conf[0] and expected[8] is None
+    assert align_conf_bars(bars_entry, bars_conf, 0) == [None] * 40
+
+
+def test_prefix_signing_matches_full_signing(monkeypatch):
+    """Cached-prefix signatures for account/open-orders equal signing the whole query."""
+    import hmac
+    import hashlib
+    from src.execution import executor_live_binance
+    from src.execution.executor_live_binance import BinanceLiveExecutor
+
+    executor = BinanceLiveExecutor()
+    executor._hmac_template = hmac.new(b'secret', digestmod=hashlib.sha256)
+    monkeypatch.setattr(executor_live_binance.time, 'time', lambda: 1725148800.123)
+
+    for _ in range(2):
+        assert executor._sign_prefixed('timestamp=', {}) == executor._sign_request({})
+        assert (executor._sign_prefixed('symbol=BTCUSDT&timestamp=', {'symbol': 'BTCUSDT'})
+                == executor._sign_request({'symbol': 'BTCUSDT'}))
+    executor.close()
+
+
+def test_prefix_hmac_cache_is_bounded():
+    """Prefix HMAC states are evicted least recently used first once the cache is full."""
+    from src.execution import executor_live_binance
+    from src.execution.executor_live_binance import BinanceLiveExecutor
+
+    executor = BinanceLiveExecutor()
+    executor._sign_prefixed('timestamp=', {})
+    for i in range(executor_live_binance._PREFIX_HMAC_CACHE_SIZE * 2):
+        executor._sign_prefixed(executor._market_order_prefix('BTCUSDT', 'BUY', 0.001 * (i + 1)), {})
+        executor._sign_prefixed('timestamp=', {})  # kept warm
+
+    assert len(executor._prefix_hmacs) == executor_live_binance._PREFIX_HMAC_CACHE_SIZE
+    assert 'timestamp=' in executor._prefix_hmacs
+    executor.close()
+
+
+def test_market_order_prefix_matches_urlencode(monkeypatch):
+    """Market orders signed from their f-string prefix sign exactly what urlencode (and requests) would send."""
+    import hmac
+    import hashlib
+    from urllib.parse import urlencode
+    from src.execution import executor_live_binance
+    from src.execution.executor_live_binance import BinanceLiveExecutor
+
+    executor = BinanceLiveExecutor()
+    executor._hmac_template = hmac.new(b'secret', digestmod=hashlib.sha256)
+    monkeypatch.setattr(executor_live_binance.time, 'time', lambda: 1725148800.123)
+
+    for quantity in (0.001, 1.0, 1e-05, 2):
+        params = {'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'MARKET', 'quantity': quantity}
+        signed = executor._sign_prefixed(executor._market_order_prefix('BTCUSDT', 'BUY', quantity), params)
+        query = urlencode({k: v for k, v in signed.items() if k != 'signature'})
+        assert signed['signature'] == hmac.new(b'secret', query.encode(), hashlib.sha256).hexdigest()
+    executor.close()
+
+
+def test_wait_for_bar_wakes_on_stream_push():
+    """wait_for_bar returns as soon as the stream queues a bar, and at once while entry bars are pending."""
+    import threading
+    import time
+
+    class _Sock:
+        connected = True
+
+    class _App:
+        sock = _Sock()
+
+        def close(self):
+            pass
+
+    feed = BinanceLiveFeed('BTCUSDT', use_websocket=False)
+    feed._ws_app = _App()
+    t0 = 1_725_148_800_000
+
+    threading.Timer(0.05, feed._on_stream_message, args=(None, _frame(TIMEFRAME_ENTRY, t0, 100.5))).start()
+    started = time.monotonic()
+    assert feed.wait_for_bar(5.0)
+    assert time.monotonic() - started < 2.0
+
+    assert feed.wait_for_bar(5.0)  # still queued
+    entry, _ = feed.poll_new_bars()
+    assert entry.close == 100.5
+    assert not feed.wait_for_bar(0.05)
+    feed.close()
+
+
+def test_rejected_order_falls_back_to_simulation(monkeypatch):
+    """A non-200 order response is simulated at the reference price without raising."""
+    from datetime import datetime as dt
+    from src.core.trade_intent import TradeIntent, TradeReason, TradeSide
+    from src.execution.executor_live_binance import BinanceLiveExecutor
+
+    class _Response:
+        status_code = 400
+        text = '{"code":-2010,"msg":"insufficient balance"}'
+        content = text.encode()
+
+    executor = BinanceLiveExecutor()
+    monkeypatch.setattr(executor._get_session(), 'post', lambda *args, **kwargs: _Response())
+    intent = TradeIntent(
+        timestamp=dt(2024, 9, 1), symbol='BTCUSDT', side=TradeSide.BUY,
+        quantity=0.001, reason=TradeReason.ENTRY_LONG
+    )
+
+    result = executor._execute_real_order(intent, 60000.0)
+    assert result.entry_price == 60000.0 and result.quantity == 0.001
+    executor.close()
+
+
+def test_simulating_executor_opens_no_connection(monkeypatch):
+    """Without credentials the executor probes no endpoint and starts no keep-alive thread."""
+    import pytest
+    from src.execution import executor_live_binance
+    from src.execution.executor_live_binance import BinanceLiveExecutor
+
+    monkeypatch.setattr(executor_live_binance, 'BINANCE_TESTNET_API_KEY', '')
+    monkeypatch.setattr(executor_live_binance, 'pick_fastest_base_url', lambda *args: pytest.fail('probed'))
+    executor = BinanceLiveExecutor()
+
+    assert executor._session is None and executor._keepalive is None
+    assert executor.base_url == executor_live_binance.BINANCE_TRADING_URL
+    executor.close()
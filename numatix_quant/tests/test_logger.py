@@ -0,0 +1,52 @@
+import logging
+import time
+from src.utils.logger import StructuredFormatter
+
+
+def test_structured_format_layout():
+    """Records render as [local time.ms] [LEVEL] [module] message, across second changes."""
+    formatter = StructuredFormatter()
+    record = logging.LogRecord('src.live.live_runner', logging.WARNING, __file__, 1, 'fill %s', ('ok',), None)
+
+    for created in (1725148800.25, 1725148800.999, 1725148801.0):
+        record.created = created
+        record.msecs = int((created - int(created)) * 1000)
+        stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(int(created)))
+        expected = f"[{stamp}.{record.msecs:03d}] [WARNING ] [{'live_runner':20}] fill ok"
+        assert formatter.format(record) == expected
+
+
+def test_records_are_handled_off_the_calling_thread():
+    """A sink's handlers run on its listener thread and keep their own levels."""
+    import threading
+    from src.utils import logger as logger_module
+
+    seen = []
+    done = threading.Event()
+
+    class Capture(logging.Handler):
+        def emit(self, record):
+            seen.append((record.getMessage(), threading.current_thread() is not threading.main_thread()))
+            done.set()
+
+    capture = Capture(level=logging.INFO)
+    queue_handler = logger_module._sink_handler('test-sink', lambda: [capture])
+    assert logger_module._sink_handler('test-sink', lambda: []) is queue_handler
+
+    log = logging.getLogger('test_logger.sink')
+    log.setLevel(logging.DEBUG)
+    log.addHandler(queue_handler)
+    log.debug("below the handler's level")
+    log.info("queued %d", 1)
+
+    assert done.wait(2)
+    assert seen == [('queued 1', True)]
+
+
+def test_get_logger_configures_once():
+    """Repeat calls return the same logger with a single queue handler."""
+    from src.utils.logger import get_logger
+
+    first = get_logger('test_logger.cached')
+    assert get_logger('test_logger.cached') is first
+    assert len(first.handlers) == 1
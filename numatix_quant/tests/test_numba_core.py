@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting import Backtest
+from src.execution.executor_backtest import BacktestStrategyWrapper, conf_index_for_entry
+
+
+def _ohlcv(index, seed):
+    rng = np.random.default_rng(seed)
+    close = 50000 + np.cumsum(rng.normal(0, 60, len(index)))
+    return pd.DataFrame(
+        {'Open': close, 'High': close, 'Low': close, 'Close': close, 'Volume': 1.0},
+        index=index
+    )
+
+
+def _run(**params):
+    data_entry = _ohlcv(pd.date_range('2024-09-01', periods=3000, freq='5min'), seed=3)
+    data_conf = _ohlcv(pd.date_range('2024-09-01', periods=1000, freq='15min'), seed=4)
+    conf_idx = data_conf.index.searchsorted(data_entry.index, side='right') - 1
+    BacktestStrategyWrapper.set_conf_data(data_conf, conf_idx)
+    
+    bt = Backtest(data_entry, BacktestStrategyWrapper, cash=1_000_000, commission=0.001,
+                  exclusive_orders=True, trade_on_close=True)
+    try:
+        stats = bt.run(**params)
+        return list(BacktestStrategyWrapper.get_trade_log()), stats['Equity Final [$]']
+    finally:
+        BacktestStrategyWrapper.clear_state()
+
+
+def test_kernel_matches_on_bar():
+    """Kernel replay produces the same trade log and equity as calling on_bar() per bar."""
+    expected = _run()
+    assert len(expected[0]) > 0
+    assert _run(use_kernel=True) == expected
+
+
+def test_precomputed_emas_match_incremental():
+    """Precomputed EMA streams produce the same trade log as incremental updates."""
+    assert _run(precompute_emas=True) == _run()
+
+
+def test_conf_index_for_entry():
+    """Entry bars map to the latest confirmation bar opened at or before their period."""
+    entry = pd.date_range('2024-09-01 00:05', periods=6, freq='5min').as_unit('ns').asi8
+    conf = pd.date_range('2024-09-01 00:15', periods=2, freq='15min').as_unit('ns').asi8
+    
+    conf_idx = conf_index_for_entry(entry, conf, 15 * 60 * 1_000_000_000)
+    
+    assert conf_idx.dtype == np.int32
+    assert conf_idx.tolist() == [-1, -1, 0, 0, 0, 1]
+
+
+def test_stale_aot_build_falls_back_to_jit(monkeypatch):
+    """An extension built from other kernel source is ignored; a matching one is used."""
+    import sys
+    import types
+    import src.core
+    from src.core import numba_core
+    
+    fake = types.ModuleType('src.core.numatix_core')
+    fake.__file__ = 'numatix_core.so'
+    fake.run_backtest = object()
+    monkeypatch.setitem(sys.modules, 'src.core.numatix_core', fake)
+    monkeypatch.setattr(src.core, 'numatix_core', fake, raising=False)
+    assert numba_core._load_kernel() is numba_core._run_backtest  # pre-hash build
+    
+    fake.source_hash = lambda: numba_core.kernel_source_hash() ^ 1
+    assert numba_core._load_kernel() is numba_core._run_backtest
+    
+    fake.source_hash = numba_core.kernel_source_hash
+    assert numba_core._load_kernel() is fake.run_backtest
+
+
+def test_aot_kernel_matches_jit():
+    """The AOT-built kernel (if built) returns the same events as the JIT kernel."""
+    from src.core import numba_core
+    if numba_core._KERNEL is numba_core._run_backtest:
+        pytest.skip("numatix_core not built (python -m src.core.numba_aot)")
+    
+    rng = np.random.default_rng(5)
+    close = 50000 + np.cumsum(rng.normal(0, 60, 3000))
+    conf_close = np.ascontiguousarray(close[::3])
+    conf_idx = np.arange(3000, dtype=np.int64) // 3
+    args = (
+        close, conf_idx, conf_close,
+        2.0 / 9, 2.0 / 22, 2.0 / 51, 2.0 / 201,
+        float(close[:21].mean()), float(close[:21].mean()),
+        float(conf_close[:200].mean()), float(conf_close[:200].mean()),
+        21, 200, 0.001, 0.02, 0.04, 96
+    )
+    
+    for aot, jit in zip(numba_core._KERNEL(*args), numba_core._run_backtest(*args)):
+        np.testing.assert_array_equal(aot, jit)
+
+
+def test_run_batch_matches_single_runs():
+    """run_batch summaries equal per-run run_backtest results, for 1-D and 2-D price inputs."""
+    from src.core import numba_core
+    rng = np.random.default_rng(6)
+    close = 50000 + np.cumsum(rng.normal(0, 60, (2, 4000)), axis=1)
+    conf_close = np.ascontiguousarray(close[:, ::3])
+    conf_idx = np.arange(4000) // 3
+    take_profit = np.array([0.02, 0.04])
+    
+    sweep = numba_core.run_batch(close[0], conf_idx, conf_close[0], 8, 21, 50, 200, 0.001, 0.02, take_profit, 96)
+    series = numba_core.run_batch(close, conf_idx, conf_close, 8, 21, 50, 200, 0.001, 0.02, 0.04, 96)
+    
+    runs = [(close[0], conf_close[0], take_profit[0]), (close[0], conf_close[0], take_profit[1]),
+            (close[0], conf_close[0], 0.04), (close[1], conf_close[1], 0.04)]
+    results = [(sweep, 0), (sweep, 1), (series, 0), (series, 1)]
+    for (c, cc, tp), (batch, k) in zip(runs, results):
+        events = numba_core.run_backtest(c, conf_idx, cc, 8, 21, 50, 200, 0.001, 0.02, tp, 96)
+        exits = events.code >= 3
+        assert batch.n_trades[k] == exits.sum() > 0
+        assert batch.n_wins[k] == (events.pnl[exits] > 0).sum()
+        assert batch.total_pnl[k] == pytest.approx(events.pnl[exits].sum(), rel=1e-12)
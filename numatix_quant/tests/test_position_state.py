@@ -0,0 +1,47 @@
+import pytest
+from datetime import datetime
+from src.core.position_state import PositionState, PositionStatus
+
+@pytest.fixture
+def position():
+    return PositionState()
+
+def test_flat_pnl_is_zero(position):
+    """A flat position has no unrealized PnL."""
+    assert position.is_flat()
+    assert position.unrealized_pnl_pct(100.0) == 0.0
+
+def test_long_pnl(position):
+    """Long PnL is positive when price rises."""
+    position.open_long(100.0, datetime.now(), 0, 1.0)
+    
+    assert position.is_long()
+    assert position.unrealized_pnl_pct(110.0) == pytest.approx(0.10)
+    assert position.unrealized_pnl_pct(95.0) == pytest.approx(-0.05)
+
+def test_short_pnl(position):
+    """Short PnL is positive when price falls."""
+    position.open_short(100.0, datetime.now(), 0, 1.0)
+    
+    assert position.is_short()
+    assert position.unrealized_pnl_pct(90.0) == pytest.approx(0.10)
+    assert position.unrealized_pnl_pct(105.0) == pytest.approx(-0.05)
+
+def test_close_resets_state(position):
+    """Closing returns the position to flat with no PnL."""
+    position.open_short(100.0, datetime.now(), 3, 1.0)
+    position.close()
+    
+    assert position.status == PositionStatus.FLAT
+    assert position.entry_price is None
+    assert position.bars_held(10) == 0
+    assert position.unrealized_pnl_pct(50.0) == 0.0
+
+def test_status_is_direction_sign(position):
+    """Status values double as the PnL direction; to_dict keeps readable names."""
+    assert PositionStatus.LONG == 1
+    assert PositionStatus.SHORT == -1
+    assert PositionStatus.FLAT == 0
+    
+    position.open_long(100.0, datetime.now(), 0, 1.0)
+    assert position.to_dict()['status'] == 'LONG'
@@ -1,12 +1,8 @@
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 from datetime import datetime, timedelta
 from src.core.strategy_multi_tf import StrategyMultiTF
 from src.core.strategy_base import BarData
-from src.core.trade_intent import TradeSide, TradeReason
+from src.core.trade_intent import TradeSide, TradeReason, TradeResult
 
 @pytest.fixture
 def strategy():
@@ -236,3 +232,66 @@ def test_no_exit_on_same_bar(strategy):
     assert intent3 is not None, "Exit should be allowed after 1 bar"
     assert intent3.reason == TradeReason.EXIT_SIGNAL
     assert strategy.position.is_flat(), "Position should be closed"
+
+def test_bar_from_timestamp_ms_is_naive_utc():
+    """from_timestamp_ms matches the naive UTC kline index, independent of local timezone."""
+    import pandas as pd
+    ts_ms = 1_725_148_800_000  # 2024-09-01 00:00 UTC
+    bar = BarData.from_timestamp_ms(ts_ms, 1.0, 2.0, 0.5, 1.5, 10.0)
+    
+    assert bar.timestamp == datetime(2024, 9, 1)
+    assert bar.timestamp == pd.to_datetime(ts_ms, unit='ms').to_pydatetime()
+    assert bar.timestamp.isoformat() == '2024-09-01T00:00:00'
+    assert bar.close == 1.5
+
+
+def test_trade_result_csv_row():
+    """TradeResult is immutable and serialises optional fields as blanks."""
+    result = TradeResult(
+        timestamp=datetime(2024, 9, 1), symbol='BTCUSDT', side='BUY',
+        entry_price=50000.0, exit_price=None, quantity=0.001, reason='ENTRY_LONG'
+    )
+    
+    row = result.to_csv_row()
+    assert row['exit_price'] == ''
+    assert row['duration_bars'] == ''
+    
+    with pytest.raises(AttributeError):
+        result.pnl = 1.0
+
+
+def test_reset_clears_ema_state():
+    """reset() returns the strategy to its freshly constructed EMA/warmup state."""
+    strategy = StrategyMultiTF(symbol="BTCUSDT", quantity=1.0)
+    for i in range(strategy.ema_slow_conf_period + 5):
+        bar = BarData(datetime(2024, 9, 1) + timedelta(minutes=5 * i), 100, 101, 99, 100 + i, 1)
+        strategy.on_bar(bar, bar)
+    assert strategy.is_warmup_complete()
+    
+    strategy.reset()
+    
+    assert strategy.get_ema_state() == StrategyMultiTF(symbol="BTCUSDT", quantity=1.0).get_ema_state()
+    assert not strategy.is_warmup_complete()
+
+
+def test_snapshot_matches_ema_state():
+    """snapshot() carries the same EMAs as get_ema_state() plus the position status."""
+    strategy = StrategyMultiTF(symbol="BTCUSDT", quantity=1.0)
+    for i in range(strategy.ema_slow_conf_period + 5):
+        bar = BarData(datetime(2024, 9, 1) + timedelta(minutes=5 * i), 100, 101, 99, 100 + i, 1)
+        strategy.on_bar(bar, bar)
+    
+    state = strategy.snapshot()
+    ema = strategy.get_ema_state()
+    assert state.position_status is strategy.position.status
+    assert (state.ema_fast_entry, state.ema_slow_entry, state.ema_fast_conf, state.ema_slow_conf) == (
+        ema['ema_fast_entry'], ema['ema_slow_entry'], ema['ema_fast_conf'], ema['ema_slow_conf']
+    )
+
+
+def test_strategy_is_fully_slotted():
+    """StrategyMultiTF declares __slots__ too, so instances carry no __dict__."""
+    strategy = StrategyMultiTF(symbol="BTCUSDT", quantity=1.0)
+    assert not hasattr(strategy, '__dict__')
+    with pytest.raises(AttributeError):
+        strategy.not_a_field = 1
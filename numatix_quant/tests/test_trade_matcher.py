@@ -0,0 +1,150 @@
+from src.matching.trade_matcher import TradeMatcher
+
+
+def _matcher(bt_rows, live_rows):
+    matcher = TradeMatcher()
+    matcher.backtest_trades = [dict(side=side, reason=reason) for side, reason in bt_rows]
+    matcher.live_trades = [dict(side=side, reason=reason) for side, reason in live_rows]
+    return matcher
+
+
+def test_direction_and_reason_mismatches():
+    """Mismatches are counted over the common length and reported in trade order."""
+    bt = [('BUY', 'ENTRY_LONG'), ('SELL', 'EXIT_SIGNAL'), ('SELL', 'ENTRY_SHORT'), ('BUY', 'EXIT_TIMEOUT')]
+    live = [('BUY', 'ENTRY_LONG'), ('BUY', 'EXIT_SIGNAL'), ('SELL', 'ENTRY_SHORT')]
+    matcher = _matcher(bt, live)
+
+    direction = matcher.compare_direction_sequence()
+    assert direction['compared_trades'] == 3
+    assert direction['matching_directions'] == 2
+    assert direction['mismatched_directions'] == 1
+    assert direction['mismatches'] == [{'index': 1, 'backtest': 'SELL', 'live': 'BUY'}]
+
+    reasons = matcher.compare_trade_reasons()
+    assert reasons['matching_reasons'] == 3 and reasons['match_rate'] == 100
+
+
+def test_mismatch_examples_are_capped():
+    """Only the first ten mismatch examples are kept, but all are counted."""
+    matcher = _matcher([('BUY', 'A')] * 25, [('SELL', 'A')] * 25)
+    result = matcher.compare_direction_sequence()
+    assert result['mismatched_directions'] == 25
+    assert [m['index'] for m in result['mismatches']] == list(range(10))
+    assert _matcher([], []).compare_direction_sequence()['compared_trades'] == 0
+
+
+def test_batched_comparison_matches_in_memory():
+    """Unevenly batched inputs give the same result as comparing the loaded lists."""
+    bt = [('BUY' if i % 3 else 'SELL', 'ENTRY_LONG') for i in range(40)]
+    live = [('BUY', 'ENTRY_LONG') for _ in range(37)]
+    matcher = _matcher(bt, live)
+
+    def batches(trades, size):
+        return (trades[i:i + size] for i in range(0, len(trades), size))
+
+    batched = matcher.compare_direction_sequence(
+        batches(matcher.backtest_trades, 7), batches(matcher.live_trades, 5)
+    )
+    assert batched == matcher.compare_direction_sequence()
+    assert batched['compared_trades'] == 37
+
+
+def test_timing_ranges_from_iso_timestamps():
+    """Ranges cover every non-empty timestamp, with or without fractional seconds."""
+    matcher = TradeMatcher()
+    matcher.backtest_trades = [{'timestamp': '2024-09-01T00:05:00'}, {'timestamp': ''}, {'timestamp': '2024-09-01T00:00:00'}]
+    matcher.live_trades = [{'timestamp': '2024-09-02T10:00:00.250000'}, {'timestamp': '2024-09-02T09:00:00'}]
+
+    result = matcher.analyze_timing_drift()
+    assert result['backtest_range'] == '2024-09-01 00:00:00 to 2024-09-01 00:05:00'
+    assert result['live_range'] == '2024-09-02 09:00:00 to 2024-09-02 10:00:00.250000'
+
+    matcher.live_trades = [{'timestamp': ''}]
+    assert matcher.analyze_timing_drift()['status'] == 'no_timestamps'
+    matcher.live_trades = [{'timestamp': 'not a time'}]
+    assert matcher.analyze_timing_drift()['status'] == 'error'
+
+
+def test_run_comparison_skips_details_on_severe_count_mismatch(tmp_path):
+    """Far-apart counts skip the per-trade passes; close counts still run them."""
+    from src.utils.csv_writer import CSVWriter
+
+    def trade(i):
+        return {'timestamp': f'2024-09-01T00:{i:02d}:00', 'side': 'BUY', 'reason': 'ENTRY_LONG'}
+
+    CSVWriter(tmp_path / 'bt.csv').write_trades([trade(i) for i in range(10)])
+    CSVWriter(tmp_path / 'live.csv').write_trades([trade(i) for i in range(3)])
+    matcher = TradeMatcher(str(tmp_path / 'bt.csv'), str(tmp_path / 'live.csv'))
+
+    summary = matcher.run_comparison()
+    assert summary['overall_match'] is False
+    assert summary['direction_sequence'] == summary['timing'] == {'status': 'skipped'}
+
+    CSVWriter(tmp_path / 'live.csv').write_trades([trade(i) for i in range(3, 9)])
+    summary = matcher.run_comparison()
+    assert summary['direction_sequence']['compared_trades'] == 9
+    assert summary['timing']['status'] == 'analyzed'
+
+
+def test_timing_ranges_keep_utc_offsets():
+    """Offset timestamps are parsed by pandas and keep their timezone."""
+    matcher = TradeMatcher()
+    matcher.backtest_trades = [{'timestamp': '2024-09-01T02:00:00+02:00'}, {'timestamp': '2024-09-01T03:00:00+02:00'}]
+    matcher.live_trades = [{'timestamp': '2024-09-01T00:00:00'}]
+
+    result = matcher.analyze_timing_drift()
+    assert result['backtest_range'] == '2024-09-01 02:00:00+02:00 to 2024-09-01 03:00:00+02:00'
+    assert result['live_range'] == '2024-09-01 00:00:00 to 2024-09-01 00:00:00'
+
+
+def test_trades_are_held_column_wise():
+    """Dict rows assigned to the matcher are stored as string arrays and read back unchanged."""
+    import pytest
+
+    rows = [{'side': 'BUY', 'reason': 'ENTRY_LONG'}, {'side': 'SELL'}]
+    matcher = TradeMatcher()
+    matcher.live_trades = rows
+
+    assert matcher.live_columns['side'].tolist() == ['BUY', 'SELL']
+    assert list(matcher.live_trades) == [{'side': 'BUY', 'reason': 'ENTRY_LONG'}, {'side': 'SELL', 'reason': ''}]
+    assert matcher.compare_trade_count()['live_count'] == 2
+
+    # Snapshots are read-only, so an edit can't silently miss the columns
+    with pytest.raises(TypeError):
+        matcher.live_trades[0]['side'] = 'SELL'
+
+    # One snapshot per assignment of the columns
+    assert matcher.live_trades is matcher.live_trades
+    matcher.live_trades = rows[:1]
+    assert len(matcher.live_trades) == 1
+
+
+def test_fused_comparison_matches_separate_passes():
+    """_compare_all gives the same three results as the individual compare_* calls."""
+    bt = [('BUY', 'ENTRY_LONG'), ('SELL', 'EXIT_SIGNAL'), ('SELL', 'ENTRY_SHORT'), ('BUY', 'EXIT_TIMEOUT')]
+    live = [('BUY', 'ENTRY_LONG'), ('BUY', 'EXIT_SIGNAL'), ('SELL', 'EXIT_SIGNAL')]
+    matcher = _matcher(bt, live)
+
+    separate = (matcher.compare_trade_count(), matcher.compare_direction_sequence(), matcher.compare_trade_reasons())
+    assert matcher._compare_all() == separate
+    assert separate[2]['mismatches'] == [{'index': 2, 'backtest': 'ENTRY_SHORT', 'live': 'EXIT_SIGNAL'}]
+
+
+def test_categorical_columns_compare_across_category_sets(tmp_path):
+    """Side/reason load as Categoricals; differing category sets still compare value by value."""
+    import pandas as pd
+    from src.utils.csv_writer import CSVWriter
+
+    CSVWriter(tmp_path / 'bt.csv').write_trades([{'side': s, 'reason': 'R'} for s in ('SELL', 'BUY', 'SELL')])
+    CSVWriter(tmp_path / 'live.csv').write_trades([{'side': s, 'reason': 'R'} for s in ('BUY', 'BUY', 'HOLD')])
+    matcher = TradeMatcher(str(tmp_path / 'bt.csv'), str(tmp_path / 'live.csv'))
+    matcher.load_trades()
+
+    assert isinstance(matcher.live_columns['side'], pd.Categorical)
+    result = matcher.compare_direction_sequence()
+    assert result['matching_directions'] == 1
+    assert result['mismatches'] == [
+        {'index': 0, 'backtest': 'SELL', 'live': 'BUY'},
+        {'index': 2, 'backtest': 'SELL', 'live': 'HOLD'},
+    ]
+    assert matcher._compare_all()[1] == result
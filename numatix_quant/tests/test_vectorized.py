@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.backtesting.vectorized import vectorized_backtest, DEFAULT_PARAMS
+from src.core.strategy_multi_tf import StrategyMultiTF
+from src.core.strategy_base import BarData
+
+
+def _ohlcv(index, seed):
+    rng = np.random.default_rng(seed)
+    close = 50000 + np.cumsum(rng.normal(0, 60, len(index)))
+    return pd.DataFrame(
+        {'Open': close, 'High': close, 'Low': close, 'Close': close, 'Volume': 1.0},
+        index=index
+    )
+
+
+def test_vectorized_matches_strategy():
+    """Vectorized run closes the same trades as StrategyMultiTF driven bar by bar."""
+    df_entry = _ohlcv(pd.date_range('2024-09-01', periods=3000, freq='5min'), seed=1)
+    df_conf = _ohlcv(pd.date_range('2024-09-01', periods=1000, freq='15min'), seed=2)
+    
+    trades, equity = vectorized_backtest(df_entry, df_conf)
+    
+    strategy = StrategyMultiTF(symbol="BTCUSDT", quantity=DEFAULT_PARAMS['quantity'])
+    conf = df_conf.reindex(df_entry.index, method='ffill')
+    expected = []
+    for ts, row, conf_row in zip(df_entry.index, df_entry.itertuples(), conf.itertuples()):
+        bar_entry = BarData(ts.to_pydatetime(), row.Open, row.High, row.Low, row.Close, row.Volume)
+        bar_conf = BarData(ts, conf_row.Open, conf_row.High, conf_row.Low, conf_row.Close, conf_row.Volume)
+        intent = strategy.on_bar(bar_entry, bar_conf)
+        if intent is not None and intent.pnl is not None:
+            expected.append((intent.timestamp, intent.reason.value, intent.pnl, intent.duration_bars))
+    
+    actual = [
+        (t.exit_time.to_pydatetime(), t.reason, t.pnl, t.duration_bars)
+        for t in trades.itertuples()
+    ]
+    assert len(expected) > 0
+    assert actual == expected
+    assert equity.iloc[-1] == pytest.approx(DEFAULT_PARAMS['initial_cash'] + trades['pnl'].sum())
+